@@ -1,67 +1,300 @@
-from typing import Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, TypeVar
 
-from fastapi import Depends
+from fastapi import Depends, Query, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import jwt
 
-from app.core.database import SessionLocal
+from app.core.coalesce import single_flight
+from app.core.database import SessionLocal, replica_pool, shard_router
 from app.core.errors import AppException, ErrorCode
-from app.core.security import decode_token
+from app.core.middleware import READ_METHODS, primary_pinned
+from app.core.revocation import revocation_index
+from app.core.security import decode_token, decode_token_cached, stream_tickets
 from app.crud import member as member_crud
 from app.crud import org as org_crud
 from app.crud import project as project_crud
+from app.crud import refresh_token as refresh_token_crud
 from app.crud import user as user_crud
 from app.models.enums import OrgRole
+from app.models.integration import Integration
+from app.models.policy import Policy
+from app.models.project import Project
+from app.models.service import Service
+
+T = TypeVar("T")
 
 security = HTTPBearer(auto_error=False, scheme_name="BearerAuth")
 
+MAX_MULTI_GET_IDS = 100
+
 ROLE_PRIORITY = {
     OrgRole.member: 1,
     OrgRole.admin: 2,
     OrgRole.owner: 3,
 }
 
+SHARD_PATH_PARAMS = (
+    ("project_id", Project),
+    ("service_id", Service),
+    ("policy_id", Policy),
+    ("integration_id", Integration),
+)
+
+
+@dataclass
+class BatchContext:
+    # Shared by the sub-requests of one POST /api/batch: the caller authenticated once, the memberships checked so far
+    # (detached, so parallel reads can use them), the org of each project seen and, for sub-requests run one at a
+    # time, the batch's session.
+    user: Any
+    db: Session | None = None
+    members: dict[str, Any] = field(default_factory=dict)
+    projects: dict[str, str] = field(default_factory=dict)
+
+
+def batch_context(request: Request) -> BatchContext | None:
+    return getattr(request.state, "batch", None)
+
+
+def _shard_for(path_params: dict) -> int:
+    if "org_id" in path_params:
+        return shard_router.shard_for_org(path_params["org_id"])
+    for param, model in SHARD_PATH_PARAMS:
+        if param in path_params:
+            return shard_router.locate(model, path_params[param]) or 0
+    return 0
 
-def get_db():
+
+def open_session(request: Request) -> Session:
     db = SessionLocal()
+    if shard_router.enabled:
+        # Org-scoped tables follow the shard of the org in the path; users and tokens stay on the primary.
+        db.info["shard"] = _shard_for(request.path_params)
+    # Batches read from the primary, like their shared session, so reads see the batch's own writes.
+    in_batch = batch_context(request) is not None
+    if request.method in READ_METHODS and replica_pool.enabled and not primary_pinned(request) and not in_batch:
+        replica = replica_pool.choose()
+        if replica is not None:
+            db.info["replica"] = replica
+    return db
+
+
+def get_db(request: Request):
+    batch = batch_context(request)
+    if batch is not None and batch.db is not None:
+        if shard_router.enabled:
+            batch.db.info["shard"] = _shard_for(request.path_params)
+        yield batch.db
+        return
+    db = open_session(request)
     try:
         yield db
     finally:
         db.close()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    db: Session = Depends(get_db),
-):
-    if credentials is None or not credentials.credentials:
+async def coalesced_read(request: Request, route: str, key: Hashable, func: Callable[[Session], T]) -> T:
+    # Identical concurrent reads share one session and one computation; the key must cover everything that shapes
+    # the result, including whose data it is. Callers inside their read-your-writes window skip it, since a flight
+    # that started before their write committed would hide it.
+    def _run() -> T:
+        with open_session(request) as db:
+            return func(db)
+
+    if primary_pinned(request):
+        return await run_in_threadpool(_run)
+    return await single_flight.do(route, key, _run)
+
+
+def get_ids(
+    ids: str = Query(..., description=f"Comma-separated ids, at most {MAX_MULTI_GET_IDS}.", examples=["id-1,id-2"]),
+) -> list[str]:
+    parsed = list(dict.fromkeys(item.strip() for item in ids.split(",") if item.strip()))
+    if not parsed:
+        raise AppException(400, ErrorCode.BAD_REQUEST, "ids must not be empty")
+    if len(parsed) > MAX_MULTI_GET_IDS:
+        raise AppException(400, ErrorCode.BAD_REQUEST, f"At most {MAX_MULTI_GET_IDS} ids per request")
+    return parsed
+
+
+def sparse_fields(model: type[BaseModel]) -> Callable:
+    allowed = tuple(model.model_fields)
+
+    def _parser(
+        fields: str | None = Query(
+            None,
+            description=f"Comma-separated subset of fields to return ({', '.join(allowed)}); `id` is always included.",
+            examples=["id,name"],
+        ),
+    ) -> tuple[str, ...] | None:
+        if not fields:
+            return None
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise AppException(
+                400, ErrorCode.BAD_REQUEST, "Unknown fields", detail={"unknown": sorted(unknown), "allowed": allowed}
+            )
+        requested.add("id")
+        # Declaration order keeps the tuple stable, so every spelling of a field set shares one cached model.
+        return tuple(field for field in allowed if field in requested)
+
+    return _parser
+
+
+def includes(*allowed: str) -> Callable:
+    def _parser(
+        include: str | None = Query(
+            None,
+            description=f"Comma-separated relations to embed ({', '.join(allowed)}).",
+            examples=[",".join(allowed)],
+        ),
+    ) -> frozenset[str]:
+        if not include:
+            return frozenset()
+        requested = {name.strip() for name in include.split(",") if name.strip()}
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise AppException(
+                400, ErrorCode.BAD_REQUEST, "Unknown include", detail={"unknown": sorted(unknown), "allowed": allowed}
+            )
+        # A nested include implies its parent: projects.services embeds projects too.
+        requested.update(name.rpartition(".")[0] for name in list(requested) if "." in name)
+        return frozenset(requested)
+
+    return _parser
+
+
+def _access_claims(token: str | None) -> dict:
+    if not token:
         raise AppException(401, ErrorCode.AUTH_REQUIRED, "Authentication required")
-    token = credentials.credentials
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
     except jwt.PyJWTError as exc:
         raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid token") from exc
-    if payload.get("type") != "access":
+    if payload.get("type") != "access" or not payload.get("fid"):
         raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid access token")
+    _check_revoked(payload["fid"])
+    return payload
+
+
+def _check_revoked(family_id: str) -> None:
+    revoked = revocation_index.is_revoked(family_id)
+    if revoked is None:
+        # The index overflowed and may have forgotten this family.
+        with SessionLocal() as db:
+            revoked = refresh_token_crud.is_family_revoked(db, family_id)
+    if revoked:
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Session revoked")
+
+
+def _authenticate(db: Session, token: str | None):
+    return _load_user(db, _access_claims(token))
+
+
+def _load_user(db: Session, payload: dict):
     user = user_crud.get_by_id(db, payload.get("sub"))
     if not user:
         raise AppException(401, ErrorCode.AUTH_INVALID, "User not found")
+    db.info["actor_id"] = user.id
     return user
 
 
-def require_org_role(min_role: OrgRole) -> Callable:
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: Session = Depends(get_db),
+):
+    batch = batch_context(request)
+    if batch is not None:
+        db.info["actor_id"] = batch.user.id
+        return batch.user
+    return _authenticate(db, credentials.credentials if credentials else None)
+
+
+async def get_access_claims(credentials: HTTPAuthorizationCredentials | None = Depends(security)) -> dict:
+    # Verifies the token without loading the user row, for endpoints served from memory; runs on the event loop
+    # unless an overflowed revocation index needs a database lookup.
+    token = credentials.credentials if credentials else None
+    if revocation_index.incomplete():
+        return await run_in_threadpool(_access_claims, token)
+    return _access_claims(token)
+
+
+async def get_current_user_id(claims: dict = Depends(get_access_claims)) -> str:
+    return claims["sub"]
+
+
+def get_stream_user(
+    org_id: str,
+    ticket: str | None = Query(None, description="Single-use stream ticket, for clients that cannot send headers."),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: Session = Depends(get_db),
+):
+    # EventSource cannot send headers, so it passes a short-lived ticket for this org instead of the access token,
+    # which would otherwise end up in access logs.
+    if credentials or not ticket:
+        return _authenticate(db, credentials.credentials if credentials else None)
+    try:
+        payload = decode_token(ticket)
+    except jwt.PyJWTError as exc:
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid stream ticket") from exc
+    if payload.get("type") != "stream" or payload.get("org") != org_id or not payload.get("jti"):
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid stream ticket")
+    _check_revoked(payload["fid"])
+    if not stream_tickets.redeem(payload["jti"], payload["exp"]):
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Stream ticket already used")
+    return _load_user(db, payload)
+
+
+def _member_for(request: Request, db: Session, org_id: str, user):
+    batch = batch_context(request)
+    member = batch.members.get(org_id) if batch is not None else None
+    if member is None:
+        member = member_crud.get_member_by_user(db, org_id, user.id)
+        if member is not None and batch is not None:
+            db.expunge(member)
+            batch.members[org_id] = member
+    return member
+
+
+def project_member(request: Request, db: Session, project_id: str, user):
+    # The caller's membership in the project's org; inside a batch both lookups are shared between sub-requests.
+    batch = batch_context(request)
+    org_id = batch.projects.get(project_id) if batch is not None else None
+    if org_id is None:
+        project = project_crud.get_project(db, project_id)
+        if not project:
+            raise AppException(404, ErrorCode.NOT_FOUND, "Project not found")
+        org_id = project.org_id
+        if batch is not None:
+            batch.projects[project_id] = org_id
+    member = _member_for(request, db, org_id, user)
+    if not member:
+        raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+    return member
+
+
+def require_org_role(min_role: OrgRole, user_dependency: Callable = get_current_user) -> Callable:
     def _checker(
         org_id: str,
+        request: Request,
         db: Session = Depends(get_db),
-        user=Depends(get_current_user),
+        user=Depends(user_dependency),
     ):
-        org = org_crud.get_org(db, org_id)
-        if not org:
-            raise AppException(404, ErrorCode.NOT_FOUND, "Organization not found")
-        member = member_crud.get_member_by_user(db, org_id, user.id)
-        if not member:
-            raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+        batch = batch_context(request)
+        member = batch.members.get(org_id) if batch is not None else None
+        if member is None:
+            org = org_crud.get_org(db, org_id)
+            if not org:
+                raise AppException(404, ErrorCode.NOT_FOUND, "Organization not found")
+            member = _member_for(request, db, org_id, user)
+            if not member:
+                raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
         if ROLE_PRIORITY[member.role] < ROLE_PRIORITY[min_role]:
             raise AppException(403, ErrorCode.FORBIDDEN, "Insufficient role")
         return member
@@ -72,15 +305,11 @@ def require_org_role(min_role: OrgRole) -> Callable:
 def require_project_access(min_role: OrgRole) -> Callable:
     def _checker(
         project_id: str,
+        request: Request,
         db: Session = Depends(get_db),
         user=Depends(get_current_user),
     ):
-        project = project_crud.get_project(db, project_id)
-        if not project:
-            raise AppException(404, ErrorCode.NOT_FOUND, "Project not found")
-        member = member_crud.get_member_by_user(db, project.org_id, user.id)
-        if not member:
-            raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+        member = project_member(request, db, project_id, user)
         if ROLE_PRIORITY[member.role] < ROLE_PRIORITY[min_role]:
             raise AppException(403, ErrorCode.FORBIDDEN, "Insufficient role")
         return member
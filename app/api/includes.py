@@ -0,0 +1,49 @@
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.crud.utils import load_children
+from app.models.integration import Integration
+from app.models.policy import Policy
+from app.models.project import Project
+from app.models.service import Service
+from app.schemas.integration import IntegrationOut
+from app.schemas.policy import PolicyOut
+from app.schemas.project import ProjectOut
+from app.schemas.service import ServiceOut
+
+
+def project_details(db: Session, projects: list[Project], limit: int) -> tuple[list[dict[str, Any]], bool]:
+    services, truncated = load_children(db, Service, Service.project_id, [project.id for project in projects], limit)
+    details = []
+    for project in projects:
+        data = ProjectOut.model_validate(project).model_dump()
+        data["services"] = [ServiceOut.model_validate(service) for service in services[project.id]]
+        if project.id in truncated:
+            data["truncated"] = ["services"]
+        details.append(data)
+    return details, bool(truncated)
+
+
+def org_includes(db: Session, org_id: str, include: frozenset[str], limit: int) -> dict[str, Any]:
+    # Serialized from plain column attributes only, so no relationship is ever lazy-loaded per row.
+    data: dict[str, Any] = {}
+    truncated = []
+    for name, model, schema in (("policies", Policy, PolicyOut), ("integrations", Integration, IntegrationOut)):
+        if name in include:
+            rows, cut = load_children(db, model, model.org_id, [org_id], limit)
+            data[name] = [schema.model_validate(row) for row in rows[org_id]]
+            if cut:
+                truncated.append(name)
+    if "projects" in include:
+        projects, cut = load_children(db, Project, Project.org_id, [org_id], limit)
+        if cut:
+            truncated.append("projects")
+        if "projects.services" in include:
+            data["projects"], cut = project_details(db, projects[org_id], limit)
+            if cut:
+                truncated.append("projects.services")
+        else:
+            data["projects"] = [ProjectOut.model_validate(project).model_dump() for project in projects[org_id]]
+    data["truncated"] = truncated
+    return data
@@ -1,12 +1,62 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, create_model
 
-from app.schemas.common import Paging
+from app.core.errors import ErrorCode
+from app.models.enums import OrgRole
+from app.schemas.common import CursorPaging, Paging, SuccessResponse
 
 
-def success_response(request: Request, data: Any, paging: Paging | None = None) -> dict:
-    meta = {"request_id": getattr(request.state, "request_id", "")}
+def success_response(request: Request, data: Any, paging: Paging | CursorPaging | None = None) -> dict:
+    # paging is always set, so routes serialized with response_model_exclude_unset still emit "paging": null.
+    meta = {"request_id": getattr(request.state, "request_id", ""), "paging": None}
     if paging is not None:
         meta["paging"] = paging.model_dump()
     return {"ok": True, "data": data, "meta": meta}
+
+
+def multi_get_response(
+    request: Request,
+    ids: list[str],
+    found: dict[str, tuple[Any, OrgRole | None]],
+    serialize: Callable[[Any], Any],
+    label: str,
+) -> dict:
+    # Ids come back in request order, each with its own ok/error, so one bad id never fails the batch.
+    items = []
+    for item_id in ids:
+        entry = found.get(item_id)
+        if entry is None:
+            error = {"code": ErrorCode.NOT_FOUND.value, "message": f"{label} not found", "detail": None}
+        elif entry[1] is None:
+            error = {"code": ErrorCode.FORBIDDEN.value, "message": "Not a member of this organization", "detail": None}
+        else:
+            items.append({"id": item_id, "ok": True, "data": serialize(entry[0]), "error": None})
+            continue
+        items.append({"id": item_id, "ok": False, "data": None, "error": error})
+    return success_response(request, items)
+
+
+@lru_cache(maxsize=256)
+def sparse_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields},
+    )
+
+
+def sparse_response(
+    request: Request,
+    rows: list[Any],
+    model: type[BaseModel],
+    fields: tuple[str, ...],
+    paging: Paging | None = None,
+) -> Response:
+    # The route's response_model describes full objects, so the slimmed envelope is serialized here instead.
+    envelope = SuccessResponse[list[sparse_model(model, fields)]]
+    payload = envelope.model_validate(success_response(request, [row._asdict() for row in rows], paging))
+    return Response(payload.model_dump_json(), media_type="application/json")
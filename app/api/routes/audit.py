@@ -0,0 +1,57 @@
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_org_role
+from app.api.response import success_response
+from app.core.errors import AppException, ErrorCode
+from app.crud import audit as audit_crud
+from app.models.enums import OrgRole
+from app.schemas.audit import AuditEntryOut
+from app.schemas.common import CursorPaging, ErrorResponse, SuccessResponse
+
+router = APIRouter(prefix="/api", tags=["Audit"])
+
+
+def _encode_cursor(created_at: datetime, entry_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{entry_id}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, entry_id = raw.partition("|")
+        return datetime.fromisoformat(created_at), entry_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise AppException(400, ErrorCode.BAD_REQUEST, "Invalid cursor") from exc
+
+
+@router.get(
+    "/orgs/{org_id}/audit",
+    summary="List audit log",
+    description=(
+        "Changes made in an organization, newest first (admin or owner). Pass meta.paging.next_cursor as `cursor` "
+        "to fetch the next page. Entries are written in batches and can lag writes by up to AUDIT_FLUSH_MS."
+    ),
+    response_model=SuccessResponse[list[AuditEntryOut]],
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
+)
+def list_audit(
+    org_id: str,
+    request: Request,
+    cursor: str | None = Query(None),
+    page_size: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    _member=Depends(require_org_role(OrgRole.admin)),
+):
+    before = _decode_cursor(cursor) if cursor else None
+    # One extra row tells whether another page exists without a COUNT over the org's history.
+    entries = audit_crud.list_entries(db, org_id, page_size + 1, before)
+    has_next = len(entries) > page_size
+    entries = entries[:page_size]
+    next_cursor = _encode_cursor(entries[-1].created_at, entries[-1].id) if has_next else None
+    paging = CursorPaging(page_size=page_size, has_next=has_next, next_cursor=next_cursor)
+    return success_response(request, [AuditEntryOut.model_validate(entry) for entry in entries], paging)
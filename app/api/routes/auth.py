@@ -5,14 +5,39 @@ import jwt
 from app.api.deps import get_current_user, get_db
 from app.api.response import success_response
 from app.core.errors import AppException, ErrorCode
+from app.core.revocation import revocation_index
 from app.core.security import create_access_token, create_refresh_token, decode_token, verify_password
+from app.crud import refresh_token as refresh_token_crud
 from app.crud import user as user_crud
+from app.models.refresh_token import RefreshToken
 from app.schemas.auth import LoginRequest, RefreshRequest, RegisterRequest, TokenPair, UserOut
 from app.schemas.common import ErrorResponse, SuccessResponse
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 
 
+def _token_pair(token: RefreshToken) -> TokenPair:
+    return TokenPair(
+        access_token=create_access_token(token.user_id, token.family_id),
+        refresh_token=create_refresh_token(token.user_id, token.family_id, token.jti),
+    )
+
+
+def _decode_refresh_token(refresh_token: str) -> dict:
+    try:
+        decoded = decode_token(refresh_token)
+    except jwt.PyJWTError as exc:
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid token") from exc
+    if decoded.get("type") != "refresh" or not decoded.get("jti"):
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid refresh token")
+    return decoded
+
+
+def _revoke_family(db: Session, family_id: str) -> None:
+    revoked_at = refresh_token_crud.revoke_family(db, family_id)
+    revocation_index.revoke((family_id,), revoked_at)
+
+
 @router.post(
     "/register",
     summary="Register a new user",
@@ -39,26 +64,60 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
     user = user_crud.get_by_email(db, payload.email)
     if not user or not verify_password(payload.password, user.password_hash):
         raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid credentials")
-    tokens = TokenPair(access_token=create_access_token(user.id), refresh_token=create_refresh_token(user.id))
-    return success_response(request, tokens)
+    return success_response(request, _token_pair(refresh_token_crud.create_family(db, user.id)))
 
 
 @router.post(
     "/refresh",
     summary="Refresh access token",
-    description="Use a refresh token to issue a new access token.",
+    description=(
+        "Exchange a refresh token for a new token pair. Refresh tokens are single use: presenting one that "
+        "was already rotated revokes the whole session."
+    ),
     response_model=SuccessResponse[TokenPair],
     responses={401: {"model": ErrorResponse}},
 )
-def refresh(payload: RefreshRequest, request: Request):
-    try:
-        decoded = decode_token(payload.refresh_token)
-    except jwt.PyJWTError as exc:
-        raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid token") from exc
-    if decoded.get("type") != "refresh":
+def refresh(payload: RefreshRequest, request: Request, db: Session = Depends(get_db)):
+    decoded = _decode_refresh_token(payload.refresh_token)
+    token = refresh_token_crud.get_token(db, decoded["jti"])
+    if not token or token.user_id != decoded.get("sub"):
         raise AppException(401, ErrorCode.AUTH_INVALID, "Invalid refresh token")
-    tokens = TokenPair(access_token=create_access_token(decoded["sub"]), refresh_token=payload.refresh_token)
-    return success_response(request, tokens)
+    if token.revoked_at is not None:
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Session revoked")
+    successor = refresh_token_crud.rotate(db, token) if token.replaced_by is None else None
+    if successor is None:
+        # A rotated token coming back means it leaked; end the session for both holders.
+        _revoke_family(db, token.family_id)
+        raise AppException(401, ErrorCode.AUTH_INVALID, "Refresh token reuse detected")
+    return success_response(request, _token_pair(successor))
+
+
+@router.post(
+    "/logout",
+    summary="Logout",
+    description="Revoke the session of the given refresh token, including its outstanding access tokens.",
+    response_model=SuccessResponse[dict],
+    responses={401: {"model": ErrorResponse}},
+)
+def logout(payload: RefreshRequest, request: Request, db: Session = Depends(get_db)):
+    decoded = _decode_refresh_token(payload.refresh_token)
+    token = refresh_token_crud.get_token(db, decoded["jti"])
+    if token and token.user_id == decoded.get("sub"):
+        _revoke_family(db, token.family_id)
+    return success_response(request, {"revoked": True})
+
+
+@router.post(
+    "/logout-all",
+    summary="Logout everywhere",
+    description="Revoke every session of the current user.",
+    response_model=SuccessResponse[dict],
+    responses={401: {"model": ErrorResponse}},
+)
+def logout_all(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    family_ids, revoked_at = refresh_token_crud.revoke_user(db, user.id)
+    revocation_index.revoke(family_ids, revoked_at)
+    return success_response(request, {"revoked": len(family_ids)})
 
 
 @router.get(
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import logging
+import re
+from urllib.parse import unquote
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import BatchContext, batch_context, get_current_user, get_db
+from app.api.response import success_response
+from app.core.config import settings
+from app.core.errors import AppException, ErrorCode
+from app.core.ratelimit import ORG_PATH
+from app.crud import member as member_crud
+from app.crud import project as project_crud
+from app.schemas.batch import BatchItem, BatchRequest, BatchResult
+from app.schemas.common import ErrorResponse, SuccessResponse
+
+logger = logging.getLogger("polaris.lab.batch")
+
+router = APIRouter(prefix="/api", tags=["Batch"])
+
+SCOPE_KEYS = ("type", "asgi", "http_version", "scheme", "server", "client", "root_path")
+PROJECT_PATH = re.compile(r"^/api/projects/([^/]+)")
+
+
+def _check(index: int, item: BatchItem) -> str:
+    # Checks the decoded path that is actually routed. Event streams never finish, and nested batches would multiply
+    # the limits; encoded slashes and dot segments could route somewhere other than what was checked.
+    raw = item.path.partition("?")[0]
+    path = unquote(raw)
+    segments = path.split("/")[1:]
+    if (
+        not path.startswith("/api/")
+        or "%2f" in raw.lower()
+        or any(segment in ("", ".", "..") for segment in segments[:-1])
+        or segments[-1] in (".", "..")
+        or path.rstrip("/") == "/api/batch"
+        or path.rstrip("/").endswith("/events")
+    ):
+        raise AppException(400, ErrorCode.BAD_REQUEST, "Unsupported batch path", detail={"index": index, "path": raw})
+    return path
+
+
+def _result(status: int, body: bytes) -> BatchResult:
+    if not body:
+        return BatchResult(status=status)
+    try:
+        return BatchResult(status=status, body=json.loads(body))
+    except ValueError:
+        return BatchResult(status=status, body=body.decode("utf-8", "replace"))
+
+
+async def _dispatch(request: Request, index: int, item: BatchItem, path: str, batch: BatchContext) -> BatchResult:
+    # Sub-requests go through the whole app, middleware included, as if the caller had sent them one by one.
+    raw_path, _, query = item.path.partition("?")
+    request_id = getattr(request.state, "request_id", "")
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"x-request-id", f"{request_id}.{index}".encode()),
+        *((name, value) for name, value in request.scope["headers"] if name == b"authorization"),
+    ]
+    scope = {key: request.scope[key] for key in SCOPE_KEYS if key in request.scope}
+    scope.update(
+        method=item.method,
+        path=path,
+        raw_path=raw_path.encode(),
+        query_string=query.encode(),
+        headers=headers,
+        state={"batch": batch},
+    )
+    body = b"" if item.body is None else json.dumps(item.body).encode()
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 500
+    chunks: list[bytes] = []
+
+    async def receive() -> dict:
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            chunks.clear()
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The server error middleware has already sent its 500 envelope before re-raising.
+        logger.exception("Batch request %s %s failed", item.method, path)
+    return _result(status, b"".join(chunks))
+
+
+@router.post(
+    "/batch",
+    summary="Run several API calls",
+    description=(
+        f"Run up to BATCH_MAX_REQUESTS (default {settings.batch_max_requests}) calls under /api/ in one round-trip "
+        "and return each call's status and response envelope, in order. The caller is authenticated once, "
+        "calls share one database session and membership checks, and every call is rate limited as usual. "
+        "Calls run in order; with `parallel`, consecutive GET calls run concurrently. A failed call does not stop "
+        "the others."
+    ),
+    response_model=SuccessResponse[list[BatchResult]],
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}},
+)
+async def run_batch(
+    payload: BatchRequest, request: Request, db: Session = Depends(get_db), user=Depends(get_current_user)
+):
+    if batch_context(request) is not None:
+        raise AppException(400, ErrorCode.BAD_REQUEST, "Batches cannot be nested")
+    items = payload.requests
+    if len(items) > settings.batch_max_requests:
+        raise AppException(400, ErrorCode.BAD_REQUEST, f"At most {settings.batch_max_requests} requests per batch")
+    paths = [_check(index, item) for index, item in enumerate(items)]
+    # The orgs of the projects in the batch, then memberships for every org, are resolved up front in one query each.
+    # They and the user are detached, so sub-requests on other sessions (parallel reads) can use them too.
+    project_ids = {match.group(1) for match in map(PROJECT_PATH.match, paths) if match}
+    projects = project_crud.get_project_orgs(db, sorted(project_ids)) if project_ids else {}
+    org_ids = {match.group(1) for match in map(ORG_PATH.match, paths) if match} | set(projects.values())
+    members = member_crud.get_members_for_user(db, user.id, sorted(org_ids)) if org_ids else {}
+    for obj in (user, *members.values()):
+        if obj in db:
+            db.expunge(obj)
+    batch = BatchContext(user=user, db=db, members=members, projects=projects)
+    limit = asyncio.Semaphore(settings.batch_max_parallel)
+
+    async def _read(index: int) -> BatchResult:
+        async with limit:
+            # Concurrent reads cannot share a session, only the caller, the memberships and the project orgs.
+            shared = BatchContext(user=user, members=batch.members, projects=batch.projects)
+            return await _dispatch(request, index, items[index], paths[index], shared)
+
+    results: list[BatchResult] = []
+    while len(results) < len(items):
+        start = len(results)
+        end = start
+        while payload.parallel and end < len(items) and items[end].method == "GET":
+            end += 1
+        if end - start > 1:
+            results.extend(await asyncio.gather(*(_read(index) for index in range(start, end))))
+            continue
+        item = items[start]
+        result = await _dispatch(request, start, item, paths[start], batch)
+        if result.status >= 400:
+            # Leave no failed transaction behind for the next call.
+            db.rollback()
+        if item.method != "GET":
+            # A write may have changed memberships or removed a project.
+            batch.members.clear()
+            batch.projects.clear()
+        results.append(result)
+    return success_response(request, results)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import coalesced_read, get_current_user
 from app.api.response import success_response
 from app.crud import dashboard as dashboard_crud
 from app.schemas.common import ErrorResponse, SuccessResponse
@@ -10,6 +10,10 @@ from app.schemas.dashboard import DashboardSummary
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
 
+def _summary(db: Session, user_id: str) -> DashboardSummary:
+    return DashboardSummary.model_validate(dashboard_crud.get_summary(db, user_id))
+
+
 @router.get(
     "/summary",
     summary="Get dashboard summary",
@@ -17,6 +21,6 @@ router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
     response_model=SuccessResponse[DashboardSummary],
     responses={401: {"model": ErrorResponse}},
 )
-def get_summary(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    summary = dashboard_crud.get_summary(db, user.id)
-    return success_response(request, DashboardSummary.model_validate(summary))
+async def get_summary(request: Request, user=Depends(get_current_user)):
+    summary = await coalesced_read(request, "dashboard.summary", user.id, lambda db: _summary(db, user.id))
+    return success_response(request, summary)
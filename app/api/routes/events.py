@@ -0,0 +1,94 @@
+import json
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_access_claims, get_db, get_stream_user, require_org_role
+from app.api.response import success_response
+from app.core.config import settings
+from app.core.events import ChangeEvent, Subscription, event_bus
+from app.core.ids import new_id
+from app.core.security import create_stream_ticket
+from app.models.enums import OrgRole
+from app.schemas.auth import StreamTicketOut
+from app.schemas.common import ErrorResponse, SuccessResponse
+
+router = APIRouter(prefix="/api", tags=["Events"])
+
+RETRY_MILLISECONDS = 3000
+
+
+def _format_event(event: ChangeEvent) -> str:
+    payload = json.dumps(event.to_dict(), separators=(",", ":"), default=str)
+    return f"id: {event.id}\nevent: {event.type}\ndata: {payload}\n\n"
+
+
+async def _event_stream(subscription: Subscription, backlog: list[ChangeEvent] | None):
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        if backlog is None:
+            yield 'event: reset\ndata: {"reason":"history_unavailable"}\n\n'
+        else:
+            for event in backlog:
+                yield _format_event(event)
+        async for event in subscription.listen(settings.events_heartbeat_seconds):
+            yield ": keep-alive\n\n" if event is None else _format_event(event)
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.post(
+    "/orgs/{org_id}/events/ticket",
+    summary="Issue event stream ticket",
+    description=(
+        "Issue a single-use ticket that opens this organization's event stream, for clients such as EventSource "
+        "that cannot send an Authorization header. Pass it as `ticket` within STREAM_TICKET_SECONDS "
+        f"(default {settings.stream_ticket_seconds}); fetch a new one to reconnect."
+    ),
+    response_model=SuccessResponse[StreamTicketOut],
+    responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+def issue_stream_ticket(
+    org_id: str,
+    request: Request,
+    claims: dict = Depends(get_access_claims),
+    member=Depends(require_org_role(OrgRole.member)),
+):
+    ticket = create_stream_ticket(member.user_id, claims["fid"], org_id, new_id())
+    return success_response(request, StreamTicketOut(ticket=ticket, expires_in=settings.stream_ticket_seconds))
+
+
+@router.get(
+    "/orgs/{org_id}/events",
+    summary="Stream organization changes",
+    description=(
+        "Server-Sent Events stream of create/update/delete events for an organization. Authenticate with the "
+        "Authorization header or, from EventSource, with a `ticket` from POST /api/orgs/{org_id}/events/ticket. "
+        "Reconnect with the Last-Event-ID header (or last_event_id query) to resume; "
+        "a `reset` event means history is unavailable and lists should be refetched."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+)
+async def stream_events(
+    org_id: str,
+    last_event_id_header: str | None = Header(None, alias="Last-Event-ID"),
+    last_event_id: str | None = Query(None),
+    db: Session = Depends(get_db),
+    member=Depends(require_org_role(OrgRole.member, get_stream_user)),
+):
+    user_id = member.user_id
+    # Release the pooled connection now; the stream may stay open for hours.
+    db.close()
+    subscription, backlog = event_bus.subscribe(org_id, user_id, last_event_id_header or last_event_id)
+    return StreamingResponse(
+        _event_stream(subscription, backlog),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,40 @@
+import os
+
+from fastapi import APIRouter, Request
+
+from app.api.response import success_response
+from app.core.coalesce import single_flight
+from app.core.errors import AppException, ErrorCode
+from app.schemas.common import ErrorResponse, SuccessResponse
+from app.schemas.health import HealthOut
+
+router = APIRouter(tags=["Health"])
+
+
+def _health(status: str, **extra) -> HealthOut:
+    return HealthOut(status=status, pid=os.getpid(), worker=os.environ.get("POLARIS_WORKER_ID"), **extra)
+
+
+@router.get(
+    "/healthz",
+    summary="Liveness probe",
+    description=(
+        "Report that this worker process is alive, with its read coalescing counters. Does not touch the database."
+    ),
+    response_model=SuccessResponse[HealthOut],
+)
+async def healthz(request: Request):
+    return success_response(request, _health("ok", coalescing=single_flight.stats()))
+
+
+@router.get(
+    "/readyz",
+    summary="Readiness probe",
+    description="Report whether this worker has finished startup and should receive traffic.",
+    response_model=SuccessResponse[HealthOut],
+    responses={503: {"model": ErrorResponse}},
+)
+async def readyz(request: Request):
+    if not getattr(request.app.state, "ready", False):
+        raise AppException(503, ErrorCode.UNAVAILABLE, "Worker is not ready", detail=_health("starting").model_dump())
+    return success_response(request, _health("ready"))
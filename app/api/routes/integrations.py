@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_org_role
-from app.api.response import success_response
+from app.api.deps import get_current_user, get_db, require_org_role, sparse_fields
+from app.api.response import sparse_response, success_response
 from app.core.errors import AppException, ErrorCode
 from app.crud import member as member_crud
 from app.crud import integration as integration_crud
@@ -23,10 +23,13 @@ router = APIRouter(prefix="/api", tags=["Integrations"])
 def list_integrations(
     org_id: str,
     request: Request,
+    fields: tuple[str, ...] | None = Depends(sparse_fields(IntegrationOut)),
     db: Session = Depends(get_db),
     _member=Depends(require_org_role(OrgRole.member)),
 ):
-    integrations = integration_crud.list_integrations(db, org_id)
+    integrations = integration_crud.list_integrations(db, org_id, fields)
+    if fields:
+        return sparse_response(request, integrations, IntegrationOut, fields)
     return success_response(request, [IntegrationOut.model_validate(i) for i in integrations])
 
 
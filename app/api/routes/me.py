@@ -0,0 +1,46 @@
+import json
+
+from fastapi import APIRouter, Depends, Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import get_current_user_id
+from app.core.compression import etag_matches
+from app.core.database import SessionLocal
+from app.core.tree_cache import TreeEntry, tree_cache
+from app.crud import tree as tree_crud
+from app.schemas.common import ErrorResponse, SuccessResponse
+from app.schemas.tree import TreeOut
+
+router = APIRouter(prefix="/api/me", tags=["Me"])
+
+
+def _build_tree(user_id: str) -> TreeEntry:
+    version = tree_cache.begin()
+    with SessionLocal() as db:
+        orgs = tree_crud.load_tree(db, user_id)
+    body = TreeOut.model_validate({"version": tree_cache.tag(version), "orgs": orgs}).model_dump_json().encode()
+    return tree_cache.put(user_id, version, [org["id"] for org in orgs], body)
+
+
+@router.get(
+    "/tree",
+    summary="Get organization tree",
+    description=(
+        "Organizations the current user belongs to, with their role and every project and service. "
+        "Served from a per-user cache invalidated by org/project/service/member writes; "
+        "send the ETag back in If-None-Match to get 304 when nothing changed."
+    ),
+    response_model=SuccessResponse[TreeOut],
+    responses={304: {"description": "Tree unchanged"}, 401: {"model": ErrorResponse}},
+)
+async def get_tree(request: Request, user_id: str = Depends(get_current_user_id)):
+    entry = tree_cache.get(user_id)
+    if entry is None:
+        entry = await run_in_threadpool(_build_tree, user_id)
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    meta = json.dumps({"request_id": getattr(request.state, "request_id", ""), "paging": None}).encode()
+    # The cached body is spliced into the envelope as bytes; only the request id is serialized per request.
+    body = b'{"ok":true,"data":' + entry.body + b',"meta":' + meta + b"}"
+    return Response(body, media_type="application/json", headers=headers)
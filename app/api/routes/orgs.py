@@ -1,15 +1,25 @@
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_org_role
-from app.api.response import success_response
+from app.api.deps import get_current_user, get_db, includes, require_org_role, sparse_fields
+from app.api.includes import org_includes
+from app.api.response import sparse_response, success_response
+from app.core.config import settings
 from app.core.errors import AppException, ErrorCode
 from app.crud import member as member_crud
 from app.crud import org as org_crud
 from app.crud import user as user_crud
 from app.models.enums import OrgRole
 from app.schemas.common import ErrorResponse, SuccessResponse
-from app.schemas.org import MemberCreate, MemberOut, MemberUpdate, OrganizationCreate, OrganizationOut, OrganizationUpdate
+from app.schemas.org import (
+    MemberCreate,
+    MemberOut,
+    MemberUpdate,
+    OrganizationCreate,
+    OrganizationDetailOut,
+    OrganizationOut,
+    OrganizationUpdate,
+)
 
 router = APIRouter(prefix="/api/orgs", tags=["Orgs"])
 
@@ -21,8 +31,15 @@ router = APIRouter(prefix="/api/orgs", tags=["Orgs"])
     response_model=SuccessResponse[list[OrganizationOut]],
     responses={401: {"model": ErrorResponse}},
 )
-def list_orgs(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    orgs = org_crud.list_orgs_for_user(db, user.id)
+def list_orgs(
+    request: Request,
+    fields: tuple[str, ...] | None = Depends(sparse_fields(OrganizationOut)),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    orgs = org_crud.list_orgs_for_user(db, user.id, fields)
+    if fields:
+        return sparse_response(request, orgs, OrganizationOut, fields)
     return success_response(request, [OrganizationOut.model_validate(org) for org in orgs])
 
 
@@ -41,20 +58,29 @@ def create_org(payload: OrganizationCreate, request: Request, db: Session = Depe
 @router.get(
     "/{org_id}",
     summary="Get organization",
-    description="Fetch a specific organization by ID.",
-    response_model=SuccessResponse[OrganizationOut],
-    responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+    description=(
+        "Fetch a specific organization by ID. `include` embeds related collections (one query per level); "
+        "each collection is capped at INCLUDE_MAX_ITEMS and capped collections are listed in `truncated`."
+    ),
+    response_model=SuccessResponse[OrganizationDetailOut],
+    # Collections that were not requested are left out rather than sent as null.
+    response_model_exclude_unset=True,
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 def get_org(
     org_id: str,
     request: Request,
+    include: frozenset[str] = Depends(includes("projects", "projects.services", "policies", "integrations")),
     db: Session = Depends(get_db),
     _member=Depends(require_org_role(OrgRole.member)),
 ):
     org = org_crud.get_org(db, org_id)
     if not org:
         raise AppException(404, ErrorCode.NOT_FOUND, "Organization not found")
-    return success_response(request, OrganizationOut.model_validate(org))
+    data = OrganizationOut.model_validate(org).model_dump()
+    if include:
+        data.update(org_includes(db, org.id, include, settings.include_max_items))
+    return success_response(request, data)
 
 
 @router.patch(
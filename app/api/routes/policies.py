@@ -1,18 +1,24 @@
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_org_role
-from app.api.response import success_response
+from app.api.deps import coalesced_read, get_current_user, get_db, get_ids, require_org_role, sparse_fields
+from app.api.response import multi_get_response, sparse_response, success_response
 from app.core.errors import AppException, ErrorCode
+from app.core.policy_engine import evaluate, policy_cache
 from app.crud import member as member_crud
 from app.crud import policy as policy_crud
 from app.models.enums import OrgRole
-from app.schemas.common import ErrorResponse, SuccessResponse
-from app.schemas.policy import PolicyCreate, PolicyOut, PolicyUpdate
+from app.schemas.common import ErrorResponse, MultiGetItem, SuccessResponse
+from app.schemas.policy import PolicyCreate, PolicyEvaluationOut, PolicyEvaluationRequest, PolicyOut, PolicyUpdate
 
 router = APIRouter(prefix="/api", tags=["Policies"])
 
 
+def _list_policies(db: Session, org_id: str, fields: tuple[str, ...] | None) -> list:
+    policies = policy_crud.list_policies(db, org_id, fields)
+    return policies if fields else [PolicyOut.model_validate(p) for p in policies]
+
+
 @router.get(
     "/orgs/{org_id}/policies",
     summary="List policies",
@@ -20,14 +26,19 @@ router = APIRouter(prefix="/api", tags=["Policies"])
     response_model=SuccessResponse[list[PolicyOut]],
     responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
 )
-def list_policies(
+async def list_policies(
     org_id: str,
     request: Request,
-    db: Session = Depends(get_db),
+    fields: tuple[str, ...] | None = Depends(sparse_fields(PolicyOut)),
     _member=Depends(require_org_role(OrgRole.member)),
 ):
-    policies = policy_crud.list_policies(db, org_id)
-    return success_response(request, [PolicyOut.model_validate(p) for p in policies])
+    # Every member sees the same list, so the org (not the caller) scopes the shared read.
+    policies = await coalesced_read(
+        request, "policies.list", (org_id, fields), lambda db: _list_policies(db, org_id, fields)
+    )
+    if fields:
+        return sparse_response(request, policies, PolicyOut, fields)
+    return success_response(request, policies)
 
 
 @router.post(
@@ -48,6 +59,47 @@ def create_policy(
     return success_response(request, PolicyOut.model_validate(policy))
 
 
+@router.post(
+    "/orgs/{org_id}/policies:evaluate",
+    summary="Evaluate findings against policies",
+    description=(
+        "Evaluate a batch of findings against the organization's enabled SEVERITY_MAPPING, SLA and PR_GATE "
+        "policies and return the gate decision with per-finding severity and SLA results."
+    ),
+    response_model=SuccessResponse[PolicyEvaluationOut],
+    responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+def evaluate_policies(
+    org_id: str,
+    payload: PolicyEvaluationRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    _member=Depends(require_org_role(OrgRole.member)),
+):
+    compiled = policy_cache.get(org_id, lambda: policy_crud.list_policies(db, org_id))
+    return success_response(request, evaluate(compiled, payload.findings))
+
+
+@router.get(
+    "/policies",
+    summary="Get policies by ids",
+    description=(
+        "Fetch up to 100 policies in one call. Results follow the order of `ids`; "
+        "ids that do not exist or belong to another organization are reported per item."
+    ),
+    response_model=SuccessResponse[list[MultiGetItem[PolicyOut]]],
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}},
+)
+def get_policies(
+    request: Request,
+    ids: list[str] = Depends(get_ids),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    found = policy_crud.get_policies_for_user(db, ids, user.id)
+    return multi_get_response(request, ids, found, PolicyOut.model_validate, "Policy")
+
+
 @router.get(
     "/policies/{policy_id}",
     summary="Get policy",
@@ -1,13 +1,23 @@
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_org_role, require_project_access
-from app.api.response import success_response
+from app.api.deps import (
+    get_current_user,
+    get_db,
+    get_ids,
+    includes,
+    require_org_role,
+    require_project_access,
+    sparse_fields,
+)
+from app.api.includes import project_details
+from app.api.response import multi_get_response, sparse_response, success_response
+from app.core.config import settings
 from app.core.errors import AppException, ErrorCode
 from app.crud import project as project_crud
 from app.models.enums import OrgRole
-from app.schemas.common import ErrorResponse, Paging, SuccessResponse
-from app.schemas.project import ProjectCreate, ProjectOut, ProjectUpdate
+from app.schemas.common import ErrorResponse, MultiGetItem, Paging, SuccessResponse
+from app.schemas.project import ProjectCreate, ProjectDetailOut, ProjectOut, ProjectUpdate
 
 router = APIRouter(prefix="/api", tags=["Projects"])
 
@@ -15,9 +25,14 @@ router = APIRouter(prefix="/api", tags=["Projects"])
 @router.get(
     "/orgs/{org_id}/projects",
     summary="List projects",
-    description="List projects in an organization with paging and search.",
-    response_model=SuccessResponse[list[ProjectOut]],
-    responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
+    description=(
+        "List projects in an organization with paging and search. `include=services` embeds each project's "
+        "services (one extra query for the page, capped at INCLUDE_MAX_ITEMS per project; capped projects list "
+        "`services` in `truncated`)."
+    ),
+    response_model=SuccessResponse[list[ProjectDetailOut]],
+    response_model_exclude_unset=True,
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
 )
 def list_projects(
     org_id: str,
@@ -26,11 +41,20 @@ def list_projects(
     page_size: int = Query(20, ge=1, le=100),
     sort: str | None = Query(None, examples=["created_at:desc"]),
     q: str | None = Query(None, examples=["console"]),
+    fields: tuple[str, ...] | None = Depends(sparse_fields(ProjectOut)),
+    include: frozenset[str] = Depends(includes("services")),
     db: Session = Depends(get_db),
     _member=Depends(require_org_role(OrgRole.member)),
 ):
-    projects, total = project_crud.list_projects(db, org_id, page, page_size, sort, q)
+    if fields and include:
+        raise AppException(400, ErrorCode.BAD_REQUEST, "fields and include cannot be combined")
+    projects, total = project_crud.list_projects(db, org_id, page, page_size, sort, q, fields)
     paging = Paging(total=total, page=page, page_size=page_size, has_next=(page * page_size) < total)
+    if fields:
+        return sparse_response(request, projects, ProjectOut, fields, paging)
+    if include:
+        details, _truncated = project_details(db, projects, settings.include_max_items)
+        return success_response(request, details, paging)
     return success_response(request, [ProjectOut.model_validate(p) for p in projects], paging)
 
 
@@ -52,6 +76,26 @@ def create_project(
     return success_response(request, ProjectOut.model_validate(project))
 
 
+@router.get(
+    "/projects",
+    summary="Get projects by ids",
+    description=(
+        "Fetch up to 100 projects in one call. Results follow the order of `ids`; "
+        "ids that do not exist or belong to another organization are reported per item."
+    ),
+    response_model=SuccessResponse[list[MultiGetItem[ProjectOut]]],
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}},
+)
+def get_projects(
+    request: Request,
+    ids: list[str] = Depends(get_ids),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    found = project_crud.get_projects_for_user(db, ids, user.id)
+    return multi_get_response(request, ids, found, ProjectOut.model_validate, "Project")
+
+
 @router.get(
     "/projects/{project_id}",
     summary="Get project",
@@ -1,14 +1,12 @@
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_project_access
-from app.api.response import success_response
+from app.api.deps import get_current_user, get_db, get_ids, project_member, require_project_access, sparse_fields
+from app.api.response import multi_get_response, sparse_response, success_response
 from app.core.errors import AppException, ErrorCode
-from app.crud import member as member_crud
-from app.crud import project as project_crud
 from app.crud import service as service_crud
 from app.models.enums import OrgRole
-from app.schemas.common import ErrorResponse, Paging, SuccessResponse
+from app.schemas.common import ErrorResponse, MultiGetItem, Paging, SuccessResponse
 from app.schemas.service import ServiceCreate, ServiceOut, ServiceUpdate
 
 router = APIRouter(prefix="/api", tags=["Services"])
@@ -28,11 +26,14 @@ def list_services(
     page_size: int = Query(20, ge=1, le=100),
     sort: str | None = Query(None, examples=["created_at:desc"]),
     q: str | None = Query(None, examples=["api"]),
+    fields: tuple[str, ...] | None = Depends(sparse_fields(ServiceOut)),
     db: Session = Depends(get_db),
     _member=Depends(require_project_access(OrgRole.member)),
 ):
-    services, total = service_crud.list_services(db, project_id, page, page_size, sort, q)
+    services, total = service_crud.list_services(db, project_id, page, page_size, sort, q, fields)
     paging = Paging(total=total, page=page, page_size=page_size, has_next=(page * page_size) < total)
+    if fields:
+        return sparse_response(request, services, ServiceOut, fields, paging)
     return success_response(request, [ServiceOut.model_validate(s) for s in services], paging)
 
 
@@ -54,6 +55,26 @@ def create_service(
     return success_response(request, ServiceOut.model_validate(service))
 
 
+@router.get(
+    "/services",
+    summary="Get services by ids",
+    description=(
+        "Fetch up to 100 services in one call. Results follow the order of `ids`; "
+        "ids that do not exist or belong to another organization are reported per item."
+    ),
+    response_model=SuccessResponse[list[MultiGetItem[ServiceOut]]],
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}},
+)
+def get_services(
+    request: Request,
+    ids: list[str] = Depends(get_ids),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    found = service_crud.get_services_for_user(db, ids, user.id)
+    return multi_get_response(request, ids, found, ServiceOut.model_validate, "Service")
+
+
 @router.get(
     "/services/{service_id}",
     summary="Get service",
@@ -70,12 +91,7 @@ def get_service(
     service = service_crud.get_service(db, service_id)
     if not service:
         raise AppException(404, ErrorCode.NOT_FOUND, "Service not found")
-    project = project_crud.get_project(db, service.project_id)
-    if not project:
-        raise AppException(404, ErrorCode.NOT_FOUND, "Project not found")
-    member = member_crud.get_member_by_user(db, project.org_id, user.id)
-    if not member:
-        raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+    project_member(request, db, service.project_id, user)
     return success_response(request, ServiceOut.model_validate(service))
 
 
@@ -103,12 +119,7 @@ def update_service(
     service = service_crud.get_service(db, service_id)
     if not service:
         raise AppException(404, ErrorCode.NOT_FOUND, "Service not found")
-    project = project_crud.get_project(db, service.project_id)
-    if not project:
-        raise AppException(404, ErrorCode.NOT_FOUND, "Project not found")
-    member = member_crud.get_member_by_user(db, project.org_id, user.id)
-    if not member:
-        raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+    member = project_member(request, db, service.project_id, user)
     if member.role not in (OrgRole.admin, OrgRole.owner):
         raise AppException(403, ErrorCode.FORBIDDEN, "Insufficient role")
     updated = service_crud.update_service(db, service, payload.name, payload.type, payload.environment)
@@ -131,12 +142,7 @@ def delete_service(
     service = service_crud.get_service(db, service_id)
     if not service:
         raise AppException(404, ErrorCode.NOT_FOUND, "Service not found")
-    project = project_crud.get_project(db, service.project_id)
-    if not project:
-        raise AppException(404, ErrorCode.NOT_FOUND, "Project not found")
-    member = member_crud.get_member_by_user(db, project.org_id, user.id)
-    if not member:
-        raise AppException(403, ErrorCode.FORBIDDEN, "Not a member of this organization")
+    member = project_member(request, db, service.project_id, user)
     if member.role not in (OrgRole.admin, OrgRole.owner):
         raise AppException(403, ErrorCode.FORBIDDEN, "Insufficient role")
     service_crud.delete_service(db, service)
@@ -0,0 +1,174 @@
+import argparse
+import ast
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+logger = logging.getLogger("polaris.lab.bootstrap")
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+LOCK_NAME = "polaris_schema_migration"
+BACKFILL_CHUNK = 1000
+
+
+def migration_heads(versions_dir: Path = MIGRATIONS_DIR / "versions") -> set[str]:
+    # Reads revision ids with ast instead of loading alembic's script directory, which imports every migration.
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for path in versions_dir.glob("*.py"):
+        values = {}
+        for node in ast.parse(path.read_text(encoding="utf-8")).body:
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+                values[node.target.id] = node.value
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                values[node.targets[0].id] = node.value
+        if "revision" not in values:
+            continue
+        revisions.add(ast.literal_eval(values["revision"]))
+        down = ast.literal_eval(values["down_revision"]) if "down_revision" in values else None
+        if isinstance(down, str):
+            parents.add(down)
+        elif down:
+            parents.update(down)
+    return revisions - parents
+
+
+def current_revisions(conn: Connection) -> set[str] | None:
+    try:
+        return set(conn.execute(text("SELECT version_num FROM alembic_version")).scalars().all())
+    except DBAPIError:
+        return None
+    finally:
+        # End the read transaction so a later check does not reuse an old snapshot.
+        conn.rollback()
+
+
+@contextmanager
+def migration_lock(conn: Connection, timeout: float) -> Iterator[None]:
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        acquired = conn.execute(text("SELECT GET_LOCK(:name, :timeout)"), {"name": LOCK_NAME, "timeout": timeout}).scalar()
+        if acquired != 1:
+            raise RuntimeError(f"Timed out after {timeout}s waiting for the migration lock")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+    elif dialect == "postgresql":
+        conn.execute(text("SELECT pg_advisory_lock(hashtext(:name))"), {"name": LOCK_NAME})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": LOCK_NAME})
+    else:
+        # SQLite is a local file; there are no concurrent replicas to coordinate.
+        yield
+
+
+def _connect(engine: Engine, wait_seconds: float) -> Connection:
+    deadline = time.monotonic() + wait_seconds
+    delay = 0.25
+    while True:
+        try:
+            return engine.connect()
+        except OperationalError as exc:
+            if time.monotonic() >= deadline:
+                raise SystemExit(f"Database not ready: {exc}") from exc
+            logger.info("Waiting for database: %s", exc.orig)
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+
+
+def _upgrade(database_url: str) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(MIGRATIONS_DIR.parent.parent / "alembic.ini"))
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["database_url"] = database_url
+    command.upgrade(config, "head")
+
+
+def bootstrap(
+    database_url: str | None = None,
+    wait_seconds: float | None = None,
+    lock_timeout: float | None = None,
+) -> str:
+    heads = migration_heads()
+    database_url = database_url or settings.database_url
+    engine = create_engine(database_url, poolclass=NullPool, future=True)
+    try:
+        with _connect(engine, settings.db_wait_seconds if wait_seconds is None else wait_seconds) as conn:
+            if current_revisions(conn) == heads:
+                return "current"
+            timeout = settings.migration_lock_timeout_seconds if lock_timeout is None else lock_timeout
+            with migration_lock(conn, timeout):
+                if current_revisions(conn) == heads:
+                    return "current"
+                logger.info("Migrating schema to %s", ", ".join(sorted(heads)))
+                _upgrade(database_url)
+                return "migrated"
+    finally:
+        engine.dispose()
+
+
+def backfill_users(database_url: str, shard_url: str) -> int:
+    # Shards need a credential-less copy of every user for the org owner and member foreign keys. Users created
+    # before the shard existed (or whose copy failed at registration) are filled in here.
+    from app.models.user import User
+
+    users = User.__table__
+    source = create_engine(database_url, poolclass=NullPool, future=True)
+    target = create_engine(shard_url, poolclass=NullPool, future=True)
+    try:
+        with source.connect() as conn:
+            rows = conn.execute(select(users.c.id, users.c.email, users.c.name, users.c.is_active)).all()
+        with target.begin() as conn:
+            existing = set(conn.execute(select(users.c.id)).scalars())
+            missing = [
+                {"id": row.id, "email": row.email, "password_hash": "", "name": row.name, "is_active": row.is_active}
+                for row in rows
+                if row.id not in existing
+            ]
+            for start in range(0, len(missing), BACKFILL_CHUNK):
+                conn.execute(insert(users), missing[start : start + BACKFILL_CHUNK])
+        return len(missing)
+    finally:
+        source.dispose()
+        target.dispose()
+
+
+def bootstrap_all() -> str:
+    # The primary first, then every shard; each database carries the full schema.
+    shard_urls = settings.shard_urls_list()
+    results = [bootstrap(url) for url in (settings.database_url, *shard_urls)]
+    for shard, url in enumerate(shard_urls, start=1):
+        copied = backfill_users(settings.database_url, url)
+        if copied:
+            logger.info("Copied %d users to shard %d", copied, shard)
+    return ", ".join(results)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.bootstrap",
+        description="Wait for the database (and any shards) and migrate each to the latest revision if needed.",
+    )
+    parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    started = time.perf_counter()
+    result = bootstrap_all()
+    logger.info("Schema %s (%.1f ms)", result, (time.perf_counter() - started) * 1000)
+
+
+if __name__ == "__main__":
+    main()
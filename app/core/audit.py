@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.events import ChangeEvent, event_bus
+from app.core.ids import new_id
+from app.crud import audit as audit_crud
+
+logger = logging.getLogger("polaris.lab.audit")
+
+MAX_FLUSH_BACKOFF_SECONDS = 30
+
+
+class AuditWriter:
+    # Change events are buffered in memory and written in batches by one background task, so writes never wait on an
+    # audit INSERT. The task is the only writer: a full buffer drops its oldest entries rather than blocking requests.
+    def __init__(
+        self, session_factory: Callable[[], Session], flush_ms: int, batch_size: int, max_size: int, enabled: bool
+    ) -> None:
+        self.session_factory = session_factory
+        self.flush_seconds = flush_ms / 1000
+        self.batch_size = batch_size
+        self.max_size = max_size
+        self.enabled = enabled
+        self.written = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._buffer: deque[dict] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if not self.enabled:
+            return
+        row = {
+            "id": new_id(),
+            "org_id": event.org_id,
+            "actor_id": event.actor_id,
+            "entity": event.entity,
+            "action": event.action,
+            "entity_id": event.entity_id,
+            "data": event.data,
+            "created_at": datetime.fromtimestamp(event.ts, timezone.utc),
+        }
+        with self._lock:
+            self._buffer.append(row)
+            dropped = self._trim()
+            pending = len(self._buffer)
+        if dropped:
+            logger.warning("Audit buffer full, dropped the oldest entry (%d dropped)", self.dropped)
+        if pending >= self.batch_size:
+            self._wake()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def _trim(self) -> int:
+        # Caller holds the lock.
+        dropped = 0
+        while len(self._buffer) > self.max_size:
+            self._buffer.popleft()
+            dropped += 1
+        self.dropped += dropped
+        return dropped
+
+    def _take(self) -> list[dict]:
+        with self._lock:
+            count = min(len(self._buffer), self.batch_size)
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def flush(self) -> int:
+        written = 0
+        while batch := self._take():
+            try:
+                with self.session_factory() as db:
+                    audit_crud.insert_entries(db, batch)
+            except Exception:
+                # Put the batch back in order so the next flush retries it, within the buffer bound.
+                with self._lock:
+                    self._buffer.extendleft(reversed(batch))
+                    dropped = self._trim()
+                if dropped:
+                    logger.warning("Audit buffer full, dropped %d oldest entries (%d dropped)", dropped, self.dropped)
+                raise
+            written += len(batch)
+        self.written += written
+        return written
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._loop = None
+        self._wakeup = None
+        # Drain whatever was buffered before the engine is disposed.
+        try:
+            written = await asyncio.to_thread(self.flush)
+        except Exception:
+            logger.exception("Audit drain failed, %d entries lost", self.pending())
+            return
+        if written:
+            logger.info("Audit drained %d entries on shutdown", written)
+
+    async def _run(self) -> None:
+        delay = 0.0
+        while True:
+            if delay:
+                # Backing off: wakeups from a filling buffer do not trigger an early retry.
+                await asyncio.sleep(delay)
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+                delay = 0.0
+            except Exception:
+                delay = min(max(delay * 2, 1.0), MAX_FLUSH_BACKOFF_SECONDS)
+                logger.exception("Audit flush failed, retrying in %.0f s", delay)
+
+
+audit_writer = AuditWriter(
+    SessionLocal, settings.audit_flush_ms, settings.audit_batch_size, settings.audit_queue_size, settings.audit_enabled
+)
+event_bus.add_listener(audit_writer.on_change)
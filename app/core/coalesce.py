@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Callable, Hashable, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    # Concurrent calls with the same key share one computation in the threadpool. Results are not cached: the next
+    # call after a flight lands starts a new one. Mutated only from the event loop, so no locks are needed.
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._flights: dict[tuple[str, Hashable], asyncio.Future] = {}
+        self._counts: dict[str, list[int]] = {}
+
+    async def do(self, route: str, key: Hashable, func: Callable[..., T], *args: Any) -> T:
+        if not self.enabled:
+            return await run_in_threadpool(func, *args)
+        counts = self._counts.setdefault(route, [0, 0])
+        counts[0] += 1
+        flight_key = (route, key)
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            counts[1] += 1
+            flight = self._flights[flight_key] = asyncio.ensure_future(run_in_threadpool(func, *args))
+            flight.add_done_callback(lambda done: self._finish(flight_key, done))
+        # Shielded: a caller that goes away does not cancel the computation the others are waiting for.
+        return await asyncio.shield(flight)
+
+    def _finish(self, flight_key: tuple[str, Hashable], flight: asyncio.Future) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+        if not flight.cancelled():
+            flight.exception()
+
+    def stats(self) -> dict:
+        routes = {}
+        for route, (requests, executions) in self._counts.items():
+            routes[route] = {
+                "requests": requests,
+                "executions": executions,
+                "coalesced": requests - executions,
+                "coalescing_ratio": round((requests - executions) / requests, 4) if requests else 0.0,
+            }
+        return {"in_flight": len(self._flights), "routes": routes}
+
+
+single_flight = SingleFlight(settings.coalesce_enabled)
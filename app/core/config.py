@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,10 +12,82 @@ class Settings(BaseSettings):
     )
 
     database_url: str = Field(..., alias="DATABASE_URL")
+    database_replica_urls: str = Field("", alias="DATABASE_REPLICA_URLS")
+    database_shard_urls: str = Field("", alias="DATABASE_SHARD_URLS")
+    shard_cache_size: int = Field(100_000, alias="SHARD_CACHE_SIZE")
+    replica_max_lag_seconds: float = Field(5.0, alias="REPLICA_MAX_LAG_SECONDS")
+    replica_check_seconds: float = Field(2.0, alias="REPLICA_CHECK_SECONDS")
+    read_your_writes_seconds: float = Field(10.0, alias="READ_YOUR_WRITES_SECONDS")
+    db_wait_seconds: float = Field(60.0, alias="DB_WAIT_SECONDS")
+    migration_lock_timeout_seconds: float = Field(300.0, alias="MIGRATION_LOCK_TIMEOUT_SECONDS")
+    schema_bootstrap: bool = Field(False, alias="SCHEMA_BOOTSTRAP")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(1800, alias="DB_POOL_RECYCLE_SECONDS")
+    id_storage: Literal["string", "binary"] = Field("string", alias="ID_STORAGE")
+    warmup_enabled: bool = Field(True, alias="WARMUP_ENABLED")
     jwt_secret: str = Field(..., alias="JWT_SECRET")
     access_token_expire_minutes: int = Field(30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+    token_cache_size: int = Field(10_000, alias="TOKEN_CACHE_SIZE")
+    revocation_index_size: int = Field(100_000, alias="REVOCATION_INDEX_SIZE")
+    revocation_sync_seconds: float = Field(10.0, alias="REVOCATION_SYNC_SECONDS")
+    web_concurrency: int | None = Field(None, alias="WEB_CONCURRENCY")
+    graceful_timeout_seconds: float = Field(30.0, alias="GRACEFUL_TIMEOUT_SECONDS")
+    openapi_cache_path: str | None = Field(None, alias="OPENAPI_CACHE_PATH")
+    batch_max_requests: int = Field(20, alias="BATCH_MAX_REQUESTS")
+    batch_max_parallel: int = Field(4, alias="BATCH_MAX_PARALLEL")
+    coalesce_enabled: bool = Field(True, alias="COALESCE_ENABLED")
+    idempotency_enabled: bool = Field(True, alias="IDEMPOTENCY_ENABLED")
+    idempotency_store: str = Field("app.core.idempotency:MemoryStore", alias="IDEMPOTENCY_STORE")
+    idempotency_ttl_seconds: float = Field(86_400.0, alias="IDEMPOTENCY_TTL_SECONDS")
+    idempotency_max_entries: int = Field(10_000, alias="IDEMPOTENCY_MAX_ENTRIES")
+    idempotency_max_body_bytes: int = Field(1_048_576, alias="IDEMPOTENCY_MAX_BODY_BYTES")
+    rate_limit_enabled: bool = Field(True, alias="RATE_LIMIT_ENABLED")
+    rate_limit_store: str = Field("app.core.ratelimit:MemoryStore", alias="RATE_LIMIT_STORE")
+    rate_limit_user_per_second: float = Field(20.0, alias="RATE_LIMIT_USER_PER_SECOND")
+    rate_limit_user_burst: int = Field(40, alias="RATE_LIMIT_USER_BURST")
+    rate_limit_org_per_second: float = Field(50.0, alias="RATE_LIMIT_ORG_PER_SECOND")
+    rate_limit_org_burst: int = Field(100, alias="RATE_LIMIT_ORG_BURST")
+    rate_limit_login_per_minute: float = Field(10.0, alias="RATE_LIMIT_LOGIN_PER_MINUTE")
+    rate_limit_login_burst: int = Field(10, alias="RATE_LIMIT_LOGIN_BURST")
+    tenant_max_concurrency: int = Field(20, alias="TENANT_MAX_CONCURRENCY")
+    compression_min_size: int = Field(1024, alias="COMPRESSION_MIN_SIZE")
+    compression_gzip_level: int = Field(6, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(4, alias="COMPRESSION_BROTLI_QUALITY")
+    console_dir: str | None = Field(None, alias="CONSOLE_DIR")
+    console_cache_seconds: int = Field(31_536_000, alias="CONSOLE_CACHE_SECONDS")
+    tree_cache_ttl_seconds: float = Field(60.0, alias="TREE_CACHE_TTL_SECONDS")
+    tree_cache_size: int = Field(10_000, alias="TREE_CACHE_SIZE")
+    include_max_items: int = Field(100, alias="INCLUDE_MAX_ITEMS")
     cors_allow_origins: str = Field("*", alias="CORS_ALLOW_ORIGINS")
+    events_buffer_size: int = Field(256, alias="EVENTS_BUFFER_SIZE")
+    events_queue_size: int = Field(100, alias="EVENTS_QUEUE_SIZE")
+    events_heartbeat_seconds: float = Field(15.0, alias="EVENTS_HEARTBEAT_SECONDS")
+    stream_ticket_seconds: int = Field(30, alias="STREAM_TICKET_SECONDS")
+    policy_cache_ttl_seconds: float = Field(60.0, alias="POLICY_CACHE_TTL_SECONDS")
+    audit_enabled: bool = Field(True, alias="AUDIT_ENABLED")
+    audit_flush_ms: int = Field(200, alias="AUDIT_FLUSH_MS")
+    audit_batch_size: int = Field(500, alias="AUDIT_BATCH_SIZE")
+    audit_queue_size: int = Field(10_000, alias="AUDIT_QUEUE_SIZE")
+    integration_dispatch_enabled: bool = Field(True, alias="INTEGRATION_DISPATCH_ENABLED")
+    integration_pending_size: int = Field(10_000, alias="INTEGRATION_PENDING_SIZE")
+    integration_failed_retention_hours: float = Field(168.0, alias="INTEGRATION_FAILED_RETENTION_HOURS")
+    integration_poll_seconds: float = Field(5.0, alias="INTEGRATION_POLL_SECONDS")
+    integration_batch_size: int = Field(50, alias="INTEGRATION_BATCH_SIZE")
+    integration_batch_window_ms: int = Field(250, alias="INTEGRATION_BATCH_WINDOW_MS")
+    integration_queue_size: int = Field(500, alias="INTEGRATION_QUEUE_SIZE")
+    integration_rate_per_second: float = Field(1.0, alias="INTEGRATION_RATE_PER_SECOND")
+    integration_rate_burst: int = Field(5, alias="INTEGRATION_RATE_BURST")
+    integration_max_attempts: int = Field(8, alias="INTEGRATION_MAX_ATTEMPTS")
+    integration_http_timeout_seconds: float = Field(10.0, alias="INTEGRATION_HTTP_TIMEOUT_SECONDS")
+    integration_max_connections: int = Field(20, alias="INTEGRATION_MAX_CONNECTIONS")
+
+    def replica_urls_list(self) -> list[str]:
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
+    def shard_urls_list(self) -> list[str]:
+        return [url.strip() for url in self.database_shard_urls.split(",") if url.strip()]
 
     def cors_origins_list(self) -> list[str]:
         if self.cors_allow_origins == "*":
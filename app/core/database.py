@@ -1,20 +1,325 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import bisect
+import hashlib
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 
 from app.core.config import settings
 
+logger = logging.getLogger("polaris.lab.database")
+
+T = TypeVar("T")
+
+# Tables that are not partitioned by organization and always live on the primary (shard 0).
+GLOBAL_TABLES = frozenset({"polaris_users", "polaris_refresh_tokens", "polaris_audit_logs", "polaris_org_shards"})
+
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
 
-def _build_engine():
+
+def _build_engine(url: str | None = None):
+    url = url or settings.database_url
     connect_args = {}
-    if settings.database_url.startswith("sqlite"):
+    pool_args = {}
+    if url.startswith("sqlite"):
         connect_args = {"check_same_thread": False}
+    else:
+        pool_args = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+        }
     return create_engine(
-        settings.database_url,
+        url,
         pool_pre_ping=True,
         future=True,
         connect_args=connect_args,
+        **pool_args,
     )
 
 
-engine = _build_engine()
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+def get_engine() -> Engine:
+    # Built on first use (normally the app lifespan) so importing the app never touches the database driver.
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _build_engine()
+    return _engine
+
+
+def dispose_engine(close: bool = True) -> None:
+    # close=False is for forked children: drop inherited pooled connections without closing the parent's sockets.
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose(close=close)
+            _engine = None
+    replica_pool.dispose(close=close)
+    shard_router.dispose(close=close)
+
+
+def _replica_lag(engine: Engine) -> float | None:
+    # Seconds behind the primary, 0 for a database that is not replicating, None when it cannot serve reads.
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            lag = conn.execute(
+                text("SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) WHERE pg_is_in_recovery()")
+            ).scalar()
+            return float(lag or 0)
+        if engine.dialect.name == "mysql":
+            try:
+                row = conn.execute(text("SHOW REPLICA STATUS")).mappings().first()
+            except DBAPIError:
+                row = conn.execute(text("SHOW SLAVE STATUS")).mappings().first()
+            if row is None:
+                return 0.0
+            lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+            return None if lag is None else float(lag)
+        conn.execute(text("SELECT 1"))
+        return 0.0
+
+
+class ReplicaPool:
+    def __init__(self, urls: list[str], max_lag: float) -> None:
+        self.urls = urls
+        self.max_lag = max_lag
+        self._engines: list[Engine] | None = None
+        self._healthy: list[Engine] = []
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    def engines(self) -> list[Engine]:
+        if self._engines is None:
+            with self._lock:
+                if self._engines is None:
+                    self._engines = [_build_engine(url) for url in self.urls]
+        return self._engines
+
+    def choose(self) -> Engine | None:
+        # Nothing is healthy until the first check, so reads start on the primary.
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check(self) -> int:
+        healthy = []
+        for engine in self.engines():
+            name = engine.url.host or engine.url.database
+            try:
+                lag = _replica_lag(engine)
+            except Exception as exc:
+                logger.warning("Replica %s unavailable: %s", name, exc)
+                continue
+            if lag is not None and lag <= self.max_lag:
+                healthy.append(engine)
+            else:
+                logger.warning("Replica %s lagging (%s s), reading from primary", name, lag)
+        self._healthy = healthy
+        return len(healthy)
+
+    async def run(self, interval: float) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.check)
+            except Exception:
+                logger.exception("Replica health check failed")
+            await asyncio.sleep(interval)
+
+    def dispose(self, close: bool = True) -> None:
+        with self._lock:
+            engines, self._engines = self._engines or [], None
+            self._healthy = []
+        for engine in engines:
+            engine.dispose(close=close)
+
+
+replica_pool = ReplicaPool(settings.replica_urls_list(), settings.replica_max_lag_seconds)
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class ShardRouter:
+    # Shard 0 is DATABASE_URL; DATABASE_SHARD_URLS adds shards 1..N. New organizations are placed by consistent hash
+    # and recorded in the polaris_org_shards directory, so adding a shard never moves existing orgs.
+    def __init__(self, urls: list[str], cache_size: int, vnodes: int = 64) -> None:
+        self.urls = urls
+        self.cache_size = cache_size
+        self.vnodes = vnodes
+        self._lock = threading.Lock()
+        self._engines: dict[int, Engine] = {}
+        self._ring: list[tuple[int, int]] | None = None
+        self._orgs: OrderedDict[str, int] = OrderedDict()
+        self._locations: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._mirrored: OrderedDict[tuple[str, str, int], int] = OrderedDict()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    def shards(self) -> range:
+        return range(len(self.urls) + 1)
+
+    def engine(self, shard: int) -> Engine:
+        if shard == 0:
+            return get_engine()
+        engine = self._engines.get(shard)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(shard)
+                if engine is None:
+                    engine = self._engines[shard] = _build_engine(self.urls[shard - 1])
+        return engine
+
+    def session(self, shard: int) -> Session:
+        db = SessionLocal()
+        if shard:
+            db.info["shard"] = shard
+        return db
+
+    def _remember(self, cache: OrderedDict, key: Any, shard: int) -> None:
+        with self._lock:
+            cache[key] = shard
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def _hash_shard(self, org_id: str) -> int:
+        ring = self._ring
+        if ring is None:
+            ring = self._ring = sorted(
+                (_ring_hash(f"{shard}:{vnode}"), shard) for shard in self.shards() for vnode in range(self.vnodes)
+            )
+        index = bisect.bisect(ring, (_ring_hash(org_id), len(self.urls) + 1)) % len(ring)
+        return ring[index][1]
+
+    def assign(self, org_id: str) -> int:
+        from app.models.org_shard import OrgShard
+
+        shard = self._hash_shard(org_id)
+        with SessionLocal() as db:
+            db.add(OrgShard(org_id=org_id, shard=shard))
+            db.commit()
+        self._remember(self._orgs, org_id, shard)
+        return shard
+
+    def shard_for_org(self, org_id: str) -> int:
+        from app.models.org_shard import OrgShard
+
+        shard = self._orgs.get(org_id)
+        if shard is None:
+            with SessionLocal() as db:
+                shard = db.execute(select(OrgShard.shard).where(OrgShard.org_id == org_id)).scalar_one_or_none() or 0
+            # Placement never changes, so misses (orgs created before sharding) are cached as shard 0 too.
+            self._remember(self._orgs, org_id, shard)
+        return shard
+
+    def locate(self, model: Any, entity_id: str) -> int | None:
+        key = (model.__tablename__, entity_id)
+        shard = self._locations.get(key)
+        if shard is None:
+            query = select(model.id).where(model.id == entity_id)
+            found = self.fan_out(None, lambda db: db.execute(query).first() is not None)
+            shard = next((shard for shard, hit in zip(self.shards(), found) if hit), None)
+            if shard is not None:
+                self._remember(self._locations, key, shard)
+        return shard
+
+    def fan_out(self, db: Session | None, func: Callable[[Session], T]) -> list[T]:
+        # Runs func against every shard concurrently, in shard order. Unsharded, it runs once on the caller's session.
+        if not self.enabled and db is not None:
+            return [func(db)]
+
+        def _run(shard: int) -> T:
+            with self.session(shard) as session:
+                return func(session)
+
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    workers = min(32, 4 * len(self.shards()))
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shard-fan-out")
+        return list(self._executor.map(_run, self.shards()))
+
+    def mirror(self, model: Any, row: dict, shard: int) -> None:
+        # Copies a primary-only row to one shard so foreign keys to it hold there. Idempotent, so callers run it
+        # before every shard write that references the row.
+        key = (model.__tablename__, row["id"], shard)
+        if shard == 0 or key in self._mirrored:
+            return
+        try:
+            with self.engine(shard).begin() as conn:
+                if conn.execute(select(model.id).where(model.id == row["id"])).first() is None:
+                    conn.execute(insert(model), [row])
+        except IntegrityError:
+            pass  # Mirrored concurrently by another request.
+        self._remember(self._mirrored, key, shard)
+
+    def broadcast(self, model: Any, row: dict) -> None:
+        for shard in self.shards()[1:]:
+            self.mirror(model, row, shard)
+
+    def dispose(self, close: bool = True) -> None:
+        with self._lock:
+            engines, self._engines = list(self._engines.values()), {}
+            # Threads do not survive a fork; the next fan-out starts a fresh pool.
+            executor, self._executor = self._executor, None
+            self._ring = None
+            self._orgs.clear()
+            self._locations.clear()
+            self._mirrored.clear()
+        if executor is not None and close:
+            executor.shutdown(wait=False)
+        for engine in engines:
+            engine.dispose(close=close)
+
+
+shard_router = ShardRouter(settings.shard_urls_list(), settings.shard_cache_size)
+
+
+def _global(mapper) -> bool:
+    return mapper is not None and mapper.local_table.name in GLOBAL_TABLES
+
+
+class AppSession(Session):
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.bind is None:
+            shard = self.info.get("shard")
+            if shard and not _global(mapper):
+                return shard_router.engine(shard)
+            replica = self.info.get("replica")
+            if replica is None:
+                return get_engine()
+            if self._flushing or isinstance(clause, UpdateBase):
+                # The first write pins the rest of the session to the primary.
+                del self.info["replica"]
+                return get_engine()
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+SessionLocal = sessionmaker(class_=AppSession, autocommit=False, autoflush=False, future=True)
+
+
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
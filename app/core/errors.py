@@ -14,6 +14,8 @@ class ErrorCode(str, Enum):
     CONFLICT = "CONFLICT"
     VALIDATION_ERROR = "VALIDATION_ERROR"
     BAD_REQUEST = "BAD_REQUEST"
+    UNAVAILABLE = "UNAVAILABLE"
+    RATE_LIMITED = "RATE_LIMITED"
 
 
 class AppException(Exception):
@@ -23,11 +25,13 @@ class AppException(Exception):
         code: ErrorCode,
         message: str,
         detail: Any | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self.code = code
         self.message = message
         self.detail = detail
+        self.headers = headers
 
 
 def _error_payload(request: Request, code: ErrorCode, message: str, detail: Any | None = None) -> dict:
@@ -41,7 +45,7 @@ def _error_payload(request: Request, code: ErrorCode, message: str, detail: Any
 
 def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     payload = _error_payload(request, exc.code, exc.message, exc.detail)
-    return JSONResponse(status_code=exc.status_code, content=payload)
+    return JSONResponse(status_code=exc.status_code, content=payload, headers=exc.headers)
 
 
 def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger("polaris.lab.events")
+
+SENSITIVE_FIELDS = frozenset({"password_hash", "config_json"})
+
+_CLOSE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    id: str
+    seq: int
+    org_id: str
+    entity: str
+    action: str
+    entity_id: str
+    actor_id: str | None
+    data: dict[str, Any]
+    ts: float
+
+    @property
+    def type(self) -> str:
+        return f"{self.entity}.{self.action}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "org_id": self.org_id,
+            "entity": self.entity,
+            "action": self.action,
+            "entity_id": self.entity_id,
+            "actor_id": self.actor_id,
+            "data": self.data,
+            "ts": self.ts,
+        }
+
+
+def snapshot(obj: Any) -> dict[str, Any]:
+    data = {}
+    for column in obj.__table__.columns:
+        if column.key in SENSITIVE_FIELDS:
+            continue
+        value = getattr(obj, column.key)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[column.key] = value
+    return data
+
+
+class Subscription:
+    __slots__ = ("org_id", "user_id", "loop", "queue", "closed")
+
+    def __init__(self, org_id: str, user_id: str, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.org_id = org_id
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    def revokes_access(self, event: ChangeEvent) -> bool:
+        if event.entity == "organization" and event.action == "deleted":
+            return True
+        return event.entity == "member" and event.action == "deleted" and event.data.get("user_id") == self.user_id
+
+    def offer(self, event: ChangeEvent) -> None:
+        if self.closed:
+            return
+        if self.revokes_access(event):
+            self.close()
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the connection and let the client resume via Last-Event-ID.
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_CLOSE)
+
+    async def listen(self, heartbeat_seconds: float) -> AsyncIterator[ChangeEvent | None]:
+        while True:
+            try:
+                item = await asyncio.wait_for(self.queue.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if item is _CLOSE:
+                return
+            yield item
+
+
+class EventBus:
+    def __init__(self, buffer_size: int, queue_size: int) -> None:
+        self.buffer_size = buffer_size
+        self.queue_size = queue_size
+        self.boot_id = uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffers: dict[str, deque[ChangeEvent]] = {}
+        self._evicted_through: dict[str, int] = {}
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._listeners: list[Callable[[ChangeEvent], None]] = []
+
+    def add_listener(self, listener: Callable[[ChangeEvent], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[ChangeEvent], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def publish(
+        self,
+        org_id: str,
+        entity: str,
+        action: str,
+        entity_id: str,
+        actor_id: str | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> ChangeEvent:
+        with self._lock:
+            self._seq += 1
+            event = ChangeEvent(
+                id=f"{self.boot_id}-{self._seq}",
+                seq=self._seq,
+                org_id=org_id,
+                entity=entity,
+                action=action,
+                entity_id=entity_id,
+                actor_id=actor_id,
+                data=data or {},
+                ts=time.time(),
+            )
+            buffer = self._buffers.get(org_id)
+            if buffer is None:
+                buffer = self._buffers[org_id] = deque(maxlen=self.buffer_size)
+            if len(buffer) == buffer.maxlen:
+                self._evicted_through[org_id] = buffer[0].seq
+            buffer.append(event)
+            subscribers = tuple(self._subscribers.get(org_id, ()))
+            listeners = tuple(self._listeners)
+
+        by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = {}
+        for subscription in subscribers:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, group, event)
+            except RuntimeError:
+                for subscription in group:
+                    self.unsubscribe(subscription)
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Change listener failed for %s", event.type)
+        return event
+
+    def subscribe(
+        self, org_id: str, user_id: str, last_event_id: str | None = None
+    ) -> tuple[Subscription, list[ChangeEvent] | None]:
+        subscription = Subscription(org_id, user_id, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            backlog = self._backlog(org_id, last_event_id)
+            self._subscribers.setdefault(org_id, set()).add(subscription)
+        return subscription, backlog
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.org_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.org_id]
+
+    def subscriber_count(self, org_id: str | None = None) -> int:
+        with self._lock:
+            if org_id is not None:
+                return len(self._subscribers.get(org_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _backlog(self, org_id: str, last_event_id: str | None) -> list[ChangeEvent] | None:
+        if not last_event_id:
+            return []
+        boot_id, _, seq = last_event_id.partition("-")
+        if boot_id != self.boot_id or not seq.isdigit():
+            return None
+        last_seq = int(seq)
+        if last_seq < self._evicted_through.get(org_id, 0):
+            return None
+        return [event for event in self._buffers.get(org_id, ()) if event.seq > last_seq]
+
+
+def _deliver(subscriptions: list[Subscription], event: ChangeEvent) -> None:
+    for subscription in subscriptions:
+        subscription.offer(event)
+
+
+event_bus = EventBus(settings.events_buffer_size, settings.events_queue_size)
+
+
+def publish_change(db: Session, org_id: str, entity: str, action: str, entity_id: str, data: dict[str, Any]) -> None:
+    event_bus.publish(org_id, entity, action, entity_id, db.info.get("actor_id"), data)
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.errors import AppException, ErrorCode, app_exception_handler
+from app.core.ratelimit import bearer_principal, load_store
+
+HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+# Token endpoints are excluded: replaying them would hand out stored credentials.
+EXCLUDED_PREFIXES = ("/api/auth/",)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore(Protocol):
+    # reserve() returns ("acquired", None) to the caller that must run the request, ("replay", response) once it is
+    # stored, or ("mismatch", None) when the key was used for a different request. Duplicates wait while in flight.
+    async def reserve(self, key: str, fingerprint: str, ttl: float) -> tuple[str, StoredResponse | None]: ...
+
+    async def complete(self, key: str, response: StoredResponse) -> None: ...
+
+    async def release(self, key: str) -> None: ...
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    expires_at: float
+    response: StoredResponse | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class MemoryStore:
+    # Per-process and mutated only from the event loop, like the rate-limit MemoryStore. Retries that land on another
+    # worker are not deduplicated; configure a shared store (IDEMPOTENCY_STORE) for that.
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.max_entries = max_entries or settings.idempotency_max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    async def reserve(self, key: str, fingerprint: str, ttl: float) -> tuple[str, StoredResponse | None]:
+        while True:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._entries[key] = _Entry(fingerprint, now + ttl)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                return "acquired", None
+            if entry.fingerprint != fingerprint:
+                return "mismatch", None
+            if entry.response is not None:
+                return "replay", entry.response
+            # In flight: wait for it, then look again in case it was released without a stored response.
+            await entry.done.wait()
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.response = response
+            entry.done.set()
+
+    async def release(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.done.set()
+
+
+def _fingerprint(scope: Scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{scope['method']} {scope['path']}?{scope.get('query_string', b'').decode('latin-1')}\n".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _error(scope: Scope, status: int, message: str) -> Response:
+    return app_exception_handler(Request(scope), AppException(status, ErrorCode.BAD_REQUEST, message))
+
+
+class IdempotencyMiddleware:
+    # A POST carrying Idempotency-Key runs once per (caller, key); retries get the stored response without reaching
+    # the routes. Only responses below 500 are stored, so a failed attempt can be retried with the same key.
+    def __init__(self, app: ASGIApp, enabled: bool, ttl_seconds: float, max_body_bytes: int) -> None:
+        self.app = app
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_body_bytes = max_body_bytes
+        self._store: IdempotencyStore | None = None
+
+    @property
+    def store(self) -> IdempotencyStore:
+        if self._store is None:
+            self._store = load_store(settings.idempotency_store)
+        return self._store
+
+    @store.setter
+    def store(self, store: IdempotencyStore) -> None:
+        self._store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        idempotency_key = None
+        if scope["type"] == "http" and self.enabled and scope["method"] == "POST":
+            idempotency_key = next((value for name, value in scope["headers"] if name == HEADER), None)
+        path = scope.get("path", "")
+        if idempotency_key is None or not path.startswith("/api/") or path.startswith(EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _error(scope, 400, f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")(scope, receive, send)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        client = scope.get("client")
+        principal = bearer_principal(scope) or f"ip:{client[0] if client else 'unknown'}"
+        key = f"{principal}:{idempotency_key.decode('latin-1')}"
+        status, stored = await self.store.reserve(key, _fingerprint(scope, body), self.ttl_seconds)
+        if status == "mismatch":
+            await _error(scope, 422, "Idempotency-Key was already used for a different request")(scope, receive, send)
+            return
+        if status == "replay":
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": stored.status,
+                    "headers": [*stored.headers, (b"idempotent-replayed", b"true")],
+                }
+            )
+            await send({"type": "http.response.body", "body": stored.body})
+            return
+
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        start: Message | None = None
+        parts: list[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body" and size <= self.max_body_bytes:
+                parts.append(message.get("body", b""))
+                size += len(parts[-1])
+            await send(message)
+
+        stored_response = None
+        try:
+            await self.app(scope, replay_receive, capture)
+            if start is not None and start["status"] < 500 and size <= self.max_body_bytes:
+                stored_response = StoredResponse(start["status"], list(start.get("headers", [])), b"".join(parts))
+        finally:
+            if stored_response is not None:
+                await self.store.complete(key, stored_response)
+            else:
+                await self.store.release(key)
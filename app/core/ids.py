@@ -0,0 +1,31 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    # RFC 9562 UUIDv7: 48-bit Unix milliseconds, then a 12-bit counter seeded randomly each millisecond, so ids from
+    # one process sort in creation order even within a millisecond or when the clock steps back.
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        elif _counter < 0xFFF:
+            _counter += 1
+        else:
+            _last_ms += 1
+            _counter = 0
+        timestamp, counter = _last_ms, _counter
+    tail = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return UUID(int=(timestamp << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | tail)
+
+
+def new_id() -> str:
+    return str(uuid7())
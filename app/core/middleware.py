@@ -1,9 +1,13 @@
 import logging
+import time
+from typing import Callable
 from uuid import uuid4
 
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("polaris.lab.request")
 
@@ -16,3 +20,43 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
         response.headers["X-Request-Id"] = request_id
         logger.info("%s %s %s", request.method, request.url.path, response.status_code)
         return response
+
+
+PRIMARY_PIN_COOKIE = "polaris_primary_until"
+PRIMARY_PIN_HEADER = "X-Primary-Until"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def primary_pinned(request: Request) -> bool:
+    value = request.headers.get(PRIMARY_PIN_HEADER) or request.cookies.get(PRIMARY_PIN_COOKIE)
+    try:
+        return value is not None and float(value) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    # After a successful write the client reads from the primary for a short window, so replica lag never hides its
+    # own changes. Browsers carry the cookie; API clients can echo the header.
+    def __init__(self, app: ASGIApp, window_seconds: float, enabled: Callable[[], bool]) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_METHODS or not self.enabled():
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                max_age = int(self.window_seconds) + 1
+                until = str(int(time.time()) + max_age)
+                headers = MutableHeaders(scope=message)
+                headers.append(PRIMARY_PIN_HEADER, until)
+                headers.append(
+                    "Set-Cookie", f"{PRIMARY_PIN_COOKIE}={until}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
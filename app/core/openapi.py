@@ -0,0 +1,73 @@
+import argparse
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("polaris.lab.openapi")
+
+APP_DIR = Path(__file__).resolve().parent.parent
+# Everything the document is generated from: the routes and their schemas, plus the app metadata in main.py.
+SOURCES = ("api/**/*.py", "schemas/**/*.py", "main.py")
+FINGERPRINT_KEY = "x-polaris-fingerprint"
+
+
+def openapi_fingerprint(app: Any) -> str:
+    # Cheap compared to building the document: hashes the route table and the source it is built from, so any route
+    # or schema change invalidates a prebuilt cache without a version bump.
+    digest = hashlib.sha256()
+    for route in app.routes:
+        endpoint = getattr(route, "endpoint", None)
+        digest.update(
+            repr(
+                (
+                    getattr(route, "path", ""),
+                    sorted(getattr(route, "methods", None) or ()),
+                    getattr(route, "name", ""),
+                    getattr(endpoint, "__module__", ""),
+                    getattr(endpoint, "__qualname__", ""),
+                )
+            ).encode()
+        )
+    for pattern in SOURCES:
+        for path in sorted(APP_DIR.glob(pattern)):
+            digest.update(path.relative_to(APP_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_openapi_cache(path: str | None, app: Any) -> dict | None:
+    if not path:
+        return None
+    try:
+        schema = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring OpenAPI cache %s: %s", path, exc)
+        return None
+    if schema.pop(FINGERPRINT_KEY, None) != openapi_fingerprint(app):
+        logger.warning("Ignoring OpenAPI cache %s built from other routes or schemas", path)
+        return None
+    return schema
+
+
+def write_openapi_cache(schema: dict, path: str, fingerprint: str) -> None:
+    data = {**schema, FINGERPRINT_KEY: fingerprint}
+    Path(path).write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.core.openapi",
+        description="Generate the OpenAPI document once so servers can load it instead of building it.",
+    )
+    parser.add_argument("--output", default="openapi.json")
+    args = parser.parse_args(argv)
+
+    from app.main import app, build_openapi
+
+    write_openapi_cache(build_openapi(), args.output, openapi_fingerprint(app))
+
+
+if __name__ == "__main__":
+    main()
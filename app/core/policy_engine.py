@@ -0,0 +1,188 @@
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable
+
+from app.core.config import settings
+from app.core.events import ChangeEvent, event_bus
+from app.models.enums import GateDecision, PolicyType, Severity
+from app.models.policy import Policy
+from app.schemas.configs import PrGateConfig, SeverityMappingConfig, SlaConfig, load_policy_config
+
+SEVERITIES = tuple(Severity)
+SEVERITY_RANK = {severity.value: rank for rank, severity in enumerate(SEVERITIES)}
+SLA_FIELDS = {f"{severity.value.lower()}_days": SEVERITY_RANK[severity.value] for severity in SEVERITIES}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPolicies:
+    org_id: str
+    policy_ids: dict[str, str]
+    aliases: dict[str, int]
+    overrides: dict[str, int]
+    score_bounds: tuple[float, ...]
+    score_ranks: tuple[int, ...]
+    sla_deltas: tuple[timedelta | None, ...]
+    blocking: tuple[bool, ...]
+    max_counts: tuple[int | None, ...]
+    block_on_sla_breach: bool
+
+
+def _rank(severity: Severity | str) -> int:
+    return SEVERITY_RANK[severity.value if isinstance(severity, Severity) else severity]
+
+
+def _compile_severity_mapping(config: SeverityMappingConfig) -> tuple[dict, dict, tuple, tuple]:
+    aliases = {severity.value.lower(): rank for rank, severity in enumerate(SEVERITIES)}
+    aliases.update({alias: _rank(target) for alias, target in config.aliases.items()})
+    overrides = {rule_id: _rank(target) for rule_id, target in config.overrides.items()}
+    pairs = sorted((bound, _rank(target)) for target, bound in config.thresholds.items())
+    return aliases, overrides, tuple(bound for bound, _ in pairs), tuple(rank for _, rank in pairs)
+
+
+def _compile_sla(config: SlaConfig) -> tuple[timedelta | None, ...]:
+    deltas: list[timedelta | None] = [None] * len(SEVERITIES)
+    for field, rank in SLA_FIELDS.items():
+        days = getattr(config, field)
+        if days is not None:
+            deltas[rank] = timedelta(days=days)
+    return tuple(deltas)
+
+
+def _compile_pr_gate(config: PrGateConfig) -> tuple[tuple[bool, ...], tuple[int | None, ...], bool]:
+    blocking = [False] * len(SEVERITIES)
+    for target in config.block_on:
+        blocking[_rank(target)] = True
+    max_counts: list[int | None] = [None] * len(SEVERITIES)
+    for target, limit in config.max_counts.items():
+        max_counts[_rank(target)] = limit
+    return tuple(blocking), tuple(max_counts), config.block_on_sla_breach
+
+
+def compile_policies(org_id: str, policies: Iterable[Policy]) -> CompiledPolicies:
+    active: dict[PolicyType, Policy] = {}
+    for policy in policies:
+        if policy.is_enabled and policy.type not in active:
+            active[policy.type] = policy
+
+    def config(policy_type: PolicyType):
+        policy = active.get(policy_type)
+        return load_policy_config(policy_type, policy.config_json if policy is not None else {})
+
+    aliases, overrides, score_bounds, score_ranks = _compile_severity_mapping(config(PolicyType.SEVERITY_MAPPING))
+    blocking, max_counts, block_on_sla_breach = _compile_pr_gate(config(PolicyType.PR_GATE))
+    return CompiledPolicies(
+        org_id=org_id,
+        policy_ids={policy_type.value: policy.id for policy_type, policy in active.items()},
+        aliases=aliases,
+        overrides=overrides,
+        score_bounds=score_bounds,
+        score_ranks=score_ranks,
+        sla_deltas=_compile_sla(config(PolicyType.SLA)),
+        blocking=blocking,
+        max_counts=max_counts,
+        block_on_sla_breach=block_on_sla_breach,
+    )
+
+
+def evaluate(compiled: CompiledPolicies, findings: list[Any], now: datetime | None = None) -> dict:
+    now = now or datetime.now(timezone.utc)
+    aliases = compiled.aliases
+    overrides = compiled.overrides
+    score_bounds = compiled.score_bounds
+    score_ranks = compiled.score_ranks
+    sla_deltas = compiled.sla_deltas
+    blocking = compiled.blocking
+    block_on_breach = compiled.block_on_sla_breach
+    counts = [0] * len(SEVERITIES)
+    breached_count = 0
+    results = []
+    for finding in findings:
+        rank = overrides.get(finding.rule_id) if finding.rule_id else None
+        if rank is None and finding.severity:
+            rank = aliases.get(finding.severity.lower())
+        if rank is None and finding.score is not None:
+            index = bisect_right(score_bounds, finding.score) - 1
+            rank = score_ranks[index] if index >= 0 else 0
+        if rank is None:
+            rank = 0
+        counts[rank] += 1
+        delta = sla_deltas[rank]
+        due_at = None
+        breached = False
+        if delta is not None and finding.detected_at is not None:
+            detected_at = finding.detected_at
+            if detected_at.tzinfo is None:
+                detected_at = detected_at.replace(tzinfo=timezone.utc)
+            due_at = detected_at + delta
+            breached = now > due_at
+            breached_count += breached
+        results.append(
+            {
+                "id": finding.id,
+                "severity": SEVERITIES[rank],
+                "sla_days": delta.days if delta is not None else None,
+                "due_at": due_at,
+                "breached": breached,
+                "blocking": blocking[rank] or (block_on_breach and breached),
+            }
+        )
+
+    reasons = []
+    for rank, severity in enumerate(SEVERITIES):
+        if blocking[rank] and counts[rank]:
+            reasons.append(f"{counts[rank]} {severity.value} finding(s) block merges")
+        limit = compiled.max_counts[rank]
+        if limit is not None and counts[rank] > limit:
+            reasons.append(f"{counts[rank]} {severity.value} finding(s) exceed the limit of {limit}")
+    if block_on_breach and breached_count:
+        reasons.append(f"{breached_count} finding(s) breached SLA")
+    return {
+        "gate": {
+            "decision": GateDecision.BLOCK if reasons else GateDecision.PASS,
+            "reasons": reasons,
+            "counts": {severity.value: counts[rank] for rank, severity in enumerate(SEVERITIES)},
+            "sla_breached": breached_count,
+        },
+        "policy_ids": compiled.policy_ids,
+        "findings": results,
+    }
+
+
+class PolicyCache:
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: dict[str, tuple[CompiledPolicies, float]] = {}
+
+    def get(self, org_id: str, load: Callable[[], Iterable[Policy]]) -> CompiledPolicies:
+        now = time.monotonic()
+        entry = self._entries.get(org_id)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        generation = self._generation
+        compiled = compile_policies(org_id, load())
+        with self._lock:
+            # Skip caching if a policy write raced with this compile.
+            if generation == self._generation:
+                self._entries[org_id] = (compiled, now + self.ttl_seconds)
+        return compiled
+
+    def invalidate(self, org_id: str | None = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if org_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(org_id, None)
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if event.entity == "policy" or (event.entity == "organization" and event.action == "deleted"):
+            self.invalidate(event.org_id)
+
+
+policy_cache = PolicyCache(settings.policy_cache_ttl_seconds)
+event_bus.add_listener(policy_cache.on_change)
@@ -0,0 +1,178 @@
+import importlib
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.errors import AppException, ErrorCode, app_exception_handler
+from app.core.security import decode_token_cached
+
+ORG_PATH = re.compile(r"^/api/orgs/([^/]+)")
+LOGIN_PATH = "/api/auth/login"
+
+
+class RateLimitStore(Protocol):
+    # take() returns 0 when a token was available, otherwise the seconds until the next one.
+    async def take(self, key: str, rate: float, burst: int) -> float: ...
+
+    async def acquire(self, key: str, limit: int) -> bool: ...
+
+    async def release(self, key: str) -> None: ...
+
+
+class MemoryStore:
+    # Per-process state mutated only from the event loop, so no locks are needed. With several workers each one
+    # enforces the limits on its own; configure a shared store (RATE_LIMIT_STORE) to enforce them globally.
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        # key -> [tokens, updated, seconds to refill completely], least recently used first.
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._slots: dict[str, int] = {}
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            bucket = self._buckets[key] = [float(burst), now, burst / rate]
+        else:
+            self._buckets.move_to_end(key)
+        tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+        bucket[0] = tokens
+        return (1 - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        # Buckets that have refilled completely carry no state worth keeping; each refills at its own rate.
+        for key in [key for key, (_, updated, refill) in self._buckets.items() if now - updated >= refill]:
+            del self._buckets[key]
+        # Still full: drop the least recently used, with headroom so the next new keys do not scan again.
+        for _ in range(len(self._buckets) - int(self.max_keys * 0.9)):
+            self._buckets.popitem(last=False)
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        active = self._slots.get(key, 0)
+        if active >= limit:
+            return False
+        self._slots[key] = active + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        active = self._slots.get(key, 0) - 1
+        if active > 0:
+            self._slots[key] = active
+        else:
+            self._slots.pop(key, None)
+
+
+def load_store(path: str) -> RateLimitStore:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+class RateLimiter:
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.user_rate = settings.rate_limit_user_per_second
+        self.user_burst = settings.rate_limit_user_burst
+        self.org_rate = settings.rate_limit_org_per_second
+        self.org_burst = settings.rate_limit_org_burst
+        self.login_rate = settings.rate_limit_login_per_minute / 60
+        self.login_burst = settings.rate_limit_login_burst
+        self.tenant_concurrency = settings.tenant_max_concurrency
+        self._store: RateLimitStore | None = None
+
+    @property
+    def store(self) -> RateLimitStore:
+        if self._store is None:
+            self._store = load_store(settings.rate_limit_store)
+        return self._store
+
+    @store.setter
+    def store(self, store: RateLimitStore) -> None:
+        self._store = store
+
+    async def check(self, scope: Scope) -> tuple[float, str | None]:
+        # Returns (retry_after, tenant): a positive retry_after rejects the request, a tenant must be released.
+        path = scope["path"]
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        if path == LOGIN_PATH:
+            retry_after = await self.store.take(f"login:{ip}", self.login_rate, self.login_burst)
+            if retry_after:
+                return retry_after, None
+        principal = bearer_principal(scope) or f"ip:{ip}"
+        retry_after = await self.store.take(f"user:{principal}", self.user_rate, self.user_burst)
+        if retry_after:
+            return retry_after, None
+        match = ORG_PATH.match(path)
+        tenant = f"org:{match.group(1)}" if match else principal
+        if match:
+            retry_after = await self.store.take(tenant, self.org_rate, self.org_burst)
+            if retry_after:
+                return retry_after, None
+        # Event streams stay open indefinitely and would pin a slot for their whole lifetime.
+        if path.endswith("/events"):
+            return 0.0, None
+        if not await self.store.acquire(f"concurrency:{tenant}", self.tenant_concurrency):
+            return 1.0, None
+        return 0.0, tenant
+
+    async def release(self, tenant: str) -> None:
+        await self.store.release(f"concurrency:{tenant}")
+
+
+def bearer_principal(scope: Scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            try:
+                return decode_token_cached(token).get("sub")
+            except Exception:
+                return None
+    return None
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.limiter.enabled or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+        retry_after, tenant = await self.limiter.check(scope)
+        if retry_after:
+            seconds = math.ceil(retry_after)
+            response = app_exception_handler(
+                Request(scope),
+                AppException(
+                    429,
+                    ErrorCode.RATE_LIMITED,
+                    "Too many requests",
+                    detail={"retry_after": seconds},
+                    headers={"Retry-After": str(seconds)},
+                ),
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if tenant is not None:
+                await self.limiter.release(tenant)
+
+
+rate_limiter = RateLimiter(settings.rate_limit_enabled)
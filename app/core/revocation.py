@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable
+
+from app.core.config import settings
+
+logger = logging.getLogger("polaris.lab.auth")
+
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class RevocationIndex:
+    # A revoked session family only has to be remembered until the last access token minted for it expires,
+    # so entries live for one access-token lifetime and the index stays small. If it still overflows, the families
+    # it had to forget are unknown until their tokens expire: is_revoked answers None and callers ask the database.
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._incomplete_until = 0.0
+
+    def is_revoked(self, family_id: str) -> bool | None:
+        if family_id in self._entries:
+            return True
+        return None if self.incomplete() else False
+
+    def incomplete(self) -> bool:
+        return time.time() < self._incomplete_until
+
+    def revoke(self, family_ids: Iterable[str], revoked_at: datetime) -> None:
+        until = _epoch(revoked_at) + self.ttl_seconds
+        with self._lock:
+            for family_id in family_ids:
+                self._entries[family_id] = max(until, self._entries.pop(family_id, until))
+            self._prune()
+
+    def merge(self, rows: Iterable[tuple[str, datetime]]) -> None:
+        for family_id, revoked_at in rows:
+            self.revoke((family_id,), revoked_at)
+
+    def window_start(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._incomplete_until = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prune(self) -> None:
+        now = time.time()
+        while self._entries and next(iter(self._entries.values())) <= now:
+            self._entries.popitem(last=False)
+        if len(self._entries) <= self.max_size:
+            return
+        # Synced rows can arrive out of expiry order, so sweep everything expired before forgetting live entries.
+        for family_id in [family_id for family_id, until in self._entries.items() if until <= now]:
+            del self._entries[family_id]
+        while len(self._entries) > self.max_size:
+            family_id, until = self._entries.popitem(last=False)
+            if until > self._incomplete_until:
+                if not self.incomplete():
+                    logger.warning("Revocation index is full; unknown sessions are checked against the database")
+                self._incomplete_until = until
+
+    async def run(self, sync: Callable[[], None], interval: float) -> None:
+        # Revocations made by other workers become visible here within one interval.
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(sync)
+            except Exception:
+                logger.exception("Revocation index sync failed")
+
+
+revocation_index = RevocationIndex(settings.revocation_index_size, settings.access_token_expire_minutes * 60)
@@ -1,47 +1,158 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 import jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_pwd_context = None
+
+
+def get_pwd_context():
+    # passlib and bcrypt are only needed by register/login, so they are imported on first use.
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+    return get_pwd_context().verify(password, password_hash)
 
 
-def _create_token(user_id: str, token_type: str, expires_delta: timedelta) -> str:
+def _create_token(user_id: str, token_type: str, expires_delta: timedelta, claims: dict | None = None) -> str:
     now = datetime.utcnow()
     payload = {
         "sub": user_id,
         "type": token_type,
         "iat": now,
         "exp": now + expires_delta,
+        **(claims or {}),
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
 
 
-def create_access_token(user_id: str) -> str:
+def create_access_token(user_id: str, family_id: str) -> str:
     return _create_token(
         user_id=user_id,
         token_type="access",
         expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
+        claims={"fid": family_id},
+    )
+
+
+def create_stream_ticket(user_id: str, family_id: str, org_id: str, jti: str) -> str:
+    # Opens one event stream for one org; short-lived because EventSource has to send it in the query string.
+    return _create_token(
+        user_id=user_id,
+        token_type="stream",
+        expires_delta=timedelta(seconds=settings.stream_ticket_seconds),
+        claims={"fid": family_id, "org": org_id, "jti": jti},
     )
 
 
-def create_refresh_token(user_id: str) -> str:
+def create_refresh_token(user_id: str, family_id: str, jti: str) -> str:
     return _create_token(
         user_id=user_id,
         token_type="refresh",
         expires_delta=timedelta(days=settings.refresh_token_expire_days),
+        claims={"fid": family_id, "jti": jti},
     )
 
 
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+
+
+class TokenCache:
+    # Keys are digests so raw bearer tokens are never kept in memory.
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, claims: dict) -> None:
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (claims, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+token_cache = TokenCache(settings.token_cache_size)
+
+
+def decode_token_cached(token: str) -> dict:
+    key = TokenCache.key(token)
+    claims = token_cache.get(key)
+    if claims is None:
+        claims = decode_token(token)
+        token_cache.put(key, claims)
+    return claims
+
+
+class TicketLedger:
+    # Remembers redeemed stream tickets until they expire, so each one opens a single stream in this process.
+    def __init__(self) -> None:
+        self._redeemed: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def redeem(self, jti: str, expires_at: float) -> bool:
+        now = time.time()
+        with self._lock:
+            # Every ticket has the same lifetime, so the oldest redemptions expire first.
+            while self._redeemed and next(iter(self._redeemed.values())) <= now:
+                self._redeemed.popitem(last=False)
+            if jti in self._redeemed:
+                return False
+            self._redeemed[jti] = expires_at
+            return True
+
+
+stream_tickets = TicketLedger()
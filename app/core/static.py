@@ -0,0 +1,105 @@
+import hashlib
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.core.compression import brotli, compress, etag_matches, negotiate_encoding
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    media_type: str
+    etags: dict[str, str]
+    cache_control: str
+    variants: dict[str, bytes]
+
+
+def load_asset(path: Path, max_age: int) -> Asset:
+    body = path.read_bytes()
+    variants = {"identity": body}
+    # Build-time .gz/.br siblings win; anything missing is compressed once here at the highest level.
+    for encoding, suffix, enabled in (("gzip", ".gz", True), ("br", ".br", brotli is not None)):
+        sibling = path.with_name(path.name + suffix)
+        if sibling.is_file() and sibling.stat().st_mtime >= path.stat().st_mtime:
+            variants[encoding] = sibling.read_bytes()
+        elif enabled:
+            variants[encoding] = compress(body, encoding, gzip_level=9, brotli_quality=11)
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    # The HTML entry point is revalidated so a deploy shows up at once; the assets it references are immutable.
+    if media_type == "text/html":
+        cache_control = "no-cache"
+    else:
+        cache_control = f"public, max-age={max_age}, immutable"
+    # Strong validators must differ between byte-different representations, so each encoding gets its own tag.
+    digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+    etags = {encoding: f'"{digest}"' if encoding == "identity" else f'"{digest}-{encoding}"' for encoding in variants}
+    return Asset(media_type, etags, cache_control, variants)
+
+
+
+class PrecompressedFiles:
+    def __init__(self, directory: str | Path, max_age: int = 31_536_000, index: str = "index.html") -> None:
+        self.directory = Path(directory).resolve()
+        self.max_age = max_age
+        self.index = index
+        self._assets: dict[str, Asset] | None = None
+
+    def load(self) -> dict[str, Asset]:
+        if self._assets is None:
+            self._assets = {
+                path.relative_to(self.directory).as_posix(): load_asset(path, self.max_age)
+                for path in sorted(self.directory.rglob("*"))
+                if path.is_file() and path.suffix not in (".gz", ".br")
+            }
+        return self._assets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+            await response(scope, receive, send)
+            return
+        path, root_path = scope["path"], scope.get("root_path", "")
+        name = (path[len(root_path):] if path.startswith(root_path) else path).strip("/")
+        asset = self.load().get(name or self.index)
+        if asset is None:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if encoding not in asset.variants:
+            encoding = "identity"
+        headers = {"ETag": asset.etags[encoding], "Cache-Control": asset.cache_control, "Vary": "Accept-Encoding"}
+        if etag_matches(request_headers.get("if-none-match", ""), asset.etags[encoding]):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+        body = asset.variants[encoding]
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        response = Response(body, media_type=asset.media_type, headers=headers)
+        if scope["method"] == "HEAD":
+            response.body = b""
+        await response(scope, receive, send)
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.core.static",
+        description="Write .gz (and .br when brotli is installed) siblings for every file in a directory.",
+    )
+    parser.add_argument("directory")
+    args = parser.parse_args(argv)
+    for name, asset in PrecompressedFiles(args.directory).load().items():
+        for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+            if encoding in asset.variants:
+                (Path(args.directory) / (name + suffix)).write_bytes(asset.variants[encoding])
+                print(f"{name}{suffix}: {len(asset.variants['identity'])} -> {len(asset.variants[encoding])} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.events import ChangeEvent, event_bus
+
+TREE_ENTITIES = frozenset({"organization", "project", "service", "member"})
+
+
+@dataclass(frozen=True, slots=True)
+class TreeEntry:
+    version: int
+    org_ids: tuple[str, ...]
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class TreeCache:
+    # Writes bump a version per org (and per user for membership changes) from one clock. An entry stays valid while
+    # nothing it covers was bumped after the clock value taken before its queries ran.
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.boot_id = uuid4().hex[:8]
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._org_versions: dict[str, int] = {}
+        self._user_versions: dict[str, int] = {}
+        self._entries: OrderedDict[str, TreeEntry] = OrderedDict()
+
+    def _valid(self, user_id: str, entry: TreeEntry) -> bool:
+        if entry.expires_at <= time.monotonic() or self._user_versions.get(user_id, 0) > entry.version:
+            return False
+        return all(self._org_versions.get(org_id, 0) <= entry.version for org_id in entry.org_ids)
+
+    def get(self, user_id: str) -> TreeEntry | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and self._valid(user_id, entry):
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+    def begin(self) -> int:
+        with self._lock:
+            return self._clock
+
+    def tag(self, version: int) -> str:
+        return f"{self.boot_id}-{version}"
+
+    def put(self, user_id: str, version: int, org_ids: list[str], body: bytes) -> TreeEntry:
+        entry = TreeEntry(version, tuple(org_ids), body, f'"{self.tag(version)}"', time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            if self._valid(user_id, entry):
+                self._entries[user_id] = entry
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if event.entity not in TREE_ENTITIES:
+            return
+        with self._lock:
+            self._clock += 1
+            self._org_versions[event.org_id] = self._clock
+            # A new membership adds an org the user's cached tree does not list yet.
+            user_id = event.data.get("user_id" if event.entity == "member" else "owner_user_id")
+            if user_id:
+                self._user_versions[user_id] = self._clock
+
+
+tree_cache = TreeCache(settings.tree_cache_ttl_seconds, settings.tree_cache_size)
+event_bus.add_listener(tree_cache.on_change)
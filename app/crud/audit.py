@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.audit_log import AuditLog
+
+
+def insert_entries(db: Session, rows: list[dict]) -> None:
+    # One executemany per batch; the drivers turn it into multi-row INSERTs.
+    db.execute(insert(AuditLog), rows)
+    db.commit()
+
+
+def list_entries(
+    db: Session, org_id: str, limit: int, before: tuple[datetime, str] | None = None
+) -> list[AuditLog]:
+    # Newest first, resuming strictly after the (created_at, id) of the last row seen so the index does the seek.
+    query = select(AuditLog).where(AuditLog.org_id == org_id)
+    if before is not None:
+        created_at, entry_id = before
+        query = query.where(
+            or_(AuditLog.created_at < created_at, and_(AuditLog.created_at == created_at, AuditLog.id < entry_id))
+        )
+    return db.execute(query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit)).scalars().all()
@@ -1,6 +1,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
 from app.models.integration import Integration
 from app.models.organization import Organization
 from app.models.organization_member import OrganizationMember
@@ -8,29 +9,17 @@ from app.models.policy import Policy
 from app.models.project import Project
 from app.models.service import Service
 
+LATEST_LIMIT = 5
+COUNTS = ("org_count", "project_count", "service_count", "policy_count", "integration_count")
 
-def get_summary(db: Session, user_id: str) -> dict:
+
+def _shard_summary(db: Session, user_id: str) -> dict:
     org_ids = db.execute(
         select(OrganizationMember.org_id).where(OrganizationMember.user_id == user_id)
     ).scalars().all()
 
     if not org_ids:
-        return {
-            "org_count": 0,
-            "project_count": 0,
-            "service_count": 0,
-            "policy_count": 0,
-            "integration_count": 0,
-            "latest_projects": [],
-            "latest_services": [],
-            "setup_progress": {
-                "has_org": False,
-                "has_project": False,
-                "has_service": False,
-                "has_policy": False,
-                "has_integration": False,
-            },
-        }
+        return {**dict.fromkeys(COUNTS, 0), "latest_projects": [], "latest_services": []}
 
     org_count = db.execute(select(func.count(Organization.id)).where(Organization.id.in_(org_ids))).scalar_one()
     project_count = db.execute(select(func.count(Project.id)).where(Project.org_id.in_(org_ids))).scalar_one()
@@ -44,14 +33,21 @@ def get_summary(db: Session, user_id: str) -> dict:
         service_count = 0
 
     latest_projects = (
-        db.execute(select(Project).where(Project.org_id.in_(org_ids)).order_by(Project.created_at.desc()).limit(5))
+        db.execute(
+            select(Project).where(Project.org_id.in_(org_ids)).order_by(Project.created_at.desc()).limit(LATEST_LIMIT)
+        )
         .scalars()
         .all()
     )
     latest_services = []
     if project_ids:
         latest_services = (
-            db.execute(select(Service).where(Service.project_id.in_(project_ids)).order_by(Service.created_at.desc()).limit(5))
+            db.execute(
+                select(Service)
+                .where(Service.project_id.in_(project_ids))
+                .order_by(Service.created_at.desc())
+                .limit(LATEST_LIMIT)
+            )
             .scalars()
             .all()
         )
@@ -64,11 +60,29 @@ def get_summary(db: Session, user_id: str) -> dict:
         "integration_count": integration_count,
         "latest_projects": latest_projects,
         "latest_services": latest_services,
+    }
+
+
+def _latest(parts: list[dict], key: str) -> list:
+    items = [item for part in parts for item in part[key]]
+    if len(parts) > 1:
+        items.sort(key=lambda item: item.created_at, reverse=True)
+    return items[:LATEST_LIMIT]
+
+
+def get_summary(db: Session, user_id: str) -> dict:
+    # Each shard summarizes the user's orgs it holds; counts add up and the latest items merge by creation time.
+    parts = shard_router.fan_out(db, lambda session: _shard_summary(session, user_id))
+    summary = {key: sum(part[key] for part in parts) for key in COUNTS}
+    return {
+        **summary,
+        "latest_projects": _latest(parts, "latest_projects"),
+        "latest_services": _latest(parts, "latest_services"),
         "setup_progress": {
-            "has_org": org_count > 0,
-            "has_project": project_count > 0,
-            "has_service": service_count > 0,
-            "has_policy": policy_count > 0,
-            "has_integration": integration_count > 0,
+            "has_org": summary["org_count"] > 0,
+            "has_project": summary["project_count"] > 0,
+            "has_service": summary["service_count"] > 0,
+            "has_policy": summary["policy_count"] > 0,
+            "has_integration": summary["integration_count"] > 0,
         },
     }
@@ -1,13 +1,28 @@
+from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.events import publish_change, snapshot
+from app.crud.utils import fetch_all, invalid_config, select_columns
+from app.models.enums import IntegrationProvider
 from app.models.integration import Integration
+from app.schemas.configs import normalize_integration_config
 
 
-def list_integrations(db: Session, org_id: str) -> list[Integration]:
-    return db.execute(
-        select(Integration).where(Integration.org_id == org_id).order_by(Integration.created_at.desc())
-    ).scalars().all()
+def _normalize(provider: str, config_json: dict) -> dict:
+    try:
+        return normalize_integration_config(provider, config_json)
+    except ValidationError as exc:
+        raise invalid_config(f"{IntegrationProvider(provider).value} integration", exc) from exc
+
+
+def list_integrations(db: Session, org_id: str, columns: tuple[str, ...] | None = None) -> list[Integration]:
+    query = (
+        select_columns(Integration, columns)
+        .where(Integration.org_id == org_id)
+        .order_by(Integration.created_at.desc())
+    )
+    return fetch_all(db, query, columns)
 
 
 def get_integration(db: Session, integration_id: str) -> Integration | None:
@@ -21,10 +36,12 @@ def create_integration(
     config_json: dict,
     is_enabled: bool,
 ) -> Integration:
+    config_json = _normalize(provider, config_json)
     integration = Integration(org_id=org_id, provider=provider, config_json=config_json, is_enabled=is_enabled)
     db.add(integration)
     db.commit()
     db.refresh(integration)
+    publish_change(db, integration.org_id, "integration", "created", integration.id, snapshot(integration))
     return integration
 
 
@@ -35,18 +52,24 @@ def update_integration(
     config_json: dict | None,
     is_enabled: bool | None,
 ) -> Integration:
-    if provider is not None:
+    # Enabling revalidates too: rows disabled by migration 0002 still hold their invalid config.
+    if provider is not None or config_json is not None or (is_enabled and not integration.is_enabled):
+        provider = provider if provider is not None else integration.provider
+        integration.config_json = _normalize(
+            provider, config_json if config_json is not None else integration.config_json
+        )
         integration.provider = provider
-    if config_json is not None:
-        integration.config_json = config_json
     if is_enabled is not None:
         integration.is_enabled = is_enabled
     db.add(integration)
     db.commit()
     db.refresh(integration)
+    publish_change(db, integration.org_id, "integration", "updated", integration.id, snapshot(integration))
     return integration
 
 
 def delete_integration(db: Session, integration: Integration) -> None:
+    data = snapshot(integration)
     db.delete(integration)
     db.commit()
+    publish_change(db, data["org_id"], "integration", "deleted", data["id"], data)
@@ -2,7 +2,10 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
 from app.core.errors import AppException, ErrorCode
+from app.core.events import publish_change, snapshot
+from app.crud.user import mirror_user
 from app.models.organization_member import OrganizationMember
 from app.models.enums import OrgRole
 
@@ -28,7 +31,18 @@ def get_member_by_user(db: Session, org_id: str, user_id: str) -> OrganizationMe
     ).scalar_one_or_none()
 
 
+def get_members_for_user(db: Session, user_id: str, org_ids: list[str]) -> dict[str, OrganizationMember]:
+    query = select(OrganizationMember).where(
+        OrganizationMember.user_id == user_id, OrganizationMember.org_id.in_(org_ids)
+    )
+    found = {}
+    for members in shard_router.fan_out(db, lambda session: session.execute(query).scalars().all()):
+        found.update((member.org_id, member) for member in members)
+    return found
+
+
 def add_member(db: Session, org_id: str, user_id: str, role: OrgRole) -> OrganizationMember:
+    mirror_user(db, user_id, db.info.get("shard", 0))
     member = OrganizationMember(org_id=org_id, user_id=user_id, role=role)
     db.add(member)
     try:
@@ -37,6 +51,7 @@ def add_member(db: Session, org_id: str, user_id: str, role: OrgRole) -> Organiz
         db.rollback()
         raise AppException(409, ErrorCode.CONFLICT, "User already in organization") from exc
     db.refresh(member)
+    publish_change(db, member.org_id, "member", "created", member.id, snapshot(member))
     return member
 
 
@@ -45,9 +60,12 @@ def update_member(db: Session, member: OrganizationMember, role: OrgRole) -> Org
     db.add(member)
     db.commit()
     db.refresh(member)
+    publish_change(db, member.org_id, "member", "updated", member.id, snapshot(member))
     return member
 
 
 def delete_member(db: Session, member: OrganizationMember) -> None:
+    data = snapshot(member)
     db.delete(member)
     db.commit()
+    publish_change(db, data["org_id"], "member", "deleted", data["id"], data)
@@ -2,20 +2,31 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
 from app.core.errors import AppException, ErrorCode
+from app.core.events import publish_change, snapshot
+from app.core.ids import new_id
+from app.crud.user import mirror_user
+from app.crud.utils import fetch_all, select_columns
 from app.models.organization import Organization
 from app.models.organization_member import OrganizationMember
 from app.models.enums import OrgRole
 
 
-def list_orgs_for_user(db: Session, user_id: str) -> list[Organization]:
+def list_orgs_for_user(db: Session, user_id: str, columns: tuple[str, ...] | None = None) -> list[Organization]:
+    if shard_router.enabled and columns is not None and "created_at" not in columns:
+        # Needed to merge shards in order; sparse models ignore the extra key.
+        columns = (*columns, "created_at")
     query = (
-        select(Organization)
+        select_columns(Organization, columns)
         .join(OrganizationMember, OrganizationMember.org_id == Organization.id)
         .where(OrganizationMember.user_id == user_id)
         .order_by(Organization.created_at.desc())
     )
-    return db.execute(query).scalars().all()
+    orgs = [org for rows in shard_router.fan_out(db, lambda session: fetch_all(session, query, columns)) for org in rows]
+    if shard_router.enabled:
+        orgs.sort(key=lambda org: org.created_at, reverse=True)
+    return orgs
 
 
 def get_org(db: Session, org_id: str) -> Organization | None:
@@ -23,7 +34,10 @@ def get_org(db: Session, org_id: str) -> Organization | None:
 
 
 def create_org(db: Session, name: str, owner_user_id: str) -> Organization:
-    org = Organization(name=name, owner_user_id=owner_user_id)
+    org = Organization(id=new_id(), name=name, owner_user_id=owner_user_id)
+    if shard_router.enabled:
+        db.info["shard"] = shard_router.assign(org.id)
+        mirror_user(db, owner_user_id, db.info["shard"])
     db.add(org)
     db.flush()
     member = OrganizationMember(org_id=org.id, user_id=owner_user_id, role=OrgRole.owner)
@@ -34,6 +48,7 @@ def create_org(db: Session, name: str, owner_user_id: str) -> Organization:
         db.rollback()
         raise AppException(409, ErrorCode.CONFLICT, "Organization already exists") from exc
     db.refresh(org)
+    publish_change(db, org.id, "organization", "created", org.id, snapshot(org))
     return org
 
 
@@ -43,9 +58,12 @@ def update_org(db: Session, org: Organization, name: str | None) -> Organization
     db.add(org)
     db.commit()
     db.refresh(org)
+    publish_change(db, org.id, "organization", "updated", org.id, snapshot(org))
     return org
 
 
 def delete_org(db: Session, org: Organization) -> None:
+    data = snapshot(org)
     db.delete(org)
     db.commit()
+    publish_change(db, data["id"], "organization", "deleted", data["id"], data)
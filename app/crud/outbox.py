@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.ids import new_id
+from app.models.enums import OutboxStatus
+from app.models.integration import Integration
+from app.models.integration_outbox import IntegrationOutbox
+
+MAX_RETRY_DELAY = timedelta(minutes=15)
+
+
+def list_enabled_integration_ids(db: Session, org_id: str) -> list[str]:
+    return db.execute(
+        select(Integration.id).where(Integration.org_id == org_id, Integration.is_enabled.is_(True))
+    ).scalars().all()
+
+
+def enqueue(db: Session, entries: list[tuple[str, str, str, dict]]) -> None:
+    # entries are (integration_id, org_id, event_type, payload), written in one statement and one commit.
+    now = datetime.now(timezone.utc)
+    db.execute(
+        insert(IntegrationOutbox),
+        [
+            {
+                "id": new_id(),
+                "integration_id": integration_id,
+                "org_id": org_id,
+                "event_type": event_type,
+                "payload": payload,
+                "status": OutboxStatus.PENDING,
+                "attempts": 0,
+                "next_attempt_at": now,
+            }
+            for integration_id, org_id, event_type, payload in entries
+        ],
+    )
+    db.commit()
+
+
+def claim_due(db: Session, worker_id: str, limit: int, lease_seconds: float) -> list[IntegrationOutbox]:
+    now = datetime.now(timezone.utc)
+    unlocked = or_(IntegrationOutbox.locked_until.is_(None), IntegrationOutbox.locked_until < now)
+    ids = db.execute(
+        select(IntegrationOutbox.id)
+        .where(
+            IntegrationOutbox.status == OutboxStatus.PENDING,
+            IntegrationOutbox.next_attempt_at <= now,
+            unlocked,
+        )
+        .order_by(IntegrationOutbox.created_at, IntegrationOutbox.id)
+        .limit(limit)
+    ).scalars().all()
+    if not ids:
+        return []
+    # The conditional UPDATE makes the claim safe when several processes poll the same outbox.
+    claim = f"{worker_id}:{uuid4().hex[:16]}"
+    db.execute(
+        update(IntegrationOutbox)
+        .where(IntegrationOutbox.id.in_(ids), unlocked)
+        .values(locked_by=claim, locked_until=now + timedelta(seconds=lease_seconds))
+    )
+    db.commit()
+    return db.execute(
+        select(IntegrationOutbox).where(IntegrationOutbox.locked_by == claim).order_by(IntegrationOutbox.created_at)
+    ).scalars().all()
+
+
+def complete(db: Session, ids: list[str]) -> None:
+    db.execute(delete(IntegrationOutbox).where(IntegrationOutbox.id.in_(ids)))
+    db.commit()
+
+
+def release(db: Session, ids: list[str]) -> None:
+    db.execute(
+        update(IntegrationOutbox).where(IntegrationOutbox.id.in_(ids)).values(locked_by=None, locked_until=None)
+    )
+    db.commit()
+
+
+def prune_failed(db: Session, before: datetime) -> int:
+    result = db.execute(
+        delete(IntegrationOutbox).where(
+            IntegrationOutbox.status == OutboxStatus.FAILED, IntegrationOutbox.updated_at < before
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def fail(db: Session, ids: list[str], error: str, retry_in: timedelta | None, max_attempts: int) -> None:
+    rows = db.execute(select(IntegrationOutbox).where(IntegrationOutbox.id.in_(ids))).scalars().all()
+    now = datetime.now(timezone.utc)
+    for row in rows:
+        row.attempts += 1
+        row.last_error = error[:500]
+        row.locked_by = None
+        row.locked_until = None
+        if retry_in is None or row.attempts >= max_attempts:
+            row.status = OutboxStatus.FAILED
+        else:
+            row.next_attempt_at = now + min(retry_in * (2 ** (row.attempts - 1)), MAX_RETRY_DELAY)
+    db.commit()
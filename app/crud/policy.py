@@ -1,22 +1,54 @@
-from sqlalchemy import select
+from pydantic import ValidationError
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
+from app.core.events import publish_change, snapshot
+from app.crud.utils import fetch_all, invalid_config, select_columns
+from app.models.enums import OrgRole, PolicyType
+from app.models.organization_member import OrganizationMember
 from app.models.policy import Policy
+from app.schemas.configs import normalize_policy_config
 
 
-def list_policies(db: Session, org_id: str) -> list[Policy]:
-    return db.execute(select(Policy).where(Policy.org_id == org_id).order_by(Policy.created_at.desc())).scalars().all()
+def list_policies(db: Session, org_id: str, columns: tuple[str, ...] | None = None) -> list[Policy]:
+    query = select_columns(Policy, columns).where(Policy.org_id == org_id).order_by(Policy.created_at.desc())
+    return fetch_all(db, query, columns)
 
 
 def get_policy(db: Session, policy_id: str) -> Policy | None:
     return db.execute(select(Policy).where(Policy.id == policy_id)).scalar_one_or_none()
 
 
+def get_policies_for_user(db: Session, ids: list[str], user_id: str) -> dict[str, tuple[Policy, OrgRole | None]]:
+    query = (
+        select(Policy, OrganizationMember.role)
+        .outerjoin(
+            OrganizationMember,
+            and_(OrganizationMember.org_id == Policy.org_id, OrganizationMember.user_id == user_id),
+        )
+        .where(Policy.id.in_(ids))
+    )
+    found = {}
+    for rows in shard_router.fan_out(db, lambda session: session.execute(query).all()):
+        found.update((policy.id, (policy, role)) for policy, role in rows)
+    return found
+
+
+def _normalize(policy_type: str, config_json: dict) -> dict:
+    try:
+        return normalize_policy_config(policy_type, config_json)
+    except ValidationError as exc:
+        raise invalid_config(f"{PolicyType(policy_type).value} policy", exc) from exc
+
+
 def create_policy(db: Session, org_id: str, policy_type: str, config_json: dict, is_enabled: bool) -> Policy:
+    config_json = _normalize(policy_type, config_json)
     policy = Policy(org_id=org_id, type=policy_type, config_json=config_json, is_enabled=is_enabled)
     db.add(policy)
     db.commit()
     db.refresh(policy)
+    publish_change(db, policy.org_id, "policy", "created", policy.id, snapshot(policy))
     return policy
 
 
@@ -27,18 +59,22 @@ def update_policy(
     config_json: dict | None,
     is_enabled: bool | None,
 ) -> Policy:
-    if policy_type is not None:
+    # Enabling revalidates too: rows disabled by migration 0002 still hold their invalid config.
+    if policy_type is not None or config_json is not None or (is_enabled and not policy.is_enabled):
+        policy_type = policy_type if policy_type is not None else policy.type
+        policy.config_json = _normalize(policy_type, config_json if config_json is not None else policy.config_json)
         policy.type = policy_type
-    if config_json is not None:
-        policy.config_json = config_json
     if is_enabled is not None:
         policy.is_enabled = is_enabled
     db.add(policy)
     db.commit()
     db.refresh(policy)
+    publish_change(db, policy.org_id, "policy", "updated", policy.id, snapshot(policy))
     return policy
 
 
 def delete_policy(db: Session, policy: Policy) -> None:
+    data = snapshot(policy)
     db.delete(policy)
     db.commit()
+    publish_change(db, data["org_id"], "policy", "deleted", data["id"], data)
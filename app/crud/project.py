@@ -1,9 +1,13 @@
-from sqlalchemy import or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
 from app.core.errors import AppException, ErrorCode
-from app.crud.utils import apply_sort, paginate
+from app.core.events import publish_change, snapshot
+from app.crud.utils import apply_sort, paginate, select_columns
+from app.models.enums import OrgRole
+from app.models.organization_member import OrganizationMember
 from app.models.project import Project
 
 
@@ -14,18 +18,42 @@ def list_projects(
     page_size: int,
     sort: str | None,
     q: str | None,
+    columns: tuple[str, ...] | None = None,
 ) -> tuple[list[Project], int]:
-    query = select(Project).where(Project.org_id == org_id)
+    query = select_columns(Project, columns).where(Project.org_id == org_id)
     if q:
         query = query.where(or_(Project.name.ilike(f"%{q}%"), Project.key.ilike(f"%{q}%")))
     query = apply_sort(query, Project, sort) if sort else query.order_by(Project.created_at.desc())
-    return paginate(db, query, page, page_size)
+    return paginate(db, query, page, page_size, columns)
 
 
 def get_project(db: Session, project_id: str) -> Project | None:
     return db.execute(select(Project).where(Project.id == project_id)).scalar_one_or_none()
 
 
+def get_project_orgs(db: Session, ids: list[str]) -> dict[str, str]:
+    query = select(Project.id, Project.org_id).where(Project.id.in_(ids))
+    found = {}
+    for rows in shard_router.fan_out(db, lambda session: session.execute(query).all()):
+        found.update((project_id, org_id) for project_id, org_id in rows)
+    return found
+
+
+def get_projects_for_user(db: Session, ids: list[str], user_id: str) -> dict[str, tuple[Project, OrgRole | None]]:
+    query = (
+        select(Project, OrganizationMember.role)
+        .outerjoin(
+            OrganizationMember,
+            and_(OrganizationMember.org_id == Project.org_id, OrganizationMember.user_id == user_id),
+        )
+        .where(Project.id.in_(ids))
+    )
+    found = {}
+    for rows in shard_router.fan_out(db, lambda session: session.execute(query).all()):
+        found.update((project.id, (project, role)) for project, role in rows)
+    return found
+
+
 def create_project(db: Session, org_id: str, name: str, key: str) -> Project:
     project = Project(org_id=org_id, name=name, key=key)
     db.add(project)
@@ -35,6 +63,7 @@ def create_project(db: Session, org_id: str, name: str, key: str) -> Project:
         db.rollback()
         raise AppException(409, ErrorCode.CONFLICT, "Project key already exists in org") from exc
     db.refresh(project)
+    publish_change(db, project.org_id, "project", "created", project.id, snapshot(project))
     return project
 
 
@@ -46,9 +75,12 @@ def update_project(db: Session, project: Project, name: str | None, key: str | N
     db.add(project)
     db.commit()
     db.refresh(project)
+    publish_change(db, project.org_id, "project", "updated", project.id, snapshot(project))
     return project
 
 
 def delete_project(db: Session, project: Project) -> None:
+    data = snapshot(project)
     db.delete(project)
     db.commit()
+    publish_change(db, data["org_id"], "project", "deleted", data["id"], data)
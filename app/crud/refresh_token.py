@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.ids import new_id
+from app.models.refresh_token import RefreshToken
+
+
+def _new_token(user_id: str, family_id: str) -> RefreshToken:
+    return RefreshToken(
+        jti=new_id(),
+        family_id=family_id,
+        user_id=user_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days),
+    )
+
+
+def get_token(db: Session, jti: str) -> RefreshToken | None:
+    return db.execute(select(RefreshToken).where(RefreshToken.jti == jti)).scalar_one_or_none()
+
+
+def create_family(db: Session, user_id: str) -> RefreshToken:
+    token = _new_token(user_id, new_id())
+    db.add(token)
+    db.commit()
+    return token
+
+
+def rotate(db: Session, token: RefreshToken) -> RefreshToken | None:
+    successor = _new_token(token.user_id, token.family_id)
+    # Only one caller can swap replaced_by from NULL, so concurrent refreshes with the same token cannot both win.
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == token.jti, RefreshToken.replaced_by.is_(None), RefreshToken.revoked_at.is_(None))
+        .values(replaced_by=successor.jti)
+    )
+    if result.rowcount != 1:
+        db.rollback()
+        return None
+    db.add(successor)
+    db.commit()
+    return successor
+
+
+def revoke_family(db: Session, family_id: str) -> datetime:
+    now = datetime.now(timezone.utc)
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    db.commit()
+    return now
+
+
+def revoke_user(db: Session, user_id: str) -> tuple[list[str], datetime]:
+    now = datetime.now(timezone.utc)
+    family_ids = db.execute(
+        select(RefreshToken.family_id)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .distinct()
+    ).scalars().all()
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    db.commit()
+    return family_ids, now
+
+
+def is_family_revoked(db: Session, family_id: str) -> bool:
+    query = select(RefreshToken.jti).where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_not(None))
+    return db.execute(query.limit(1)).first() is not None
+
+
+def list_revoked_since(db: Session, since: datetime) -> list[tuple[str, datetime]]:
+    return db.execute(
+        select(RefreshToken.family_id, func.max(RefreshToken.revoked_at))
+        .where(RefreshToken.revoked_at >= since)
+        .group_by(RefreshToken.family_id)
+    ).all()
+
+
+def purge_expired(db: Session) -> None:
+    db.execute(delete(RefreshToken).where(RefreshToken.expires_at < datetime.now(timezone.utc)))
+    db.commit()
@@ -1,7 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
-from app.crud.utils import apply_sort, paginate
+from app.core.database import shard_router
+from app.core.events import publish_change, snapshot
+from app.crud.utils import apply_sort, paginate, select_columns
+from app.models.enums import OrgRole
+from app.models.organization_member import OrganizationMember
+from app.models.project import Project
 from app.models.service import Service
 
 
@@ -12,18 +17,36 @@ def list_services(
     page_size: int,
     sort: str | None,
     q: str | None,
+    columns: tuple[str, ...] | None = None,
 ) -> tuple[list[Service], int]:
-    query = select(Service).where(Service.project_id == project_id)
+    query = select_columns(Service, columns).where(Service.project_id == project_id)
     if q:
         query = query.where(Service.name.ilike(f"%{q}%"))
     query = apply_sort(query, Service, sort) if sort else query.order_by(Service.created_at.desc())
-    return paginate(db, query, page, page_size)
+    return paginate(db, query, page, page_size, columns)
 
 
 def get_service(db: Session, service_id: str) -> Service | None:
     return db.execute(select(Service).where(Service.id == service_id)).scalar_one_or_none()
 
 
+def get_services_for_user(db: Session, ids: list[str], user_id: str) -> dict[str, tuple[Service, OrgRole | None]]:
+    # One query (per shard) for the rows and the caller's role in each owning org; a missing role means no access.
+    query = (
+        select(Service, OrganizationMember.role)
+        .join(Project, Project.id == Service.project_id)
+        .outerjoin(
+            OrganizationMember,
+            and_(OrganizationMember.org_id == Project.org_id, OrganizationMember.user_id == user_id),
+        )
+        .where(Service.id.in_(ids))
+    )
+    found = {}
+    for rows in shard_router.fan_out(db, lambda session: session.execute(query).all()):
+        found.update((service.id, (service, role)) for service, role in rows)
+    return found
+
+
 def create_service(
     db: Session, project_id: str, name: str, service_type: str, environment: str
 ) -> Service:
@@ -31,6 +54,7 @@ def create_service(
     db.add(service)
     db.commit()
     db.refresh(service)
+    publish_change(db, service.project.org_id, "service", "created", service.id, snapshot(service))
     return service
 
 
@@ -50,9 +74,13 @@ def update_service(
     db.add(service)
     db.commit()
     db.refresh(service)
+    publish_change(db, service.project.org_id, "service", "updated", service.id, snapshot(service))
     return service
 
 
 def delete_service(db: Session, service: Service) -> None:
+    org_id = service.project.org_id
+    data = snapshot(service)
     db.delete(service)
     db.commit()
+    publish_change(db, org_id, "service", "deleted", data["id"], data)
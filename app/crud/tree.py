@@ -0,0 +1,50 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import shard_router
+from app.models.organization import Organization
+from app.models.organization_member import OrganizationMember
+from app.models.project import Project
+from app.models.service import Service
+
+
+def load_tree(db: Session, user_id: str) -> list[dict]:
+    orgs = [org for part in shard_router.fan_out(db, lambda session: _load_shard(session, user_id)) for org in part]
+    if shard_router.enabled:
+        orgs.sort(key=lambda org: (org["name"], org["id"]))
+    return orgs
+
+
+def _load_shard(db: Session, user_id: str) -> list[dict]:
+    # Three set-based column queries regardless of how many orgs and projects the user sees.
+    orgs = [
+        {"id": org_id, "name": name, "role": role, "projects": []}
+        for org_id, name, role in db.execute(
+            select(Organization.id, Organization.name, OrganizationMember.role)
+            .join(OrganizationMember, OrganizationMember.org_id == Organization.id)
+            .where(OrganizationMember.user_id == user_id)
+            .order_by(Organization.name, Organization.id)
+        ).all()
+    ]
+    if not orgs:
+        return orgs
+    org_ids = [org["id"] for org in orgs]
+    by_org = {org["id"]: org["projects"] for org in orgs}
+    projects = {}
+    for project_id, org_id, name, key in db.execute(
+        select(Project.id, Project.org_id, Project.name, Project.key)
+        .where(Project.org_id.in_(org_ids))
+        .order_by(Project.name, Project.id)
+    ).all():
+        project = projects[project_id] = {"id": project_id, "name": name, "key": key, "services": []}
+        by_org[org_id].append(project)
+    for service_id, project_id, name, service_type, environment in db.execute(
+        select(Service.id, Service.project_id, Service.name, Service.type, Service.environment)
+        .join(Project, Project.id == Service.project_id)
+        .where(Project.org_id.in_(org_ids))
+        .order_by(Service.name, Service.id)
+    ).all():
+        projects[project_id]["services"].append(
+            {"id": service_id, "name": name, "type": service_type, "environment": environment}
+        )
+    return orgs
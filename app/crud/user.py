@@ -1,11 +1,16 @@
+import logging
+
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.database import shard_router
 from app.core.errors import AppException, ErrorCode
 from app.core.security import hash_password
 from app.models.user import User
 
+logger = logging.getLogger("polaris.lab.users")
+
 
 def get_by_email(db: Session, email: str) -> User | None:
     return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
@@ -24,4 +29,23 @@ def create_user(db: Session, email: str, password: str, name: str) -> User:
         db.rollback()
         raise AppException(409, ErrorCode.CONFLICT, "Email already exists") from exc
     db.refresh(user)
+    if shard_router.enabled:
+        try:
+            shard_router.broadcast(User, _mirror_row(user))
+        except Exception:
+            # The user is committed; mirror_user fills the shard in before the first write that needs it.
+            logger.exception("Copying user %s to the shards failed", user.id)
     return user
+
+
+def _mirror_row(user: User) -> dict:
+    # Shards keep a credential-less copy so org owner and member foreign keys resolve locally.
+    return {"id": user.id, "email": user.email, "password_hash": "", "name": user.name, "is_active": user.is_active}
+
+
+def mirror_user(db: Session, user_id: str, shard: int) -> None:
+    if shard == 0:
+        return
+    user = get_by_id(db, user_id)
+    if user is not None:
+        shard_router.mirror(User, _mirror_row(user), shard)
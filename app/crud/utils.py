@@ -1,8 +1,11 @@
 from typing import Any
 
-from sqlalchemy import Select, func
+from pydantic import ValidationError
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import Session
 
+from app.core.errors import AppException, ErrorCode
+
 
 def apply_sort(query: Select, model: Any, sort: str | None) -> Select:
     if not sort:
@@ -19,12 +22,58 @@ def apply_sort(query: Select, model: Any, sort: str | None) -> Select:
     return query.order_by(column.asc())
 
 
-def paginate(db: Session, query: Select, page: int, page_size: int) -> tuple[list[Any], int]:
+def select_columns(model: Any, columns: tuple[str, ...] | None) -> Select:
+    # Sparse fieldsets select plain columns, so rows come back as tuples without ORM identity-map hydration.
+    if columns is None:
+        return select(model)
+    return select(*(getattr(model, column) for column in columns))
+
+
+def fetch_all(db: Session, query: Select, columns: tuple[str, ...] | None) -> list[Any]:
+    result = db.execute(query)
+    return result.scalars().all() if columns is None else result.all()
+
+
+def load_children(
+    db: Session, model: Any, parent_column: Any, parent_ids: list[str], limit: int
+) -> tuple[dict[str, list[Any]], set[str]]:
+    # One query per include level for any number of parents. row_number() caps each parent's collection in SQL,
+    # which selectinload cannot do; one extra row per parent tells whether anything was cut off. Returns the
+    # children per parent and the ids of the parents whose collection was capped.
+    rank = func.row_number().over(partition_by=parent_column, order_by=(model.created_at.desc(), model.id))
+    ranked = select(model.id.label("id"), rank.label("rank")).where(parent_column.in_(parent_ids)).subquery()
+    rows = db.execute(
+        select(model).join(ranked, ranked.c.id == model.id).where(ranked.c.rank <= limit + 1).order_by(ranked.c.rank)
+    ).scalars().all()
+    children: dict[str, list[Any]] = {parent_id: [] for parent_id in parent_ids}
+    truncated = set()
+    for row in rows:
+        parent_id = getattr(row, parent_column.key)
+        items = children[parent_id]
+        if len(items) < limit:
+            items.append(row)
+        else:
+            truncated.add(parent_id)
+    return children, truncated
+
+
+def paginate(
+    db: Session, query: Select, page: int, page_size: int, columns: tuple[str, ...] | None = None
+) -> tuple[list[Any], int]:
     total = db.execute(select_count(query)).scalar_one()
     offset = (page - 1) * page_size
-    items = db.execute(query.limit(page_size).offset(offset)).scalars().all()
+    items = fetch_all(db, query.limit(page_size).offset(offset), columns)
     return items, total
 
 
 def select_count(query: Select) -> Select:
     return query.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+
+
+def invalid_config(label: str, exc: ValidationError) -> AppException:
+    return AppException(
+        422,
+        ErrorCode.VALIDATION_ERROR,
+        f"Invalid {label} config",
+        detail=exc.errors(include_url=False, include_context=False),
+    )
@@ -0,0 +1,415 @@
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, shard_router
+from app.core.events import ChangeEvent, event_bus
+from app.crud import integration as integration_crud
+from app.crud import outbox as outbox_crud
+from app.integrations.providers import NotDeliverable, build_request
+from app.models.enums import IntegrationProvider
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger("polaris.lab.integrations")
+
+RETRY_BASE = timedelta(seconds=2)
+LEASE_SECONDS = 300
+TARGET_CACHE_SECONDS = 30
+SENDER_IDLE_SECONDS = 60
+MAX_PERSIST_BACKOFF_SECONDS = 30
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxItem:
+    id: str
+    integration_id: str
+    payload: dict
+    shard: int = 0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _ids_by_shard(items: list[OutboxItem]) -> dict[int, list[str]]:
+    groups: dict[int, list[str]] = {}
+    for item in items:
+        groups.setdefault(item.shard, []).append(item.id)
+    return groups
+
+
+def _coalesce(events: list[dict]) -> list[dict]:
+    # Repeated changes to the same entity collapse into the latest one.
+    latest: dict[tuple, dict] = {}
+    for event in events:
+        key = (event.get("entity"), event.get("entity_id"), event.get("action") == "deleted")
+        latest.pop(key, None)
+        latest[key] = event
+    return list(latest.values())
+
+
+class IntegrationDispatcher:
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self.session_factory = session_factory
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"[:40]
+        self._targets: dict[str, tuple[list[str], float]] = {}
+        self._targets_lock = threading.Lock()
+        self._pending: deque[ChangeEvent] = deque()
+        self._pending_lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self.dropped = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._enqueued: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._writer: asyncio.Task | None = None
+        self._prune_at = 0.0
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._senders: dict[str, asyncio.Task] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._clients: dict[IntegrationProvider, "httpx.AsyncClient"] = {}
+
+    def _session(self, shard: int) -> Session:
+        # Outbox rows live on the shard of the integration they are delivered to.
+        db = self.session_factory()
+        if shard:
+            db.info["shard"] = shard
+        return db
+
+    def on_change(self, event: ChangeEvent) -> None:
+        if event.entity in ("integration", "organization"):
+            with self._targets_lock:
+                self._targets.pop(event.org_id, None)
+            if event.entity == "organization" and event.action == "deleted":
+                return
+        # Runs on the request thread inside publish: only buffer here, the writer task persists to the outbox.
+        with self._pending_lock:
+            self._pending.append(event)
+            overflow = len(self._pending) > settings.integration_pending_size
+            if overflow:
+                self._pending.popleft()
+                self.dropped += 1
+        if overflow:
+            logger.warning("Integration event buffer full, dropped the oldest event (%d dropped)", self.dropped)
+        self._signal(self._enqueued)
+
+    def pending(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def persist(self) -> int:
+        # Serialized, so a caller (flush, stop) returns only after events taken by a concurrent writer are stored.
+        with self._persist_lock:
+            return self._persist()
+
+    def _persist(self) -> int:
+        with self._pending_lock:
+            events = list(self._pending)
+            self._pending.clear()
+        by_shard: dict[int, list[ChangeEvent]] = {}
+        written = 0
+        grouped = False
+        try:
+            for event in events:
+                shard = shard_router.shard_for_org(event.org_id) if shard_router.enabled else 0
+                by_shard.setdefault(shard, []).append(event)
+            grouped = True
+            for shard in list(by_shard):
+                entries = [
+                    (integration_id, event.org_id, event.type, event.to_dict())
+                    for event in by_shard[shard]
+                    for integration_id in self._integration_ids(event.org_id, shard)
+                ]
+                if entries:
+                    with self._session(shard) as db:
+                        outbox_crud.enqueue(db, entries)
+                written += len(entries)
+                del by_shard[shard]
+        except Exception:
+            # Shards already committed are done; the rest go back to the front of the buffer for the next attempt.
+            unwritten = [event for group in by_shard.values() for event in group] if grouped else events
+            with self._pending_lock:
+                self._pending.extendleft(reversed(unwritten))
+                while len(self._pending) > settings.integration_pending_size:
+                    self._pending.popleft()
+                    self.dropped += 1
+            raise
+        return written
+
+    def _integration_ids(self, org_id: str, shard: int) -> list[str]:
+        now = time.monotonic()
+        cached = self._targets.get(org_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        with self._session(shard) as db:
+            integration_ids = outbox_crud.list_enabled_integration_ids(db, org_id)
+        with self._targets_lock:
+            self._targets[org_id] = (integration_ids, now + TARGET_CACHE_SECONDS)
+        return integration_ids
+
+    def _signal(self, event: asyncio.Event | None) -> None:
+        loop = self._loop
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass
+
+    def _wake(self) -> None:
+        self._signal(self._wakeup)
+
+    async def start(self, deliver: bool = True) -> None:
+        # The writer always runs, so a process with delivery disabled still fills the outbox for the others.
+        if self._writer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._enqueued = asyncio.Event()
+        self._enqueued.set()
+        self._writer = asyncio.create_task(self._write_loop())
+        if deliver:
+            self._wakeup = asyncio.Event()
+            self._wakeup.set()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._writer, self._task, *self._senders.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        pending = []
+        for queue in self._queues.values():
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+        for shard, ids in _ids_by_shard(pending).items():
+            await asyncio.to_thread(self._call, outbox_crud.release, ids, shard)
+        self._task = None
+        self._writer = None
+        self._loop = None
+        self._wakeup = None
+        self._enqueued = None
+        self._senders.clear()
+        self._queues.clear()
+        await self._close_clients()
+        # Whatever is still buffered goes to the outbox before the engine is disposed.
+        try:
+            await asyncio.to_thread(self.persist)
+        except Exception:
+            logger.exception("Outbox drain failed, %d event(s) lost", self.pending())
+
+    async def _write_loop(self) -> None:
+        delay = 0.0
+        while True:
+            if delay:
+                await asyncio.sleep(delay)
+            else:
+                await self._enqueued.wait()
+            self._enqueued.clear()
+            try:
+                if await asyncio.to_thread(self.persist):
+                    self._wake()
+                delay = 0.0
+            except Exception:
+                delay = min(max(delay * 2, 1.0), MAX_PERSIST_BACKOFF_SECONDS)
+                logger.exception("Writing integration events to the outbox failed, retrying in %.0f s", delay)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.integration_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                while await self.pump() >= settings.integration_batch_size:
+                    pass
+                if time.monotonic() >= self._prune_at:
+                    await asyncio.to_thread(self._prune)
+                    self._prune_at = time.monotonic() + PRUNE_INTERVAL_SECONDS
+            except Exception:
+                logger.exception("Integration outbox pump failed")
+
+    async def pump(self) -> int:
+        items = await asyncio.to_thread(self._claim)
+        overflow = []
+        for item in items:
+            try:
+                self._queue_for(item.integration_id).put_nowait(item)
+            except asyncio.QueueFull:
+                overflow.append(item)
+        # Backpressure: leave the rows in the outbox until this integration's queue drains.
+        for shard, ids in _ids_by_shard(overflow).items():
+            await asyncio.to_thread(self._call, outbox_crud.release, ids, shard)
+        return len(items) - len(overflow)
+
+    async def flush(self) -> int:
+        await asyncio.to_thread(self.persist)
+        delivered = 0
+        while True:
+            items = await asyncio.to_thread(self._claim)
+            if not items:
+                break
+            groups: dict[str, list[OutboxItem]] = {}
+            for item in items:
+                groups.setdefault(item.integration_id, []).append(item)
+            for integration_id, group in groups.items():
+                await self.deliver(integration_id, group)
+            delivered += len(items)
+        if self._task is None:
+            await self._close_clients()
+        return delivered
+
+    def _queue_for(self, integration_id: str) -> asyncio.Queue:
+        queue = self._queues.get(integration_id)
+        if queue is None:
+            queue = self._queues[integration_id] = asyncio.Queue(maxsize=settings.integration_queue_size)
+            self._senders[integration_id] = asyncio.create_task(self._send_loop(integration_id, queue))
+        return queue
+
+    async def _send_loop(self, integration_id: str, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        bucket = self._buckets.setdefault(
+            integration_id, TokenBucket(settings.integration_rate_per_second, settings.integration_rate_burst)
+        )
+        while True:
+            try:
+                first = await asyncio.wait_for(queue.get(), SENDER_IDLE_SECONDS)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    self._queues.pop(integration_id, None)
+                    self._senders.pop(integration_id, None)
+                    self._buckets.pop(integration_id, None)
+                    return
+                continue
+            batch = [first]
+            deadline = loop.time() + settings.integration_batch_window_ms / 1000
+            while len(batch) < settings.integration_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await bucket.acquire()
+            try:
+                await self.deliver(integration_id, batch)
+            except Exception:
+                logger.exception("Delivery to integration %s failed", integration_id)
+
+    async def deliver(self, integration_id: str, items: list[OutboxItem]) -> None:
+        # httpx is imported on first delivery, keeping it out of app import time.
+        import httpx
+
+        ids = [item.id for item in items]
+        shard = items[0].shard
+        target = await asyncio.to_thread(self._load_target, integration_id, shard)
+        if target is None:
+            await asyncio.to_thread(self._call, outbox_crud.complete, ids, shard)
+            return
+        provider, config_json = target
+        try:
+            request = build_request(provider, config_json, _coalesce([item.payload for item in items]))
+        except NotDeliverable as exc:
+            await asyncio.to_thread(self._fail, ids, str(exc), None, shard)
+            return
+        try:
+            response = await self._client(provider).post(
+                request.url, json=request.json, headers=request.headers, auth=request.auth
+            )
+        except httpx.HTTPError as exc:
+            await asyncio.to_thread(self._fail, ids, f"{type(exc).__name__}: {exc}", RETRY_BASE, shard)
+            return
+        if response.is_success:
+            await asyncio.to_thread(self._call, outbox_crud.complete, ids, shard)
+        elif response.status_code in (408, 425, 429) or response.status_code >= 500:
+            await asyncio.to_thread(self._fail, ids, f"HTTP {response.status_code}", RETRY_BASE, shard)
+        else:
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+            await asyncio.to_thread(self._fail, ids, error, None, shard)
+
+    def _client(self, provider: IntegrationProvider) -> "httpx.AsyncClient":
+        client = self._clients.get(provider)
+        if client is None:
+            import httpx
+
+            client = self._clients[provider] = httpx.AsyncClient(
+                timeout=settings.integration_http_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.integration_max_connections,
+                    max_keepalive_connections=settings.integration_max_connections,
+                ),
+            )
+        return client
+
+    async def _close_clients(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+    def _call(self, func: Callable, ids: list[str], shard: int = 0) -> None:
+        with self._session(shard) as db:
+            func(db, ids)
+
+    def _fail(self, ids: list[str], error: str, retry_in: timedelta | None, shard: int = 0) -> None:
+        logger.warning("Integration delivery failed for %d event(s): %s", len(ids), error)
+        with self._session(shard) as db:
+            outbox_crud.fail(db, ids, error, retry_in, settings.integration_max_attempts)
+
+    def _prune(self) -> None:
+        # FAILED rows are kept for inspection, then dropped so the outbox does not grow forever.
+        before = datetime.now(timezone.utc) - timedelta(hours=settings.integration_failed_retention_hours)
+        for shard in shard_router.shards():
+            with self._session(shard) as db:
+                pruned = outbox_crud.prune_failed(db, before)
+            if pruned:
+                logger.info("Pruned %d failed outbox row(s) on shard %d", pruned, shard)
+
+    def _claim(self) -> list[OutboxItem]:
+        items = []
+        for shard in shard_router.shards():
+            with self._session(shard) as db:
+                rows = outbox_crud.claim_due(db, self.worker_id, settings.integration_batch_size, LEASE_SECONDS)
+                items.extend(OutboxItem(row.id, row.integration_id, row.payload, shard) for row in rows)
+        return items
+
+    def _load_target(self, integration_id: str, shard: int = 0) -> tuple[IntegrationProvider, dict] | None:
+        with self._session(shard) as db:
+            integration = integration_crud.get_integration(db, integration_id)
+            if integration is None or not integration.is_enabled:
+                return None
+            return integration.provider, integration.config_json
+
+
+dispatcher = IntegrationDispatcher(SessionLocal)
+event_bus.add_listener(dispatcher.on_change)
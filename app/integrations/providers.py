@@ -0,0 +1,81 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.models.enums import IntegrationProvider
+from app.schemas.configs import GithubConfig, GitlabConfig, JiraConfig, SlackConfig, load_integration_config
+
+
+class NotDeliverable(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class OutboundRequest:
+    url: str
+    json: Any
+    headers: dict[str, str] = field(default_factory=dict)
+    auth: tuple[str, str] | None = None
+
+
+def _summary(events: list[dict]) -> str:
+    org_id = events[0].get("org_id", "")
+    lines = [f"Polaris Lab: {len(events)} change(s) in organization {org_id}"]
+    for event in events:
+        data = event.get("data") or {}
+        label = data.get("name") or data.get("key") or event.get("entity_id")
+        lines.append(f"- {event.get('type')} {label}")
+    return "\n".join(lines)
+
+
+def _slack(config: SlackConfig, events: list[dict]) -> OutboundRequest:
+    body: dict[str, Any] = {"text": _summary(events)}
+    if config.channel:
+        body["channel"] = config.channel
+    return OutboundRequest(url=config.webhook, json=body)
+
+
+def _github(config: GithubConfig, events: list[dict]) -> OutboundRequest:
+    if not config.repository:
+        raise NotDeliverable("GitHub integration has no repository configured")
+    return OutboundRequest(
+        url=f"{config.api_url}/repos/{config.repository}/dispatches",
+        json={"event_type": "polaris.changes", "client_payload": {"events": events}},
+        headers={"Authorization": f"Bearer {config.token}", "Accept": "application/vnd.github+json"},
+    )
+
+
+def _gitlab(config: GitlabConfig, events: list[dict]) -> OutboundRequest:
+    if not config.project_id:
+        raise NotDeliverable("GitLab integration has no project_id configured")
+    return OutboundRequest(
+        url=f"{config.api_url}/projects/{config.project_id}/trigger/pipeline",
+        json={
+            "token": config.token,
+            "ref": config.ref,
+            "variables": {"POLARIS_EVENTS": json.dumps(events, separators=(",", ":"), default=str)},
+        },
+    )
+
+
+def _jira(config: JiraConfig, events: list[dict]) -> OutboundRequest:
+    if not config.issue_key:
+        raise NotDeliverable("Jira integration has no issue_key configured")
+    return OutboundRequest(
+        url=f"{config.base_url}/rest/api/2/issue/{config.issue_key}/comment",
+        json={"body": _summary(events)},
+        auth=(config.email, config.api_token),
+    )
+
+
+BUILDERS: dict[IntegrationProvider, Callable[[Any, list[dict]], OutboundRequest]] = {
+    IntegrationProvider.SLACK: _slack,
+    IntegrationProvider.GITHUB: _github,
+    IntegrationProvider.GITLAB: _gitlab,
+    IntegrationProvider.JIRA: _jira,
+}
+
+
+def build_request(provider: IntegrationProvider, config_json: dict, events: list[dict]) -> OutboundRequest:
+    provider = IntegrationProvider(provider)
+    return BUILDERS[provider](load_integration_config(provider, config_json), events)
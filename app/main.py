@@ -1,13 +1,41 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.exceptions import RequestValidationError
 from fastapi import HTTPException
 
-from app.api.routes import auth, dashboard, integrations, orgs, policies, projects, services
+from app.api.routes import (
+    audit,
+    auth,
+    batch,
+    dashboard,
+    events,
+    health,
+    integrations,
+    me,
+    orgs,
+    policies,
+    projects,
+    services,
+)
+from app.core.audit import audit_writer
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.database import SessionLocal, dispose_engine, get_engine, replica_pool
 from app.core.errors import app_exception_handler, http_exception_handler, validation_exception_handler, AppException
-from app.core.middleware import RequestIdMiddleware
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.middleware import ReadYourWritesMiddleware, RequestIdMiddleware
+from app.core.openapi import load_openapi_cache
+from app.core.ratelimit import RateLimitMiddleware, rate_limiter
+from app.core.revocation import revocation_index
+from app.core.static import PrecompressedFiles
+from app.crud import refresh_token as refresh_token_crud
+from app.integrations.dispatcher import dispatcher
+from app.warmup import warm_up
 
 
 tags_metadata = [
@@ -18,8 +46,50 @@ tags_metadata = [
     {"name": "Policies", "description": "Policy configuration (SLA, Severity, PR Gate)."},
     {"name": "Integrations", "description": "Integrations (Git/Jira/Slack) configuration."},
     {"name": "Dashboard", "description": "Summary counts and setup progress."},
+    {"name": "Audit", "description": "Batched audit trail of organization changes."},
+    {"name": "Me", "description": "Views scoped to the current user."},
+    {"name": "Batch", "description": "Several API calls in one round-trip."},
+    {"name": "Events", "description": "Server-Sent Events change feed."},
+    {"name": "Health", "description": "Per-worker liveness and readiness probes."},
 ]
 
+
+def _sync_revocations() -> None:
+    with SessionLocal() as db:
+        revocation_index.merge(refresh_token_crud.list_revoked_since(db, revocation_index.window_start()))
+        refresh_token_crud.purge_expired(db)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    get_engine()
+    await asyncio.to_thread(_sync_revocations)
+    revocation_sync = asyncio.create_task(revocation_index.run(_sync_revocations, settings.revocation_sync_seconds))
+    replica_check = None
+    if replica_pool.enabled:
+        replica_check = asyncio.create_task(replica_pool.run(settings.replica_check_seconds))
+    await audit_writer.start()
+    await dispatcher.start(deliver=settings.integration_dispatch_enabled)
+    # The server starts accepting while warmup runs in the background; /readyz stays 503 until it finishes.
+    _app.state.ready = False
+    warmup = asyncio.create_task(warm_up(_app)) if settings.warmup_enabled else None
+    if warmup is None:
+        _app.state.ready = True
+    try:
+        yield
+    finally:
+        # Fail readiness first so load balancers stop routing here while in-flight requests drain.
+        _app.state.ready = False
+        if warmup is not None:
+            warmup.cancel()
+        revocation_sync.cancel()
+        if replica_check is not None:
+            replica_check.cancel()
+        await dispatcher.stop()
+        await audit_writer.stop()
+        dispose_engine()
+
+
 app = FastAPI(
     title="Polaris Lab Console API",
     description=(
@@ -27,12 +97,33 @@ app = FastAPI(
         "Standard response envelope:\n"
         "- success: { ok: true, data, meta: { request_id, paging? } }\n"
         "- error: { ok: false, error: { code, message, detail? }, meta: { request_id } }\n\n"
-        "Error codes: AUTH_REQUIRED, AUTH_INVALID, FORBIDDEN, NOT_FOUND, CONFLICT, VALIDATION_ERROR, BAD_REQUEST\n"
+        "Error codes: AUTH_REQUIRED, AUTH_INVALID, FORBIDDEN, NOT_FOUND, CONFLICT, VALIDATION_ERROR, BAD_REQUEST, "
+        "UNAVAILABLE, RATE_LIMITED\n"
     ),
     version="0.1.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
+# Innermost, so stored responses are uncompressed and every replay is encoded for the client asking.
+app.add_middleware(
+    IdempotencyMiddleware,
+    enabled=settings.idempotency_enabled,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_body_bytes=settings.idempotency_max_body_bytes,
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+app.add_middleware(
+    ReadYourWritesMiddleware,
+    window_seconds=settings.read_your_writes_seconds,
+    enabled=lambda: replica_pool.enabled,
+)
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
 app.add_middleware(RequestIdMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -53,11 +144,18 @@ app.include_router(services.router)
 app.include_router(policies.router)
 app.include_router(integrations.router)
 app.include_router(dashboard.router)
+app.include_router(audit.router)
+app.include_router(me.router)
+app.include_router(batch.router)
+app.include_router(events.router)
+app.include_router(health.router)
 
+console_dir = Path(settings.console_dir or Path(__file__).resolve().parent.parent / "test-client")
+if console_dir.is_dir():
+    app.mount("/console", PrecompressedFiles(console_dir, settings.console_cache_seconds), name="console")
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
+
+def build_openapi() -> dict:
     schema = get_openapi(
         title=app.title,
         version=app.version,
@@ -75,7 +173,13 @@ def custom_openapi():
             }
         },
     )
-    app.openapi_schema = schema
+    return schema
+
+
+def custom_openapi():
+    if app.openapi_schema:
+        return app.openapi_schema
+    app.openapi_schema = load_openapi_cache(settings.openapi_cache_path, app) or build_openapi()
     return app.openapi_schema
 
 
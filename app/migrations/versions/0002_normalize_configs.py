@@ -0,0 +1,165 @@
+"""normalize policy and integration configs
+
+Revision ID: 0002_normalize_configs
+Revises: 0001_initial
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import logging
+from enum import Enum
+from typing import Annotated, Any, Sequence, Union
+
+from alembic import op
+from pydantic import (
+    AfterValidator,
+    AnyHttpUrl,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+import sqlalchemy as sa
+
+
+revision: str = "0002_normalize_configs"
+down_revision: Union[str, None] = "0001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# The config schemas as of this revision, copied rather than imported so later changes to app.schemas.configs cannot
+# change what this migration does.
+
+
+class Severity(str, Enum):
+    INFO = "INFO"
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+    CRITICAL = "CRITICAL"
+
+
+_http_url = TypeAdapter(AnyHttpUrl)
+BaseUrl = Annotated[str, AfterValidator(lambda url: str(_http_url.validate_python(url)).rstrip("/"))]
+WebhookUrl = Annotated[str, AfterValidator(lambda url: str(_http_url.validate_python(url)))]
+
+DEFAULT_SCORE_THRESHOLDS = {Severity.LOW: 0.1, Severity.MEDIUM: 4.0, Severity.HIGH: 7.0, Severity.CRITICAL: 9.0}
+
+
+class ConfigModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_default=True)
+
+
+class SlaConfig(ConfigModel):
+    critical_days: int | None = Field(None, ge=0)
+    high_days: int | None = Field(None, ge=0)
+    medium_days: int | None = Field(None, ge=0)
+    low_days: int | None = Field(None, ge=0)
+    info_days: int | None = Field(None, ge=0)
+
+
+class SeverityMappingConfig(ConfigModel):
+    aliases: dict[str, Severity] = Field(default_factory=dict)
+    overrides: dict[str, Severity] = Field(default_factory=dict)
+    thresholds: dict[Severity, float] = Field(default_factory=lambda: dict(DEFAULT_SCORE_THRESHOLDS))
+
+    @field_validator("aliases")
+    @classmethod
+    def _lowercase_aliases(cls, value: dict[str, Severity]) -> dict[str, Severity]:
+        return {alias.lower(): severity for alias, severity in value.items()}
+
+    @field_validator("thresholds")
+    @classmethod
+    def _check_thresholds(cls, value: dict[Severity, float]) -> dict[Severity, float]:
+        for bound in value.values():
+            if not 0 <= bound <= 10:
+                raise ValueError("thresholds must be between 0 and 10")
+        return value
+
+
+class PrGateConfig(ConfigModel):
+    block_on: list[Severity] = Field(default_factory=list)
+    max_counts: dict[Severity, int] = Field(default_factory=dict)
+    block_on_sla_breach: bool = False
+
+    @field_validator("block_on")
+    @classmethod
+    def _dedupe_block_on(cls, value: list[Severity]) -> list[Severity]:
+        return sorted(set(value), key=list(Severity).index)
+
+    @field_validator("max_counts")
+    @classmethod
+    def _check_max_counts(cls, value: dict[Severity, int]) -> dict[Severity, int]:
+        if any(limit < 0 for limit in value.values()):
+            raise ValueError("max_counts must be non-negative")
+        return value
+
+
+class GithubConfig(ConfigModel):
+    token: str = Field(..., min_length=1)
+    repository: str | None = Field(None, pattern=r"^[\w.-]+/[\w.-]+$")
+    api_url: BaseUrl = "https://api.github.com"
+
+
+class GitlabConfig(ConfigModel):
+    token: str = Field(..., min_length=1)
+    project_id: str | None = None
+    ref: str = Field("main", min_length=1)
+    api_url: BaseUrl = "https://gitlab.com/api/v4"
+
+
+class JiraConfig(ConfigModel):
+    base_url: BaseUrl
+    email: str = Field(..., min_length=3)
+    api_token: str = Field(..., min_length=1)
+    issue_key: str | None = Field(None, pattern=r"^[A-Z][A-Z0-9_]+-\d+$")
+
+
+class SlackConfig(ConfigModel):
+    webhook: WebhookUrl
+    channel: str | None = None
+
+
+POLICY_CONFIGS = {"SLA": SlaConfig, "SEVERITY_MAPPING": SeverityMappingConfig, "PR_GATE": PrGateConfig}
+INTEGRATION_CONFIGS = {"GITHUB": GithubConfig, "GITLAB": GitlabConfig, "JIRA": JiraConfig, "SLACK": SlackConfig}
+
+
+def _normalizer(configs: dict[str, type[ConfigModel]]):
+    def _normalize(kind: Any, config: dict) -> dict:
+        # Enum members come back from the String column as plain values.
+        model = configs[getattr(kind, "value", kind)]
+        return model.model_validate(config).model_dump(mode="json", exclude_none=True)
+
+    return _normalize
+
+
+def _normalize_table(table_name: str, kind_column: str, normalize) -> None:
+    table = sa.table(
+        table_name,
+        sa.column("id", sa.String(36)),
+        sa.column(kind_column, sa.String(32)),
+        sa.column("config_json", sa.JSON()),
+        sa.column("is_enabled", sa.Boolean()),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(table.c.id, table.c[kind_column], table.c.config_json)).all()
+    for row_id, kind, config in rows:
+        try:
+            values = {"config_json": normalize(kind, config or {})}
+        except ValidationError:
+            # Readers trust stored configs, so invalid legacy rows are switched off rather than evaluated.
+            logger.warning("Disabling %s %s with invalid config", table_name, row_id)
+            values = {"is_enabled": False}
+        bind.execute(sa.update(table).where(table.c.id == row_id).values(**values))
+
+
+def upgrade() -> None:
+    _normalize_table("polaris_policies", "type", _normalizer(POLICY_CONFIGS))
+    _normalize_table("polaris_integrations", "provider", _normalizer(INTEGRATION_CONFIGS))
+
+
+def downgrade() -> None:
+    pass
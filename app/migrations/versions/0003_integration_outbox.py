@@ -0,0 +1,46 @@
+"""integration outbox
+
+Revision ID: 0003_integration_outbox
+Revises: 0002_normalize_configs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003_integration_outbox"
+down_revision: Union[str, None] = "0002_normalize_configs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "polaris_integration_outbox",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("integration_id", sa.String(length=36), nullable=False),
+        sa.Column("org_id", sa.String(length=36), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.Enum("PENDING", "FAILED", name="polaris_outboxstatus"), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("locked_by", sa.String(length=64), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["integration_id"], ["polaris_integrations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_polaris_outbox_due", "polaris_integration_outbox", ["status", "next_attempt_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_polaris_outbox_due", table_name="polaris_integration_outbox")
+    op.drop_table("polaris_integration_outbox")
@@ -0,0 +1,43 @@
+"""refresh token families
+
+Revision ID: 0004_refresh_tokens
+Revises: 0003_integration_outbox
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004_refresh_tokens"
+down_revision: Union[str, None] = "0003_integration_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "polaris_refresh_tokens",
+        sa.Column("jti", sa.String(length=36), nullable=False),
+        sa.Column("family_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("replaced_by", sa.String(length=36), nullable=True),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["polaris_users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index("ix_polaris_refresh_tokens_family_id", "polaris_refresh_tokens", ["family_id"], unique=False)
+    op.create_index("ix_polaris_refresh_tokens_user_id", "polaris_refresh_tokens", ["user_id"], unique=False)
+    op.create_index("ix_polaris_refresh_tokens_revoked_at", "polaris_refresh_tokens", ["revoked_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_polaris_refresh_tokens_revoked_at", table_name="polaris_refresh_tokens")
+    op.drop_index("ix_polaris_refresh_tokens_user_id", table_name="polaris_refresh_tokens")
+    op.drop_index("ix_polaris_refresh_tokens_family_id", table_name="polaris_refresh_tokens")
+    op.drop_table("polaris_refresh_tokens")
@@ -0,0 +1,40 @@
+"""audit log
+
+Revision ID: 0005_audit_log
+Revises: 0004_refresh_tokens
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005_audit_log"
+down_revision: Union[str, None] = "0004_refresh_tokens"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "polaris_audit_logs",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("org_id", sa.String(length=36), nullable=False),
+        sa.Column("actor_id", sa.String(length=36), nullable=True),
+        sa.Column("entity", sa.String(length=32), nullable=False),
+        sa.Column("action", sa.String(length=16), nullable=False),
+        sa.Column("entity_id", sa.String(length=36), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_polaris_audit_logs_org_created", "polaris_audit_logs", ["org_id", "created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_polaris_audit_logs_org_created", table_name="polaris_audit_logs")
+    op.drop_table("polaris_audit_logs")
@@ -0,0 +1,105 @@
+"""binary ids
+
+Revision ID: 0006_binary_ids
+Revises: 0005_audit_log
+Create Date: 2026-10-19 00:00:00.000000
+
+Converts every id column to 16-byte storage when ID_STORAGE=binary on MySQL (BINARY(16)) or PostgreSQL (uuid);
+otherwise it only records the revision. Set ID_STORAGE before upgrading: switching it later means downgrading to
+0005_audit_log and upgrading again with the new value.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import binary_ids
+
+
+revision: str = "0006_binary_ids"
+down_revision: Union[str, None] = "0005_audit_log"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> {column: nullable}
+ID_COLUMNS: dict[str, dict[str, bool]] = {
+    "polaris_users": {"id": False},
+    "polaris_organizations": {"id": False, "owner_user_id": False},
+    "polaris_organization_members": {"id": False, "org_id": False, "user_id": False},
+    "polaris_projects": {"id": False, "org_id": False},
+    "polaris_services": {"id": False, "project_id": False},
+    "polaris_policies": {"id": False, "org_id": False},
+    "polaris_integrations": {"id": False, "org_id": False},
+    "polaris_integration_outbox": {"id": False, "integration_id": False, "org_id": False},
+    "polaris_refresh_tokens": {"jti": False, "family_id": False, "user_id": False, "replaced_by": True},
+    "polaris_audit_logs": {"id": False, "org_id": False, "actor_id": True, "entity_id": False},
+}
+
+MYSQL_TO_TEXT = "LOWER(INSERT(INSERT(INSERT(INSERT(HEX({col}), 9, 0, '-'), 14, 0, '-'), 19, 0, '-'), 24, 0, '-'))"
+
+
+def _drop_foreign_keys() -> list[tuple[str, dict]]:
+    # Both databases refuse to change a column type while a foreign key pins it to another column.
+    inspector = sa.inspect(op.get_bind())
+    dropped = []
+    for table in ID_COLUMNS:
+        for fk in inspector.get_foreign_keys(table):
+            op.drop_constraint(fk["name"], table, type_="foreignkey")
+            dropped.append((table, fk))
+    return dropped
+
+
+def _restore_foreign_keys(dropped: list[tuple[str, dict]]) -> None:
+    for table, fk in dropped:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            ondelete=fk.get("options", {}).get("ondelete"),
+        )
+
+
+def _null(nullable: bool) -> str:
+    return "NULL" if nullable else "NOT NULL"
+
+
+def _convert(to_binary: bool) -> None:
+    dialect = op.get_context().dialect.name
+    dropped = _drop_foreign_keys()
+    for table, columns in ID_COLUMNS.items():
+        if dialect == "postgresql":
+            target = "uuid USING {col}::uuid" if to_binary else "varchar(36) USING {col}::text"
+            op.execute(
+                f"ALTER TABLE {table} "
+                + ", ".join(f"ALTER COLUMN {col} TYPE {target.format(col=col)}" for col in columns)
+            )
+            continue
+        # VARBINARY first so the text is reinterpreted as bytes, then rewritten in place and narrowed.
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"MODIFY {col} VARBINARY(36) {_null(nullable)}" for col, nullable in columns.items())
+        )
+        if to_binary:
+            values = ", ".join(f"{col} = UNHEX(REPLACE({col}, '-', ''))" for col in columns)
+            final = "BINARY(16)"
+        else:
+            values = ", ".join(f"{col} = {MYSQL_TO_TEXT.format(col=col)}" for col in columns)
+            final = "VARCHAR(36)"
+        op.execute(f"UPDATE {table} SET {values}")
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"MODIFY {col} {final} {_null(nullable)}" for col, nullable in columns.items())
+        )
+    _restore_foreign_keys(dropped)
+
+
+def upgrade() -> None:
+    if binary_ids(op.get_context().dialect):
+        _convert(to_binary=True)
+
+
+def downgrade() -> None:
+    if binary_ids(op.get_context().dialect):
+        _convert(to_binary=False)
@@ -0,0 +1,34 @@
+"""org shard directory
+
+Revision ID: 0007_org_shards
+Revises: 0006_binary_ids
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import Id
+
+
+revision: str = "0007_org_shards"
+down_revision: Union[str, None] = "0006_binary_ids"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "polaris_org_shards",
+        sa.Column("org_id", Id(), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("org_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("polaris_org_shards")
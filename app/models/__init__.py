@@ -1,24 +1,33 @@
+from app.models.audit_log import AuditLog
 from app.models.base import Base
-from app.models.enums import EnvironmentType, IntegrationProvider, OrgRole, PolicyType, ServiceType
+from app.models.enums import EnvironmentType, IntegrationProvider, OrgRole, OutboxStatus, PolicyType, ServiceType
 from app.models.integration import Integration
+from app.models.integration_outbox import IntegrationOutbox
+from app.models.org_shard import OrgShard
 from app.models.organization import Organization
 from app.models.organization_member import OrganizationMember
 from app.models.policy import Policy
 from app.models.project import Project
+from app.models.refresh_token import RefreshToken
 from app.models.service import Service
 from app.models.user import User
 
 __all__ = [
+    "AuditLog",
     "Base",
     "EnvironmentType",
     "Integration",
+    "IntegrationOutbox",
     "IntegrationProvider",
     "OrgRole",
+    "OrgShard",
     "Organization",
     "OrganizationMember",
+    "OutboxStatus",
     "Policy",
     "PolicyType",
     "Project",
+    "RefreshToken",
     "Service",
     "ServiceType",
     "User",
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.ids import new_id
+from app.models.base import Base
+from app.models.types import Id
+
+
+class AuditLog(Base):
+    # No foreign keys: entries must outlive the organizations, users and objects they describe.
+    __tablename__ = "polaris_audit_logs"
+    __table_args__ = (Index("ix_polaris_audit_logs_org_created", "org_id", "created_at", "id"),)
+
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
+    org_id: Mapped[str] = mapped_column(Id, nullable=False)
+    actor_id: Mapped[str | None] = mapped_column(Id, nullable=True)
+    entity: Mapped[str] = mapped_column(String(32), nullable=False)
+    action: Mapped[str] = mapped_column(String(16), nullable=False)
+    entity_id: Mapped[str] = mapped_column(Id, nullable=False)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -31,3 +31,21 @@ class IntegrationProvider(str, Enum):
     GITLAB = "GITLAB"
     JIRA = "JIRA"
     SLACK = "SLACK"
+
+
+class Severity(str, Enum):
+    INFO = "INFO"
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+    CRITICAL = "CRITICAL"
+
+
+class GateDecision(str, Enum):
+    PASS = "PASS"
+    BLOCK = "BLOCK"
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "PENDING"
+    FAILED = "FAILED"
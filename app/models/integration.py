@@ -1,17 +1,17 @@
-from uuid import uuid4
-
-from sqlalchemy import Boolean, Enum, ForeignKey, JSON, String
+from sqlalchemy import Boolean, Enum, ForeignKey, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import new_id
 from app.models.base import Base, TimestampMixin
 from app.models.enums import IntegrationProvider
+from app.models.types import Id
 
 
 class Integration(Base, TimestampMixin):
     __tablename__ = "polaris_integrations"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    org_id: Mapped[str] = mapped_column(String(36), ForeignKey("polaris_organizations.id"), nullable=False)
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
+    org_id: Mapped[str] = mapped_column(Id, ForeignKey("polaris_organizations.id"), nullable=False)
     provider: Mapped[IntegrationProvider] = mapped_column(
         Enum(IntegrationProvider, name="polaris_integrationprovider"), nullable=False
     )
@@ -19,3 +19,4 @@ class Integration(Base, TimestampMixin):
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     organization = relationship("Organization", back_populates="integrations")
+    outbox = relationship("IntegrationOutbox", back_populates="integration", passive_deletes=True)
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.ids import new_id
+from app.models.base import Base, TimestampMixin
+from app.models.enums import OutboxStatus
+from app.models.types import Id
+
+
+class IntegrationOutbox(Base, TimestampMixin):
+    __tablename__ = "polaris_integration_outbox"
+    __table_args__ = (Index("ix_polaris_outbox_due", "status", "next_attempt_at"),)
+
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
+    integration_id: Mapped[str] = mapped_column(
+        Id, ForeignKey("polaris_integrations.id", ondelete="CASCADE"), nullable=False
+    )
+    org_id: Mapped[str] = mapped_column(Id, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus, name="polaris_outboxstatus"), nullable=False, default=OutboxStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    locked_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    integration = relationship("Integration", back_populates="outbox")
@@ -0,0 +1,13 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+from app.models.types import Id
+
+
+class OrgShard(Base, TimestampMixin):
+    # Directory of which shard holds each organization; lives on the primary. Orgs without a row are on shard 0.
+    __tablename__ = "polaris_org_shards"
+
+    org_id: Mapped[str] = mapped_column(Id, primary_key=True)
+    shard: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,17 +1,17 @@
-from uuid import uuid4
-
 from sqlalchemy import ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import new_id
 from app.models.base import Base, TimestampMixin
+from app.models.types import Id
 
 
 class Organization(Base, TimestampMixin):
     __tablename__ = "polaris_organizations"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    owner_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("polaris_users.id"), nullable=False)
+    owner_user_id: Mapped[str] = mapped_column(Id, ForeignKey("polaris_users.id"), nullable=False)
 
     owner = relationship("User", back_populates="organizations")
     members = relationship("OrganizationMember", back_populates="organization", cascade="all, delete-orphan")
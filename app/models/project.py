@@ -1,17 +1,17 @@
-from uuid import uuid4
-
 from sqlalchemy import ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import new_id
 from app.models.base import Base, TimestampMixin
+from app.models.types import Id
 
 
 class Project(Base, TimestampMixin):
     __tablename__ = "polaris_projects"
     __table_args__ = (UniqueConstraint("org_id", "key", name="uq_polaris_project_key_org"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    org_id: Mapped[str] = mapped_column(String(36), ForeignKey("polaris_organizations.id"), nullable=False)
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
+    org_id: Mapped[str] = mapped_column(Id, ForeignKey("polaris_organizations.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     key: Mapped[str] = mapped_column(String(50), nullable=False)
 
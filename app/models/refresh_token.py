@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin
+from app.models.types import Id
+
+
+class RefreshToken(Base, TimestampMixin):
+    __tablename__ = "polaris_refresh_tokens"
+
+    jti: Mapped[str] = mapped_column(Id, primary_key=True)
+    family_id: Mapped[str] = mapped_column(Id, index=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(
+        Id, ForeignKey("polaris_users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    replaced_by: Mapped[str | None] = mapped_column(Id, nullable=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True, nullable=True)
+
+    user = relationship("User", back_populates="refresh_tokens")
@@ -0,0 +1,44 @@
+from uuid import UUID
+
+from sqlalchemy import BINARY, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+BINARY_DIALECTS = frozenset({"mysql", "mariadb", "postgresql"})
+
+
+def binary_ids(dialect: Dialect) -> bool:
+    # Imported here so the models stay importable without a configured environment.
+    from app.core.config import settings
+
+    return settings.id_storage == "binary" and dialect.name in BINARY_DIALECTS
+
+
+class Id(TypeDecorator):
+    # Canonical UUID strings in Python. With ID_STORAGE=binary, MySQL stores 16 raw bytes (BINARY(16)) and
+    # PostgreSQL its native uuid; other databases keep String(36).
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect):
+        if not binary_ids(dialect):
+            return dialect.type_descriptor(String(36))
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value, dialect: Dialect):
+        if value is None or not binary_ids(dialect):
+            return value
+        try:
+            parsed = UUID(str(value))
+        except ValueError:
+            # A malformed id from a URL cannot match any row; NULL keeps lookups a 404 instead of a driver error.
+            return None
+        return str(parsed) if dialect.name == "postgresql" else parsed.bytes
+
+    def process_result_value(self, value, dialect: Dialect):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(UUID(bytes=bytes(value)))
+        return value if value is None else str(value)
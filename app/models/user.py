@@ -1,15 +1,15 @@
-from uuid import uuid4
-
 from sqlalchemy import Boolean, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import new_id
 from app.models.base import Base, TimestampMixin
+from app.models.types import Id
 
 
 class User(Base, TimestampMixin):
     __tablename__ = "polaris_users"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(Id, primary_key=True, default=new_id)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -17,3 +17,4 @@ class User(Base, TimestampMixin):
 
     organizations = relationship("Organization", back_populates="owner")
     memberships = relationship("OrganizationMember", back_populates="user")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", passive_deletes=True)
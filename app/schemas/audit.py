@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuditEntryOut(BaseModel):
+    id: str
+    org_id: str
+    actor_id: str | None
+    entity: str
+    action: str
+    entity_id: str
+    data: dict[str, Any]
+    created_at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": "audit-uuid",
+                "org_id": "org-uuid",
+                "actor_id": "user-uuid",
+                "entity": "policy",
+                "action": "updated",
+                "entity_id": "policy-uuid",
+                "data": {"id": "policy-uuid", "type": "SLA", "is_enabled": True},
+                "created_at": "2026-01-01T00:00:00Z",
+            }
+        },
+    )
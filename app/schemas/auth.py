@@ -59,3 +59,10 @@ class TokenPair(BaseModel):
             }
         }
     )
+
+
+class StreamTicketOut(BaseModel):
+    ticket: str
+    expires_in: int
+
+    model_config = ConfigDict(json_schema_extra={"example": {"ticket": "<stream_ticket>", "expires_in": 30}})
@@ -0,0 +1,38 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BatchItem(BaseModel):
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(..., description="Path under /api/, with an optional query string.")
+    body: Any | None = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchItem] = Field(..., min_length=1)
+    parallel: bool = Field(False, description="Run consecutive GET requests concurrently.")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "requests": [
+                    {"method": "GET", "path": "/api/orgs/org-uuid"},
+                    {"method": "GET", "path": "/api/orgs/org-uuid/projects?page_size=5"},
+                    {"method": "POST", "path": "/api/orgs/org-uuid/policies", "body": {"type": "SLA", "config_json": {}}},
+                ],
+                "parallel": True,
+            }
+        }
+    )
+
+
+class BatchResult(BaseModel):
+    status: int
+    body: Any | None = None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"status": 200, "body": {"ok": True, "data": {"id": "org-uuid"}, "meta": {"request_id": "r.0"}}}
+        }
+    )
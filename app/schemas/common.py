@@ -18,9 +18,19 @@ class Paging(BaseModel):
     )
 
 
+class CursorPaging(BaseModel):
+    page_size: int
+    has_next: bool
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"page_size": 50, "has_next": True, "next_cursor": "MjAyNi0wMS0wMVQwMDowMDowMHxhYmM"}}
+    )
+
+
 class ResponseMeta(BaseModel):
     request_id: str
-    paging: Optional[Paging] = None
+    paging: Optional[Paging | CursorPaging] = None
 
     model_config = ConfigDict(
         json_schema_extra={"example": {"request_id": "req-123", "paging": None}}
@@ -49,6 +59,24 @@ class ErrorDetail(BaseModel):
     detail: Any | None = None
 
 
+class MultiGetItem(BaseModel, Generic[T]):
+    id: str
+    ok: bool
+    data: Optional[T] = None
+    error: Optional[ErrorDetail] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "9b2f6a0e-0000-4000-8000-000000000000",
+                "ok": False,
+                "data": None,
+                "error": {"code": "FORBIDDEN", "message": "Not a member of this organization", "detail": None},
+            }
+        }
+    )
+
+
 class ErrorResponse(BaseModel):
     ok: bool = False
     error: ErrorDetail
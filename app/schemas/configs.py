@@ -0,0 +1,120 @@
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, AnyHttpUrl, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+from app.models.enums import IntegrationProvider, PolicyType, Severity
+
+_http_url = TypeAdapter(AnyHttpUrl)
+BaseUrl = Annotated[str, AfterValidator(lambda url: str(_http_url.validate_python(url)).rstrip("/"))]
+WebhookUrl = Annotated[str, AfterValidator(lambda url: str(_http_url.validate_python(url)))]
+
+DEFAULT_SCORE_THRESHOLDS = {Severity.LOW: 0.1, Severity.MEDIUM: 4.0, Severity.HIGH: 7.0, Severity.CRITICAL: 9.0}
+
+
+class ConfigModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_default=True)
+
+
+class SlaConfig(ConfigModel):
+    critical_days: int | None = Field(None, ge=0, examples=[7])
+    high_days: int | None = Field(None, ge=0, examples=[30])
+    medium_days: int | None = Field(None, ge=0, examples=[90])
+    low_days: int | None = Field(None, ge=0, examples=[180])
+    info_days: int | None = Field(None, ge=0)
+
+
+class SeverityMappingConfig(ConfigModel):
+    aliases: dict[str, Severity] = Field(default_factory=dict, examples=[{"error": "HIGH", "warning": "MEDIUM"}])
+    overrides: dict[str, Severity] = Field(default_factory=dict, examples=[{"secret-leak": "CRITICAL"}])
+    thresholds: dict[Severity, float] = Field(
+        default_factory=lambda: dict(DEFAULT_SCORE_THRESHOLDS), examples=[{"CRITICAL": 9.0, "HIGH": 7.0}]
+    )
+
+    @field_validator("aliases")
+    @classmethod
+    def _lowercase_aliases(cls, value: dict[str, Severity]) -> dict[str, Severity]:
+        return {alias.lower(): severity for alias, severity in value.items()}
+
+    @field_validator("thresholds")
+    @classmethod
+    def _check_thresholds(cls, value: dict[Severity, float]) -> dict[Severity, float]:
+        for bound in value.values():
+            if not 0 <= bound <= 10:
+                raise ValueError("thresholds must be between 0 and 10")
+        return value
+
+
+class PrGateConfig(ConfigModel):
+    block_on: list[Severity] = Field(default_factory=list, examples=[["CRITICAL"]])
+    max_counts: dict[Severity, int] = Field(default_factory=dict, examples=[{"HIGH": 5}])
+    block_on_sla_breach: bool = False
+
+    @field_validator("block_on")
+    @classmethod
+    def _dedupe_block_on(cls, value: list[Severity]) -> list[Severity]:
+        return sorted(set(value), key=list(Severity).index)
+
+    @field_validator("max_counts")
+    @classmethod
+    def _check_max_counts(cls, value: dict[Severity, int]) -> dict[Severity, int]:
+        if any(limit < 0 for limit in value.values()):
+            raise ValueError("max_counts must be non-negative")
+        return value
+
+
+class GithubConfig(ConfigModel):
+    token: str = Field(..., min_length=1, examples=["ghp_xxx"])
+    repository: str | None = Field(None, pattern=r"^[\w.-]+/[\w.-]+$", examples=["polaris-lab/console"])
+    api_url: BaseUrl = Field("https://api.github.com", examples=["https://api.github.com"])
+
+
+class GitlabConfig(ConfigModel):
+    token: str = Field(..., min_length=1, examples=["glptt-xxx"])
+    project_id: str | None = Field(None, examples=["1234"])
+    ref: str = Field("main", min_length=1)
+    api_url: BaseUrl = Field("https://gitlab.com/api/v4", examples=["https://gitlab.com/api/v4"])
+
+
+class JiraConfig(ConfigModel):
+    base_url: BaseUrl = Field(..., examples=["https://polaris.atlassian.net"])
+    email: str = Field(..., min_length=3, examples=["bot@example.com"])
+    api_token: str = Field(..., min_length=1)
+    issue_key: str | None = Field(None, pattern=r"^[A-Z][A-Z0-9_]+-\d+$", examples=["SEC-1"])
+
+
+class SlackConfig(ConfigModel):
+    webhook: WebhookUrl = Field(..., examples=["https://hooks.slack.com/services/T000/B000/XXX"])
+    channel: str | None = Field(None, examples=["#security"])
+
+
+POLICY_CONFIGS: dict[PolicyType, type[ConfigModel]] = {
+    PolicyType.SLA: SlaConfig,
+    PolicyType.SEVERITY_MAPPING: SeverityMappingConfig,
+    PolicyType.PR_GATE: PrGateConfig,
+}
+
+INTEGRATION_CONFIGS: dict[IntegrationProvider, type[ConfigModel]] = {
+    IntegrationProvider.GITHUB: GithubConfig,
+    IntegrationProvider.GITLAB: GitlabConfig,
+    IntegrationProvider.JIRA: JiraConfig,
+    IntegrationProvider.SLACK: SlackConfig,
+}
+
+
+def normalize_policy_config(policy_type: PolicyType, config: dict[str, Any]) -> dict[str, Any]:
+    parsed = POLICY_CONFIGS[PolicyType(policy_type)].model_validate(config)
+    return parsed.model_dump(mode="json", exclude_none=True)
+
+
+def normalize_integration_config(provider: IntegrationProvider, config: dict[str, Any]) -> dict[str, Any]:
+    parsed = INTEGRATION_CONFIGS[IntegrationProvider(provider)].model_validate(config)
+    return parsed.model_dump(mode="json", exclude_none=True)
+
+
+def load_policy_config(policy_type: PolicyType, config: dict[str, Any]) -> ConfigModel:
+    # Stored configs were normalized on write, so readers skip validation.
+    return POLICY_CONFIGS[PolicyType(policy_type)].model_construct(**config)
+
+
+def load_integration_config(provider: IntegrationProvider, config: dict[str, Any]) -> ConfigModel:
+    return INTEGRATION_CONFIGS[IntegrationProvider(provider)].model_construct(**config)
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class CoalesceRouteOut(BaseModel):
+    requests: int
+    executions: int
+    coalesced: int
+    coalescing_ratio: float
+
+
+class CoalesceOut(BaseModel):
+    in_flight: int
+    routes: dict[str, CoalesceRouteOut]
+
+
+class HealthOut(BaseModel):
+    status: str
+    pid: int
+    worker: str | None = None
+    # Read coalescing counters for this worker since it started; only reported by /healthz.
+    coalescing: CoalesceOut | None = None
+
+    model_config = ConfigDict(json_schema_extra={"example": {"status": "ok", "pid": 4242, "worker": "1"}})
@@ -1,6 +1,9 @@
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.models.enums import OrgRole
+from app.schemas.integration import IntegrationOut
+from app.schemas.policy import PolicyOut
+from app.schemas.project import ProjectDetailOut
 
 
 class OrganizationCreate(BaseModel):
@@ -30,6 +33,13 @@ class OrganizationOut(BaseModel):
     )
 
 
+class OrganizationDetailOut(OrganizationOut):
+    projects: list[ProjectDetailOut] | None = None
+    policies: list[PolicyOut] | None = None
+    integrations: list[IntegrationOut] | None = None
+    truncated: list[str] | None = None
+
+
 class MemberOut(BaseModel):
     id: str
     org_id: str
@@ -1,8 +1,9 @@
+from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.models.enums import PolicyType
+from app.models.enums import GateDecision, PolicyType, Severity
 
 
 class PolicyCreate(BaseModel):
@@ -46,3 +47,72 @@ class PolicyOut(BaseModel):
             }
         },
     )
+
+
+class FindingIn(BaseModel):
+    id: str = Field(..., examples=["finding-1"])
+    severity: str | None = Field(None, examples=["HIGH"])
+    score: float | None = Field(None, ge=0, le=10, examples=[7.5])
+    rule_id: str | None = Field(None, examples=["sql-injection"])
+    detected_at: datetime | None = Field(None, examples=["2025-01-01T00:00:00Z"])
+
+
+class PolicyEvaluationRequest(BaseModel):
+    findings: list[FindingIn] = Field(..., max_length=50000)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "findings": [
+                    {"id": "finding-1", "severity": "HIGH", "rule_id": "sql-injection", "detected_at": "2025-01-01T00:00:00Z"},
+                    {"id": "finding-2", "score": 9.8},
+                ]
+            }
+        }
+    )
+
+
+class FindingDecision(BaseModel):
+    id: str
+    severity: Severity
+    sla_days: int | None
+    due_at: datetime | None
+    breached: bool
+    blocking: bool
+
+
+class GateResult(BaseModel):
+    decision: GateDecision
+    reasons: list[str]
+    counts: dict[str, int]
+    sla_breached: int
+
+
+class PolicyEvaluationOut(BaseModel):
+    gate: GateResult
+    policy_ids: dict[str, str]
+    findings: list[FindingDecision]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "gate": {
+                    "decision": "BLOCK",
+                    "reasons": ["1 CRITICAL finding(s) block merges"],
+                    "counts": {"INFO": 0, "LOW": 0, "MEDIUM": 0, "HIGH": 1, "CRITICAL": 1},
+                    "sla_breached": 0,
+                },
+                "policy_ids": {"PR_GATE": "policy-uuid"},
+                "findings": [
+                    {
+                        "id": "finding-2",
+                        "severity": "CRITICAL",
+                        "sla_days": 7,
+                        "due_at": None,
+                        "breached": False,
+                        "blocking": True,
+                    }
+                ],
+            }
+        }
+    )
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.service import ServiceOut
+
 
 class ProjectCreate(BaseModel):
     name: str = Field(..., examples=["Web Console"])
@@ -30,3 +32,9 @@ class ProjectOut(BaseModel):
             }
         },
     )
+
+
+class ProjectDetailOut(ProjectOut):
+    # Present only when requested with include=services; truncated lists collections capped at INCLUDE_MAX_ITEMS.
+    services: list[ServiceOut] | None = None
+    truncated: list[str] | None = None
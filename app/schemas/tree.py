@@ -0,0 +1,54 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.models.enums import EnvironmentType, OrgRole, ServiceType
+
+
+class TreeService(BaseModel):
+    id: str
+    name: str
+    type: ServiceType
+    environment: EnvironmentType
+
+
+class TreeProject(BaseModel):
+    id: str
+    name: str
+    key: str
+    services: list[TreeService]
+
+
+class TreeOrg(BaseModel):
+    id: str
+    name: str
+    role: OrgRole
+    projects: list[TreeProject]
+
+
+class TreeOut(BaseModel):
+    version: str
+    orgs: list[TreeOrg]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "version": "3f9c1a2b-42",
+                "orgs": [
+                    {
+                        "id": "org-uuid",
+                        "name": "Polaris Lab Org",
+                        "role": "owner",
+                        "projects": [
+                            {
+                                "id": "project-uuid",
+                                "name": "Web Console",
+                                "key": "WEB",
+                                "services": [
+                                    {"id": "service-uuid", "name": "Console API", "type": "API", "environment": "PROD"}
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            }
+        }
+    )
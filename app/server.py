@@ -0,0 +1,285 @@
+import argparse
+import asyncio
+import gc
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger("polaris.lab.server")
+
+CRASH_BACKOFF_SECONDS = 1.0
+
+
+def _bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _loop_impl() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def _http_impl() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+class _NotifyingServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, ready_fd: int) -> None:
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            self._notify_task = asyncio.create_task(self._notify_when_ready())
+
+    async def _notify_when_ready(self) -> None:
+        # The master retires old workers on reload only after this, so wait for warmup, not just for the socket.
+        state = getattr(self.config.app, "state", None)
+        while state is not None and not getattr(state, "ready", True) and not self.should_exit:
+            await asyncio.sleep(0.05)
+        os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+
+class Arbiter:
+    # Pre-fork master: the app is imported once here, and workers are forked from it so they share the
+    # imported code and schemas copy-on-write. Signals: HUP rolls all workers, TTIN/TTOU add/remove one,
+    # TERM/INT stop gracefully.
+    def __init__(self, app, sock: socket.socket, workers: int, graceful_timeout: float) -> None:
+        self.app = app
+        self.sock = sock
+        self.target = workers
+        self.graceful_timeout = graceful_timeout
+        self.workers: dict[int, int] = {}
+        self.started_at: dict[int, float] = {}
+        self.ready_fds: dict[int, int] = {}
+        self.retiring: dict[int, float] = {}
+        self.pending_retire: list[int] = []
+        # Replacements spawned by the current roll, and those of them that have not written b"1" yet.
+        self.replacements: set[int] = set()
+        self.awaiting_ready: set[int] = set()
+        self.spawn_after = 0.0
+        self.signals: list[int] = []
+        self.stopping = False
+        self._next_id = 0
+
+    def spawn(self) -> int:
+        self._next_id += 1
+        worker_id = self._next_id
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            for fd in self.ready_fds.values():
+                os.close(fd)
+            code = 0
+            try:
+                self._run_worker(worker_id, ready_w)
+            except BaseException:
+                logger.exception("Worker %s crashed", worker_id)
+                code = 1
+            finally:
+                os._exit(code)
+        os.close(ready_w)
+        os.set_blocking(ready_r, False)
+        self.workers[pid] = worker_id
+        self.started_at[pid] = time.monotonic()
+        self.ready_fds[pid] = ready_r
+        logger.info("Started worker %s (pid %s)", worker_id, pid)
+        return pid
+
+    def _run_worker(self, worker_id: int, ready_fd: int) -> None:
+        for sig in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sig, signal.SIG_DFL)
+        os.environ["POLARIS_WORKER_ID"] = str(worker_id)
+        gc.unfreeze()
+        from app.core.database import dispose_engine
+
+        dispose_engine(close=False)
+        config = uvicorn.Config(
+            self.app,
+            loop=_loop_impl(),
+            http=_http_impl(),
+            lifespan="on",
+            proxy_headers=True,
+            timeout_graceful_shutdown=self.graceful_timeout,
+        )
+        _NotifyingServer(config, ready_fd).run(sockets=[self.sock])
+
+    def _signal(self, signum: int, _frame) -> None:
+        self.signals.append(signum)
+
+    def run(self) -> None:
+        for sig in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sig, self._signal)
+        # Objects created during preload are never collected; freezing them keeps GC from dirtying shared pages.
+        gc.freeze()
+        for _ in range(self.target):
+            self.spawn()
+        while self.workers:
+            self._handle_signals()
+            self._reap()
+            self._poll_ready()
+            self._enforce_deadlines()
+            if not self.stopping:
+                self._maintain()
+            time.sleep(0.1)
+        self.sock.close()
+
+    def _handle_signals(self) -> None:
+        while self.signals:
+            signum = self.signals.pop(0)
+            if signum in (signal.SIGTERM, signal.SIGINT) and not self.stopping:
+                logger.info("Shutting down %s worker(s)", len(self.workers))
+                self.stopping = True
+                for pid in list(self.workers):
+                    self._retire(pid)
+            elif signum == signal.SIGHUP and not self.stopping:
+                logger.info("Rolling %s worker(s)", len(self.workers))
+                # A roll that is still in progress is superseded: its replacements count as old workers too.
+                self.pending_retire = [pid for pid in self.workers if pid not in self.retiring]
+                self.replacements = {self.spawn() for _ in range(self.target)}
+                self.awaiting_ready = set(self.replacements)
+            elif signum == signal.SIGTTIN and not self.stopping:
+                self.target += 1
+            elif signum == signal.SIGTTOU and not self.stopping:
+                self.target = max(1, self.target - 1)
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker_id = self.workers.pop(pid, None)
+            started_at = self.started_at.pop(pid, time.monotonic())
+            fd = self.ready_fds.pop(pid, None)
+            if fd is not None:
+                os.close(fd)
+            expected = self.retiring.pop(pid, None) is not None
+            if pid in self.pending_retire:
+                self.pending_retire.remove(pid)
+            if pid in self.awaiting_ready:
+                self._abort_roll(f"replacement worker {worker_id} exited before it was ready")
+            self.replacements.discard(pid)
+            if not expected and not self.stopping:
+                logger.warning("Worker %s (pid %s) exited with status %s", worker_id, pid, status)
+                if time.monotonic() - started_at < CRASH_BACKOFF_SECONDS:
+                    # Respawns wait in _maintain; sleeping here would hold up signal handling.
+                    self.spawn_after = time.monotonic() + CRASH_BACKOFF_SECONDS
+
+    def _poll_ready(self) -> None:
+        for pid, fd in list(self.ready_fds.items()):
+            try:
+                data = os.read(fd, 1)
+            except BlockingIOError:
+                continue
+            os.close(fd)
+            del self.ready_fds[pid]
+            if data == b"1":
+                logger.info("Worker %s (pid %s) is ready", self.workers.get(pid), pid)
+                self.awaiting_ready.discard(pid)
+            elif pid in self.awaiting_ready:
+                self._abort_roll(f"replacement worker {self.workers.get(pid)} closed its pipe before it was ready")
+        # Old workers keep serving until every replacement has reported ready.
+        if self.replacements and not self.awaiting_ready:
+            for pid in self.pending_retire:
+                self._retire(pid)
+            self.pending_retire = []
+            self.replacements = set()
+
+    def _abort_roll(self, reason: str) -> None:
+        if not self.replacements:
+            return
+        logger.error("Roll aborted, %s; keeping the old workers", reason)
+        for pid in self.replacements:
+            if pid in self.workers:
+                self._retire(pid)
+        self.pending_retire = []
+        self.replacements = set()
+        self.awaiting_ready = set()
+
+    def _retire(self, pid: int) -> None:
+        if pid in self.retiring:
+            return
+        self.retiring[pid] = time.monotonic() + self.graceful_timeout + 5
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _enforce_deadlines(self) -> None:
+        now = time.monotonic()
+        for pid, deadline in list(self.retiring.items()):
+            if now > deadline:
+                logger.warning("Worker pid %s did not stop in time, killing it", pid)
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                self.retiring[pid] = now + 60
+
+    def _maintain(self) -> None:
+        active = [pid for pid in self.workers if pid not in self.retiring and pid not in self.pending_retire]
+        if time.monotonic() >= self.spawn_after:
+            for _ in range(self.target - len(active)):
+                self.spawn()
+        for pid in sorted(active, key=self.started_at.get, reverse=True)[: max(0, len(active) - self.target)]:
+            self._retire(pid)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.server", description="Run the API with pre-forked workers.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.web_concurrency or os.cpu_count() or 1)
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--graceful-timeout", type=float, default=settings.graceful_timeout_seconds)
+    parser.add_argument(
+        "--bootstrap-schema",
+        action=argparse.BooleanOptionalAction,
+        default=settings.schema_bootstrap,
+        help="wait for the database and migrate it once in the master before forking",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s")
+    if args.bootstrap_schema:
+        from app.bootstrap import bootstrap_all
+
+        started = time.perf_counter()
+        result = bootstrap_all()
+        logger.info("Schema %s (%.1f ms)", result, (time.perf_counter() - started) * 1000)
+    from app.main import app
+
+    sock = _bind(args.host, args.port, args.backlog)
+    logger.info(
+        "Listening on %s:%s with %s worker(s), loop=%s http=%s",
+        args.host,
+        args.port,
+        args.workers,
+        _loop_impl(),
+        _http_impl(),
+    )
+    Arbiter(app, sock, max(1, args.workers), args.graceful_timeout).run()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ os.environ.setdefault("JWT_SECRET", "test-secret")
 os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
 os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
 os.environ.setdefault("CORS_ALLOW_ORIGINS", "*")
+os.environ.setdefault("INTEGRATION_DISPATCH_ENABLED", "false")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
 
 from app.core.database import engine  # noqa: E402
 from app.api.deps import get_db  # noqa: E402
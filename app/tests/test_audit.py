@@ -0,0 +1,114 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.core.audit import AuditWriter, audit_writer
+from app.core.database import SessionLocal
+from app.core.events import event_bus
+from app.models import AuditLog
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _audit_count():
+    with SessionLocal() as db:
+        return db.execute(select(func.count()).select_from(AuditLog)).scalar_one()
+
+
+def test_audit_log_is_keyset_paged_newest_first(client):
+    token = _register_and_login(client, "audit@example.com", "Audit")
+    org_id = client.post("/api/orgs", json={"name": "Audit Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    for key in ("AAA", "BBB", "CCC"):
+        client.post(f"/api/orgs/{org_id}/projects", json={"name": key, "key": key}, headers=_auth_header(token))
+    audit_writer.flush()
+
+    entries, cursor = [], None
+    while True:
+        params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/api/orgs/{org_id}/audit", params=params, headers=_auth_header(token)).json()
+        entries.extend(page["data"])
+        cursor = page["meta"]["paging"]["next_cursor"]
+        if not page["meta"]["paging"]["has_next"]:
+            break
+    assert [entry["data"].get("key") for entry in entries if entry["entity"] == "project"] == ["CCC", "BBB", "AAA"]
+    assert entries[-1]["entity"] == "organization" and entries[-1]["action"] == "created"
+    assert len({entry["id"] for entry in entries}) == len(entries)
+    assert all(entry["actor_id"] for entry in entries)
+
+    bad = client.get(f"/api/orgs/{org_id}/audit", params={"cursor": "%%%"}, headers=_auth_header(token))
+    assert bad.status_code == 400
+
+    _register_and_login(client, "audit-member@example.com", "Member")
+    client.post(
+        f"/api/orgs/{org_id}/members",
+        json={"email": "audit-member@example.com", "role": "member"},
+        headers=_auth_header(token),
+    )
+    member_token = client.post(
+        "/api/auth/login", json={"email": "audit-member@example.com", "password": "PolarisPass1!"}
+    ).json()["data"]["access_token"]
+    assert client.get(f"/api/orgs/{org_id}/audit", headers=_auth_header(member_token)).status_code == 403
+
+
+def test_writer_batches_in_background_and_drains_on_stop(client):
+    writer = AuditWriter(SessionLocal, flush_ms=60_000, batch_size=10, max_size=5, enabled=True)
+    event_bus.add_listener(writer.on_change)
+    audit_writer.enabled = False
+    try:
+        before = _audit_count()
+
+        async def _run():
+            await writer.start()
+            for index in range(3):
+                event_bus.publish("org-audit", "project", "created", f"project-{index}")
+            # Nothing is written while the batch is below its size and the flush interval has not elapsed.
+            assert _audit_count() == before and writer.pending() == 3
+            await writer.stop()
+
+        asyncio.run(_run())
+        assert _audit_count() == before + 3 and writer.pending() == 0
+
+        # Producers never write: a full buffer keeps the newest entries and counts the dropped ones.
+        for index in range(7):
+            event_bus.publish("org-audit", "project", "updated", f"project-{index}")
+        assert _audit_count() == before + 3 and writer.pending() == 5 and writer.dropped == 2
+        assert [row["entity_id"] for row in writer._take()] == [f"project-{index}" for index in range(2, 7)]
+    finally:
+        event_bus.remove_listener(writer.on_change)
+        audit_writer.enabled = True
+
+
+def test_failed_flush_requeues_within_the_buffer_bound(client):
+    def _down():
+        raise RuntimeError("database down")
+
+    writer = AuditWriter(_down, flush_ms=60_000, batch_size=2, max_size=3, enabled=True)
+    event_bus.add_listener(writer.on_change)
+    try:
+        for index in range(3):
+            event_bus.publish("org-audit", "project", "created", f"project-{index}")
+        assert writer.pending() == 3 and writer.dropped == 0
+        try:
+            writer.flush()
+        except RuntimeError:
+            pass
+        # The failed batch goes back to the front; one more entry pushes the oldest out instead of growing the buffer.
+        event_bus.publish("org-audit", "project", "created", "project-3")
+        assert writer.pending() == 3 and writer.dropped == 1
+        assert [row["entity_id"] for row in writer._take()] == ["project-1", "project-2"]
+    finally:
+        event_bus.remove_listener(writer.on_change)
@@ -1,3 +1,7 @@
+from app.core.revocation import revocation_index
+from app.core.security import token_cache
+
+
 def test_register(client):
     response = client.post(
         "/api/auth/register",
@@ -38,3 +42,78 @@ def test_refresh(client):
     assert response.status_code == 200
     body = response.json()
     assert body["data"]["access_token"]
+
+
+def _login(client, email):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": "Session"},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]
+
+
+def test_refresh_rotates_and_detects_reuse(client):
+    tokens = _login(client, "rotate@example.com")
+    rotated = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json()["data"]
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    replay = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert replay.status_code == 401
+    assert replay.json()["error"]["message"] == "Refresh token reuse detected"
+
+    assert client.post("/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]}).status_code == 401
+    me = client.get("/api/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+    assert me.status_code == 401
+
+
+def test_logout_and_logout_all_revoke_sessions(client):
+    first = _login(client, "logout@example.com")
+    second = client.post(
+        "/api/auth/login",
+        json={"email": "logout@example.com", "password": "PolarisPass1!"},
+    ).json()["data"]
+
+    assert client.post("/api/auth/logout", json={"refresh_token": first["refresh_token"]}).status_code == 200
+    assert client.get("/api/auth/me", headers={"Authorization": f"Bearer {first['access_token']}"}).status_code == 401
+    assert client.get("/api/auth/me", headers={"Authorization": f"Bearer {second['access_token']}"}).status_code == 200
+
+    third = client.post("/api/auth/refresh", json={"refresh_token": second["refresh_token"]}).json()["data"]
+    response = client.post("/api/auth/logout-all", headers={"Authorization": f"Bearer {third['access_token']}"})
+    assert response.json()["data"] == {"revoked": 1}
+    assert client.get("/api/auth/me", headers={"Authorization": f"Bearer {third['access_token']}"}).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": third["refresh_token"]}).status_code == 401
+
+
+def test_full_revocation_index_falls_back_to_the_database(client, monkeypatch):
+    monkeypatch.setattr(revocation_index, "max_size", 1)
+    revocation_index.clear()
+    try:
+        sessions = [_login(client, "overflow@example.com") for _ in range(3)]
+        for session in sessions[:2]:
+            client.post("/api/auth/logout", json={"refresh_token": session["refresh_token"]})
+        # The first family no longer fits in the index, but its access token is still refused.
+        assert len(revocation_index) == 1 and revocation_index.incomplete()
+        for session, status in zip(sessions, (401, 401, 200)):
+            headers = {"Authorization": f"Bearer {session['access_token']}"}
+            assert client.get("/api/auth/me", headers=headers).status_code == status
+            assert client.get("/api/me/tree", headers=headers).status_code == status
+    finally:
+        revocation_index.clear()
+
+
+def test_access_token_claims_are_cached(client):
+    tokens = _login(client, "cache@example.com")
+    token_cache.clear()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    for _ in range(3):
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+    assert token_cache.stats()["misses"] == 1
+    assert token_cache.stats()["hits"] == 2
+
+    tampered = {"Authorization": f"Bearer {tokens['access_token'][:-2]}xx"}
+    assert client.get("/api/auth/me", headers=tampered).status_code == 401
+    assert token_cache.stats()["size"] == 1
@@ -0,0 +1,121 @@
+from sqlalchemy import event
+
+from app.api.deps import get_db
+from app.core.database import get_engine
+from app.main import app
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_batch_runs_calls_in_order(client):
+    token = _register_and_login(client, "batch@example.com", "Batch")
+    org_id = client.post("/api/orgs", json={"name": "Batch Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    response = client.post(
+        "/api/batch",
+        json={
+            "requests": [
+                {"method": "POST", "path": f"/api/orgs/{org_id}/projects", "body": {"name": "Web", "key": "WEB"}},
+                {"method": "GET", "path": f"/api/orgs/{org_id}/projects?fields=key"},
+                {"method": "GET", "path": "/api/orgs/missing-org"},
+                {"method": "POST", "path": f"/api/orgs/{org_id}/projects", "body": {"name": ""}},
+                {"method": "GET", "path": "/api/dashboard/summary"},
+            ]
+        },
+        headers={**_auth_header(token), "X-Request-Id": "page"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert [result["status"] for result in results] == [200, 200, 404, 422, 200]
+    assert results[0]["body"]["meta"]["request_id"] == "page.0"
+    assert [project["key"] for project in results[1]["body"]["data"]] == ["WEB"]
+    assert results[2]["body"]["error"]["code"] == "NOT_FOUND"
+    assert results[4]["body"]["data"]["project_count"] == 1
+
+
+def test_batch_shares_authentication_and_memberships(client):
+    token = _register_and_login(client, "shared@example.com", "Shared")
+    org_id = client.post("/api/orgs", json={"name": "Shared Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    # The real get_db, so sub-requests use the batch's session.
+    app.dependency_overrides.pop(get_db)
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        requests = [{"method": "GET", "path": f"/api/orgs/{org_id}"} for _ in range(4)]
+        for parallel in (False, True):
+            statements.clear()
+            response = client.post(
+                "/api/batch", json={"requests": requests, "parallel": parallel}, headers=_auth_header(token)
+            )
+            assert [result["status"] for result in response.json()["data"]] == [200] * 4
+            # One user lookup and one membership check for the whole batch.
+            assert sum("FROM polaris_users" in statement for statement in statements) == 1
+            assert sum("FROM polaris_organization_members" in statement for statement in statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_batch_shares_project_lookups(client):
+    token = _register_and_login(client, "projects@example.com", "Projects")
+    org_id = client.post("/api/orgs", json={"name": "Project Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    project_ids = [
+        client.post(
+            f"/api/orgs/{org_id}/projects", json={"name": f"P{index}", "key": f"P{index}"}, headers=_auth_header(token)
+        ).json()["data"]["id"]
+        for index in range(2)
+    ]
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    app.dependency_overrides.pop(get_db)
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        requests = [
+            {"method": "GET", "path": f"/api/projects/{project_id}/services"} for project_id in project_ids * 2
+        ]
+        for parallel in (False, True):
+            statements.clear()
+            response = client.post(
+                "/api/batch", json={"requests": requests, "parallel": parallel}, headers=_auth_header(token)
+            )
+            assert [result["status"] for result in response.json()["data"]] == [200] * 4
+            # Project orgs and memberships are each resolved once for the whole batch.
+            assert sum("FROM polaris_projects" in statement for statement in statements) == 1
+            assert sum("FROM polaris_organization_members" in statement for statement in statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_batch_rejects_unsupported_paths(client):
+    token = _register_and_login(client, "nested@example.com", "Nested")
+    paths = ("/api/batch", "/healthz", "/api/orgs/x/events")
+    # Percent-encoding, encoded slashes and dot segments must not smuggle a nested batch or an event stream past it.
+    encoded = ("/api/batc%68", "/api/batch/", "/api/orgs/x/event%73", "/api/orgs%2Fx", "/api/orgs/%2e%2e/batch")
+    for path in (*paths, *encoded):
+        response = client.post(
+            "/api/batch", json={"requests": [{"method": "GET", "path": path}]}, headers=_auth_header(token)
+        )
+        assert response.status_code == 400
+    assert client.post("/api/batch", json={"requests": [{"method": "GET", "path": "/api/orgs"}]}).status_code == 401
@@ -0,0 +1,12 @@
+from app.bootstrap import bootstrap, migration_heads
+
+
+def test_migration_heads_are_read_without_importing_migrations():
+    assert migration_heads() == {"0007_org_shards"}
+
+
+def test_bootstrap_migrates_once_then_short_circuits(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'bootstrap.db'}"
+
+    assert bootstrap(database_url, wait_seconds=0) == "migrated"
+    assert bootstrap(database_url, wait_seconds=0) == "current"
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+from app.core.coalesce import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = []
+    release = threading.Event()
+
+    def compute(value):
+        calls.append(value)
+        release.wait(5)
+        return {"value": value}
+
+    async def scenario():
+        flight = SingleFlight(enabled=True)
+        waiters = [asyncio.create_task(flight.do("summary", "user-1", compute, 1)) for _ in range(5)]
+        other = asyncio.create_task(flight.do("summary", "user-2", compute, 2))
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*waiters)
+        assert all(result is results[0] for result in results)
+        assert (await other)["value"] == 2
+        # The flight is gone once it finished; the next call computes again.
+        await flight.do("summary", "user-1", compute, 3)
+        return flight.stats()
+
+    stats = asyncio.run(scenario())
+    assert sorted(calls) == [1, 2, 3]
+    assert stats["in_flight"] == 0
+    assert stats["routes"]["summary"] == {"requests": 7, "executions": 3, "coalesced": 4, "coalescing_ratio": 0.5714}
+
+
+def test_errors_reach_every_waiter():
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError("boom")
+
+    async def scenario():
+        flight = SingleFlight(enabled=True)
+        waiters = [asyncio.create_task(flight.do("summary", "k", fail)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters, return_exceptions=True), flight.stats()
+
+    results, stats = asyncio.run(scenario())
+    assert [type(result) for result in results] == [ValueError] * 3
+    assert stats["routes"]["summary"]["executions"] == 1
+
+
+def test_disabled_runs_every_call():
+    async def scenario():
+        flight = SingleFlight(enabled=False)
+        await asyncio.gather(*(flight.do("summary", "k", lambda: None) for _ in range(3)))
+        return flight.stats()
+
+    assert asyncio.run(scenario())["routes"] == {}
+
+
+def test_coalesced_routes(client):
+    client.post(
+        "/api/auth/register",
+        json={"email": "flight@example.com", "password": "PolarisPass1!", "name": "Flight"},
+    )
+    token = client.post(
+        "/api/auth/login",
+        json={"email": "flight@example.com", "password": "PolarisPass1!"},
+    ).json()["data"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    org_id = client.post("/api/orgs", json={"name": "Flight Org"}, headers=headers).json()["data"]["id"]
+    client.post(f"/api/orgs/{org_id}/policies", json={"type": "SLA", "config_json": {}}, headers=headers)
+
+    assert client.get("/api/dashboard/summary", headers=headers).json()["data"]["policy_count"] == 1
+    policies = client.get(f"/api/orgs/{org_id}/policies?fields=type", headers=headers)
+    assert policies.status_code == 200
+    assert [policy["type"] for policy in policies.json()["data"]] == ["SLA"]
+
+    # Each worker publishes its counters on the liveness probe.
+    coalescing = client.get("/healthz").json()["data"]["coalescing"]
+    assert coalescing["in_flight"] == 0
+    assert coalescing["routes"]["dashboard.summary"]["requests"] >= 1
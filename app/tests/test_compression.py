@@ -0,0 +1,72 @@
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_large_json_responses_are_compressed(client):
+    token = _register_and_login(client, "gzip@example.com", "Gzip")
+    org_id = client.post("/api/orgs", json={"name": "Gzip Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    project_id = client.post(
+        f"/api/orgs/{org_id}/projects", json={"name": "Gzip Project", "key": "GZIP"}, headers=_auth_header(token)
+    ).json()["data"]["id"]
+    for i in range(20):
+        client.post(
+            f"/api/projects/{project_id}/services",
+            json={"name": f"service-{i}", "type": "API", "environment": "DEV"},
+            headers=_auth_header(token),
+        )
+
+    url = f"/api/projects/{project_id}/services?page_size=100"
+    compressed = client.get(url, headers={**_auth_header(token), "Accept-Encoding": "gzip"})
+    plain = client.get(url, headers={**_auth_header(token), "Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["vary"]
+    assert int(compressed.headers["content-length"]) < int(plain.headers["content-length"]) / 3
+    assert compressed.json()["data"] == plain.json()["data"]
+    assert "content-encoding" not in plain.headers
+
+    small = client.get("/healthz", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    # A strong ETag set by the route only names the uncompressed bytes, so the compressed response carries it weak.
+    tree = client.get("/api/me/tree", headers={**_auth_header(token), "Accept-Encoding": "gzip"})
+    assert tree.headers["content-encoding"] == "gzip" and tree.headers["etag"].startswith('W/"')
+    identity = client.get("/api/me/tree", headers={**_auth_header(token), "Accept-Encoding": "identity"})
+    assert identity.headers["etag"] == tree.headers["etag"].removeprefix("W/")
+    conditional = {**_auth_header(token), "Accept-Encoding": "gzip", "If-None-Match": tree.headers["etag"]}
+    revalidated = client.get("/api/me/tree", headers=conditional)
+    assert revalidated.status_code == 304
+
+
+def test_console_is_served_precompressed(client):
+    response = client.get("/console/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == "no-cache"
+    assert "<title>Polaris Lab Console" in response.text
+
+    cached = client.get(
+        "/console/index.html", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304 and cached.headers["etag"] == response.headers["etag"]
+    # Each encoding is a different representation with its own strong ETag.
+    plain = client.get(
+        "/console/index.html", headers={"Accept-Encoding": "identity", "If-None-Match": cached.headers["etag"]}
+    )
+    assert plain.status_code == 200 and plain.headers["etag"] != response.headers["etag"]
+    assert "Accept-Encoding" in plain.headers["vary"]
+    assert client.get("/console/missing.js").status_code == 404
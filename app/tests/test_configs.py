@@ -0,0 +1,91 @@
+from sqlalchemy import update
+
+from app.models.policy import Policy
+from app.tests.conftest import TestingSessionLocal
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_policy_config_is_validated_and_normalized(client):
+    token = _register_and_login(client, "configs@example.com", "Configs")
+    org_id = client.post("/api/orgs", json={"name": "Config Org"}, headers=_auth_header(token)).json()["data"]["id"]
+
+    invalid = client.post(
+        f"/api/orgs/{org_id}/policies",
+        json={"type": "SLA", "config_json": {"critical_days": -1, "typo_days": 3}},
+        headers=_auth_header(token),
+    )
+    assert invalid.status_code == 422
+    assert invalid.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert {tuple(error["loc"]) for error in invalid.json()["error"]["detail"]} == {("critical_days",), ("typo_days",)}
+
+    created = client.post(
+        f"/api/orgs/{org_id}/policies",
+        json={"type": "PR_GATE", "config_json": {"block_on": ["HIGH", "CRITICAL", "HIGH"]}},
+        headers=_auth_header(token),
+    )
+    assert created.status_code == 200
+    policy = created.json()["data"]
+    assert policy["config_json"] == {"block_on": ["HIGH", "CRITICAL"], "max_counts": {}, "block_on_sla_breach": False}
+
+    retyped = client.patch(f"/api/policies/{policy['id']}", json={"type": "SLA"}, headers=_auth_header(token))
+    assert retyped.status_code == 422
+
+
+def test_integration_config_is_validated_per_provider(client):
+    token = _register_and_login(client, "configs2@example.com", "Configs2")
+    org_id = client.post("/api/orgs", json={"name": "Config Org"}, headers=_auth_header(token)).json()["data"]["id"]
+
+    invalid = client.post(
+        f"/api/orgs/{org_id}/integrations",
+        json={"provider": "SLACK", "config_json": {"webhook": "not-a-url"}},
+        headers=_auth_header(token),
+    )
+    assert invalid.status_code == 422
+
+    created = client.post(
+        f"/api/orgs/{org_id}/integrations",
+        json={"provider": "GITHUB", "config_json": {"token": "ghp_xxx"}},
+        headers=_auth_header(token),
+    )
+    assert created.status_code == 200
+    assert created.json()["data"]["config_json"] == {"token": "ghp_xxx", "api_url": "https://api.github.com"}
+
+
+def test_enabling_revalidates_legacy_config(client):
+    token = _register_and_login(client, "configs3@example.com", "Configs3")
+    org_id = client.post("/api/orgs", json={"name": "Config Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    policy_id = client.post(
+        f"/api/orgs/{org_id}/policies",
+        json={"type": "PR_GATE", "config_json": {}, "is_enabled": False},
+        headers=_auth_header(token),
+    ).json()["data"]["id"]
+    # What migration 0002 leaves behind: an invalid config on a disabled row.
+    with TestingSessionLocal() as db:
+        db.execute(update(Policy).where(Policy.id == policy_id).values(config_json={"block_on": ["SEVERE"]}))
+        db.commit()
+
+    enabled = client.patch(f"/api/policies/{policy_id}", json={"is_enabled": True}, headers=_auth_header(token))
+    assert enabled.status_code == 422
+    assert enabled.json()["error"]["code"] == "VALIDATION_ERROR"
+    fixed = client.patch(
+        f"/api/policies/{policy_id}",
+        json={"is_enabled": True, "config_json": {"block_on": ["HIGH"]}},
+        headers=_auth_header(token),
+    )
+    assert fixed.status_code == 200
+    assert fixed.json()["data"]["is_enabled"] is True
@@ -1,3 +1,9 @@
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.tests.conftest import engine
+
+
 def _register_and_login(client, email, name="User"):
     client.post(
         "/api/auth/register",
@@ -41,3 +47,117 @@ def test_create_project_and_service(client):
     service_id = service_created.json()["data"]["id"]
     fetched = client.get(f"/api/services/{service_id}", headers=_auth_header(token))
     assert fetched.status_code == 200
+
+
+def test_list_endpoints_return_sparse_fieldsets(client):
+    token = _register_and_login(client, "fields@example.com", "Fields")
+    org_id = client.post("/api/orgs", json={"name": "Fields Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    project_id = client.post(
+        f"/api/orgs/{org_id}/projects", json={"name": "Fields", "key": "FLD"}, headers=_auth_header(token)
+    ).json()["data"]["id"]
+    client.post(
+        f"/api/projects/{project_id}/services",
+        json={"name": "svc", "type": "API", "environment": "PROD"},
+        headers=_auth_header(token),
+    )
+
+    services = client.get(f"/api/projects/{project_id}/services?fields=name,environment", headers=_auth_header(token))
+    assert services.status_code == 200
+    assert list(services.json()["data"][0]) == ["id", "name", "environment"]
+    assert services.json()["data"][0]["environment"] == "PROD"
+    assert services.json()["meta"]["paging"]["total"] == 1
+
+    orgs = client.get("/api/orgs?fields=name", headers=_auth_header(token)).json()["data"]
+    assert orgs == [{"id": org_id, "name": "Fields Org"}]
+
+    unknown = client.get(f"/api/orgs/{org_id}/projects?fields=name,secret", headers=_auth_header(token))
+    assert unknown.status_code == 400
+    assert unknown.json()["error"]["detail"]["unknown"] == ["secret"]
+
+
+def test_org_include_costs_one_query_per_level(client, monkeypatch):
+    token = _register_and_login(client, "include@example.com", "Include")
+    org_id = client.post("/api/orgs", json={"name": "Include Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    for p in range(3):
+        project_id = client.post(
+            f"/api/orgs/{org_id}/projects", json={"name": f"P{p}", "key": f"P{p}"}, headers=_auth_header(token)
+        ).json()["data"]["id"]
+        for s in range(2):
+            client.post(
+                f"/api/projects/{project_id}/services",
+                json={"name": f"svc-{p}-{s}", "type": "API", "environment": "DEV"},
+                headers=_auth_header(token),
+            )
+
+    statements = []
+
+    def _count(*_args):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        bare = client.get(f"/api/orgs/{org_id}", headers=_auth_header(token)).json()
+        plain = len(statements)
+        statements.clear()
+        response = client.get(
+            f"/api/orgs/{org_id}?include=projects.services,policies,integrations", headers=_auth_header(token)
+        )
+        included = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert not {"projects", "policies", "integrations", "truncated"} & bare["data"].keys()
+    assert bare["meta"]["paging"] is None
+    data = response.json()["data"]
+    assert included - plain == 4
+    assert len(data["projects"]) == 3
+    assert all(len(project["services"]) == 2 for project in data["projects"])
+    assert data["policies"] == [] and data["integrations"] == [] and data["truncated"] == []
+
+    monkeypatch.setattr(settings, "include_max_items", 1)
+    capped = client.get(f"/api/orgs/{org_id}?include=projects.services", headers=_auth_header(token)).json()["data"]
+    assert len(capped["projects"]) == 1 and len(capped["projects"][0]["services"]) == 1
+    assert capped["truncated"] == ["projects", "projects.services"]
+
+    listed = client.get(f"/api/orgs/{org_id}/projects?include=services", headers=_auth_header(token)).json()["data"]
+    assert [len(project["services"]) for project in listed] == [1, 1, 1]
+    assert all(project["truncated"] == ["services"] for project in listed)
+    plain_list = client.get(f"/api/orgs/{org_id}/projects", headers=_auth_header(token)).json()["data"]
+    assert not {"services", "truncated"} & plain_list[0].keys()
+    assert client.get(f"/api/orgs/{org_id}?include=members", headers=_auth_header(token)).status_code == 400
+
+
+def test_me_tree_is_cached_until_a_write(client):
+    from app.core.tree_cache import tree_cache
+
+    token = _register_and_login(client, "tree@example.com", "Tree")
+    org_id = client.post("/api/orgs", json={"name": "Tree Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    project_id = client.post(
+        f"/api/orgs/{org_id}/projects", json={"name": "Tree", "key": "TRE"}, headers=_auth_header(token)
+    ).json()["data"]["id"]
+
+    first = client.get("/api/me/tree", headers=_auth_header(token))
+    assert first.status_code == 200
+    tree = first.json()["data"]
+    assert tree["orgs"][0]["id"] == org_id
+    assert tree["orgs"][0]["role"] == "owner"
+    assert tree["orgs"][0]["projects"][0]["services"] == []
+
+    hits = tree_cache.hits
+    second = client.get("/api/me/tree", headers=_auth_header(token))
+    assert tree_cache.hits == hits + 1
+    assert second.json()["data"]["version"] == tree["version"]
+    assert second.headers["etag"] == first.headers["etag"]
+    unchanged = client.get("/api/me/tree", headers={**_auth_header(token), "If-None-Match": first.headers["etag"]})
+    assert unchanged.status_code == 304
+
+    client.post(
+        f"/api/projects/{project_id}/services",
+        json={"name": "tree-api", "type": "API", "environment": "PROD"},
+        headers=_auth_header(token),
+    )
+    third = client.get("/api/me/tree", headers={**_auth_header(token), "If-None-Match": first.headers["etag"]})
+    assert third.status_code == 200
+    assert third.json()["data"]["version"] != tree["version"]
+    assert third.json()["data"]["orgs"][0]["projects"][0]["services"][0]["name"] == "tree-api"
+    assert client.get("/api/me/tree").status_code == 401
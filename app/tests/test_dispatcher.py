@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.events import ChangeEvent
+from app.integrations.dispatcher import dispatcher
+from app.models import IntegrationOutbox, OutboxStatus
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def webhook():
+    received = []
+    statuses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append(json.loads(body))
+            self.send_response(statuses.pop(0) if statuses else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/hook", received, statuses
+    server.shutdown()
+    server.server_close()
+
+
+def _outbox_rows():
+    with SessionLocal() as db:
+        return db.execute(select(IntegrationOutbox)).scalars().all()
+
+
+def test_changes_are_batched_and_delivered(client, webhook):
+    url, received, _ = webhook
+    token = _register_and_login(client, "dispatch@example.com", "Dispatch")
+    org_id = client.post("/api/orgs", json={"name": "Dispatch Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    client.post(
+        f"/api/orgs/{org_id}/integrations",
+        json={"provider": "SLACK", "config_json": {"webhook": url}},
+        headers=_auth_header(token),
+    )
+    project_id = client.post(
+        f"/api/orgs/{org_id}/projects", json={"name": "Edge", "key": "EDGE"}, headers=_auth_header(token)
+    ).json()["data"]["id"]
+    client.patch(f"/api/projects/{project_id}", json={"name": "Edge v2"}, headers=_auth_header(token))
+
+    dispatcher.persist()
+    assert len(_outbox_rows()) == 3
+    assert asyncio.run(dispatcher.flush()) == 3
+    assert len(received) == 1
+    assert received[0]["text"].count("project.") == 1
+    assert "integration.created" in received[0]["text"]
+    assert "Edge v2" in received[0]["text"]
+    assert _outbox_rows() == []
+
+
+def test_failed_delivery_is_retried_with_backoff(client, webhook):
+    url, received, statuses = webhook
+    token = _register_and_login(client, "dispatch2@example.com", "Dispatch2")
+    org_id = client.post("/api/orgs", json={"name": "Dispatch Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    client.post(
+        f"/api/orgs/{org_id}/integrations",
+        json={"provider": "SLACK", "config_json": {"webhook": url}},
+        headers=_auth_header(token),
+    )
+    statuses.append(503)
+    client.post(f"/api/orgs/{org_id}/projects", json={"name": "Core", "key": "CORE"}, headers=_auth_header(token))
+
+    asyncio.run(dispatcher.flush())
+    rows = _outbox_rows()
+    assert len(received) == 1
+    assert len(rows) == 2
+    assert {row.status for row in rows} == {OutboxStatus.PENDING}
+    assert {row.attempts for row in rows} == {1}
+    assert {row.last_error for row in rows} == {"HTTP 503"}
+    assert asyncio.run(dispatcher.flush()) == 0
+
+
+def test_changes_are_buffered_off_the_request_thread(monkeypatch):
+    monkeypatch.setattr(settings, "integration_pending_size", 2)
+    dropped = dispatcher.dropped
+    try:
+        for seq in range(3):
+            dispatcher.on_change(ChangeEvent(f"e-{seq}", seq, "org", "project", "created", "p", None, {}, 0.0))
+        assert dispatcher.pending() == 2
+        assert dispatcher.dropped == dropped + 1
+        assert _outbox_rows() == []
+    finally:
+        dispatcher._pending.clear()
+
+
+def test_failed_rows_are_pruned(client, webhook):
+    url, _, statuses = webhook
+    token = _register_and_login(client, "dispatch3@example.com", "Dispatch3")
+    org_id = client.post("/api/orgs", json={"name": "Dispatch Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    client.post(
+        f"/api/orgs/{org_id}/integrations",
+        json={"provider": "SLACK", "config_json": {"webhook": url}},
+        headers=_auth_header(token),
+    )
+    statuses.append(400)
+    asyncio.run(dispatcher.flush())
+    assert {row.status for row in _outbox_rows()} == {OutboxStatus.FAILED}
+
+    dispatcher._prune()
+    assert len(_outbox_rows()) == 1
+    with SessionLocal() as db:
+        db.execute(update(IntegrationOutbox).values(updated_at=datetime.now(timezone.utc) - timedelta(days=30)))
+        db.commit()
+    dispatcher._prune()
+    assert _outbox_rows() == []
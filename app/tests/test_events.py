@@ -0,0 +1,129 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.api.deps import get_stream_user
+from app.core.errors import AppException
+from app.core.events import EventBus, event_bus
+from app.tests.conftest import TestingSessionLocal
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_subscriber_receives_events_published_from_threads():
+    bus = EventBus(buffer_size=8, queue_size=8)
+
+    async def scenario():
+        subscription, backlog = bus.subscribe("org-1", "user-1")
+        assert backlog == []
+        worker = threading.Thread(target=bus.publish, args=("org-1", "project", "created", "p-1"))
+        worker.start()
+        worker.join()
+        bus.publish("org-2", "project", "created", "p-2")
+        stream = subscription.listen(heartbeat_seconds=1)
+        event = await stream.__anext__()
+        assert event.type == "project.created"
+        assert event.entity_id == "p-1"
+
+    asyncio.run(scenario())
+
+
+def test_resume_from_last_event_id_and_reset_on_gap():
+    bus = EventBus(buffer_size=2, queue_size=8)
+    first = bus.publish("org-1", "service", "created", "s-1")
+    bus.publish("org-1", "service", "created", "s-2")
+
+    async def scenario():
+        _, backlog = bus.subscribe("org-1", "user-1", first.id)
+        assert [event.entity_id for event in backlog] == ["s-2"]
+        bus.publish("org-1", "service", "created", "s-3")
+        _, backlog = bus.subscribe("org-1", "user-1", first.id)
+        assert [event.entity_id for event in backlog] == ["s-2", "s-3"]
+        bus.publish("org-1", "service", "created", "s-4")
+        _, backlog = bus.subscribe("org-1", "user-1", first.id)
+        assert backlog is None
+        _, backlog = bus.subscribe("org-1", "user-1", "unknown-boot-1")
+        assert backlog is None
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_and_removed_member_are_disconnected():
+    bus = EventBus(buffer_size=8, queue_size=1)
+
+    async def scenario():
+        slow, _ = bus.subscribe("org-1", "user-1")
+        removed, _ = bus.subscribe("org-1", "user-2")
+        bus.publish("org-1", "project", "created", "p-1")
+        bus.publish("org-1", "member", "deleted", "m-2", data={"user_id": "user-2"})
+        await asyncio.sleep(0)
+        assert slow.closed
+        assert removed.closed
+        assert [event async for event in slow.listen(heartbeat_seconds=1)] == []
+
+    asyncio.run(scenario())
+
+
+def test_crud_writes_publish_to_org_feed(client):
+    token = _register_and_login(client, "events@example.com", "Events")
+    received = []
+    event_bus.add_listener(received.append)
+    try:
+        org_id = client.post("/api/orgs", json={"name": "Events Org"}, headers=_auth_header(token)).json()["data"]["id"]
+        client.post(
+            f"/api/orgs/{org_id}/projects",
+            json={"name": "Web Console", "key": "WEB"},
+            headers=_auth_header(token),
+        )
+    finally:
+        event_bus.remove_listener(received.append)
+    assert [event.type for event in received] == ["organization.created", "project.created"]
+    assert all(event.org_id == org_id and event.actor_id for event in received)
+
+
+def test_event_stream_requires_membership(client):
+    owner_token = _register_and_login(client, "events-owner@example.com", "Owner")
+    outsider_token = _register_and_login(client, "events-outsider@example.com", "Outsider")
+    org_id = client.post("/api/orgs", json={"name": "Events Org"}, headers=_auth_header(owner_token)).json()["data"]["id"]
+    assert client.get(f"/api/orgs/{org_id}/events").status_code == 401
+    response = client.get(f"/api/orgs/{org_id}/events", headers=_auth_header(outsider_token))
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "FORBIDDEN"
+    # Access tokens are not accepted in the query string.
+    assert client.get(f"/api/orgs/{org_id}/events", params={"access_token": owner_token}).status_code == 401
+    assert client.post(f"/api/orgs/{org_id}/events/ticket", headers=_auth_header(outsider_token)).status_code == 403
+
+
+def test_stream_tickets_are_scoped_and_single_use(client):
+    token = _register_and_login(client, "ticket@example.com", "Ticket")
+    org_ids = [
+        client.post("/api/orgs", json={"name": f"Ticket {index}"}, headers=_auth_header(token)).json()["data"]["id"]
+        for index in range(2)
+    ]
+    issued = client.post(f"/api/orgs/{org_ids[0]}/events/ticket", headers=_auth_header(token)).json()["data"]
+    assert issued["expires_in"] == 30
+    assert client.get(f"/api/orgs/{org_ids[1]}/events", params={"ticket": issued["ticket"]}).status_code == 401
+    assert client.get(f"/api/orgs/{org_ids[0]}/events", params={"ticket": token}).status_code == 401
+
+    # The stream itself never ends, so the dependency is called directly.
+    with TestingSessionLocal() as db:
+        user = get_stream_user(org_ids[0], ticket=issued["ticket"], credentials=None, db=db)
+        assert user.email == "ticket@example.com"
+        with pytest.raises(AppException) as reused:
+            get_stream_user(org_ids[0], ticket=issued["ticket"], credentials=None, db=db)
+    assert reused.value.status_code == 401
@@ -0,0 +1,45 @@
+import asyncio
+import os
+
+from app import warmup
+from app.main import app
+from app.warmup import warm_up
+
+
+def test_health_and_readiness(client, monkeypatch):
+    live = client.get("/healthz")
+    assert live.status_code == 200
+    assert live.json()["data"]["pid"] == os.getpid()
+
+    assert client.get("/readyz").json()["data"]["status"] == "ready"
+    monkeypatch.setattr(app.state, "ready", False)
+    not_ready = client.get("/readyz")
+    assert not_ready.status_code == 503
+    assert not_ready.json()["error"]["code"] == "UNAVAILABLE"
+
+
+def test_warmup_marks_worker_ready(client, monkeypatch):
+    monkeypatch.setattr(app.state, "ready", False)
+    report = asyncio.run(warm_up(app))
+    assert all(step["count"] for step in report.values())
+    assert report["response_models"]["count"] > 10
+    assert client.get("/readyz").status_code == 200
+
+
+def test_warmup_waits_for_the_database(client, monkeypatch):
+    monkeypatch.setattr(app.state, "ready", False)
+    monkeypatch.setattr(warmup, "RETRY_SECONDS", 0.01)
+    real_pool = warmup.warm_pool
+    attempts = []
+
+    def flaky_pool():
+        attempts.append(app.state.ready)
+        if len(attempts) < 3:
+            raise ConnectionError("database unavailable")
+        return real_pool()
+
+    monkeypatch.setattr(warmup, "warm_pool", flaky_pool)
+    report = asyncio.run(warm_up(app))
+    assert attempts == [False, False, False]
+    assert report["pool"]["count"] >= 1
+    assert client.get("/readyz").status_code == 200
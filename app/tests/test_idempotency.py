@@ -0,0 +1,73 @@
+import asyncio
+
+from app.core.idempotency import MemoryStore, StoredResponse
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token, key=None):
+    headers = {"Authorization": f"Bearer {token}"}
+    if key is not None:
+        headers["Idempotency-Key"] = key
+    return headers
+
+
+def test_retried_post_is_replayed(client):
+    token = _register_and_login(client, "retry@example.com", "Retry")
+    first = client.post("/api/orgs", json={"name": "Retry Org"}, headers=_auth_header(token, "create-1"))
+    second = client.post("/api/orgs", json={"name": "Retry Org"}, headers=_auth_header(token, "create-1"))
+
+    assert first.status_code == second.status_code == 200
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert second.json()["data"]["id"] == first.json()["data"]["id"]
+    orgs = client.get("/api/orgs", headers=_auth_header(token)).json()["data"]
+    assert [org["name"] for org in orgs] == ["Retry Org"]
+
+    # Another caller reusing the same key gets its own request.
+    other = _register_and_login(client, "other@example.com", "Other")
+    third = client.post("/api/orgs", json={"name": "Retry Org"}, headers=_auth_header(other, "create-1"))
+    assert third.json()["data"]["id"] != first.json()["data"]["id"]
+
+
+def test_key_reused_for_different_request(client):
+    token = _register_and_login(client, "reuse@example.com", "Reuse")
+    assert client.post("/api/orgs", json={"name": "One"}, headers=_auth_header(token, "k")).status_code == 200
+    response = client.post("/api/orgs", json={"name": "Two"}, headers=_auth_header(token, "k"))
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "BAD_REQUEST"
+    too_long = client.post("/api/orgs", json={"name": "Two"}, headers=_auth_header(token, "k" * 256))
+    assert too_long.status_code == 400
+
+
+def test_memory_store_waits_for_in_flight_duplicate():
+    async def scenario():
+        store = MemoryStore(max_entries=10)
+        assert await store.reserve("k", "a", 60) == ("acquired", None)
+        waiter = asyncio.create_task(store.reserve("k", "a", 60))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert await store.reserve("k", "b", 60) == ("mismatch", None)
+        response = StoredResponse(201, [], b"{}")
+        await store.complete("k", response)
+        assert await waiter == ("replay", response)
+
+        # A released key (failed attempt) hands the next waiter the request to run.
+        await store.reserve("j", "a", 60)
+        waiter = asyncio.create_task(store.reserve("j", "a", 60))
+        await asyncio.sleep(0)
+        await store.release("j")
+        assert await waiter == ("acquired", None)
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+from uuid import UUID
+
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+
+from app.core.config import settings
+from app.core.ids import new_id, uuid7
+from app.models import Project
+from app.models.types import Id
+
+
+def test_uuid7_ids_are_time_ordered():
+    ids = [new_id() for _ in range(2000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    parsed = uuid7()
+    assert parsed.version == 7 and parsed.variant == "specified in RFC 4122"
+
+
+def test_binary_storage_keeps_string_ids_in_python(monkeypatch):
+    monkeypatch.setattr(settings, "id_storage", "binary")
+    value = new_id()
+    id_type = Id()
+
+    dialect = mysql.dialect()
+    assert "BINARY(16)" in str(CreateTable(Project.__table__).compile(dialect=dialect))
+    stored = id_type.process_bind_param(value, dialect)
+    assert stored == UUID(value).bytes
+    assert id_type.process_result_value(stored, dialect) == value
+    assert id_type.process_bind_param("not-a-uuid", dialect) is None
+
+    pg = postgresql.dialect()
+    assert "UUID" in str(CreateTable(Project.__table__).compile(dialect=pg))
+    assert id_type.process_bind_param(value.upper(), pg) == value
+
+    lite = sqlite.dialect()
+    assert "VARCHAR(36)" in str(CreateTable(Project.__table__).compile(dialect=lite))
+    assert id_type.process_bind_param(value, lite) == value
+
+
+def test_string_storage_is_the_default():
+    assert settings.id_storage == "string"
+    assert "VARCHAR(36)" in str(CreateTable(Project.__table__).compile(dialect=mysql.dialect()))
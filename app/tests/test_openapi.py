@@ -0,0 +1,42 @@
+import json
+
+from app.core.config import settings
+from app.core.openapi import FINGERPRINT_KEY, openapi_fingerprint, write_openapi_cache
+from app.main import app
+
+CACHED = {"openapi": "3.1.0", "info": {"title": "cached"}, "paths": {}}
+
+def test_openapi_is_loaded_from_cache_file(client, tmp_path, monkeypatch):
+    cache = tmp_path / "openapi.json"
+    write_openapi_cache(CACHED, str(cache), openapi_fingerprint(app))
+    monkeypatch.setattr(settings, "openapi_cache_path", str(cache))
+    monkeypatch.setattr(app, "openapi_schema", None)
+    cached = client.get("/openapi.json").json()
+    assert cached["info"]["title"] == "cached" and FINGERPRINT_KEY not in cached
+
+    cache.write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "stale", "version": app.version}, "paths": {}}))
+    monkeypatch.setattr(app, "openapi_schema", None)
+    schema = client.get("/openapi.json").json()
+    assert schema["info"]["title"] == app.title
+    assert "/api/auth/login" in schema["paths"]
+
+
+def test_route_change_invalidates_openapi_cache(client, tmp_path, monkeypatch):
+    cache = tmp_path / "openapi.json"
+    write_openapi_cache(CACHED, str(cache), openapi_fingerprint(app))
+    monkeypatch.setattr(settings, "openapi_cache_path", str(cache))
+    monkeypatch.setattr(app, "openapi_schema", None)
+    routes = list(app.router.routes)
+
+    @app.get("/api/added-after-build")
+    def added_after_build():
+        return {}
+
+    try:
+        # Same app.version, but the route table the cache was built from is gone.
+        schema = client.get("/openapi.json").json()
+        assert schema["info"]["title"] == app.title
+        assert "/api/added-after-build" in schema["paths"]
+    finally:
+        app.router.routes[:] = routes
+        monkeypatch.setattr(app, "openapi_schema", None)
@@ -0,0 +1,71 @@
+from app.core.policy_engine import policy_cache
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_policy(client, token, org_id, policy_type, config_json):
+    return client.post(
+        f"/api/orgs/{org_id}/policies",
+        json={"type": policy_type, "config_json": config_json, "is_enabled": True},
+        headers=_auth_header(token),
+    ).json()["data"]["id"]
+
+
+def test_evaluate_applies_severity_sla_and_gate(client):
+    token = _register_and_login(client, "policy@example.com", "Policy")
+    org_id = client.post("/api/orgs", json={"name": "Policy Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    _create_policy(client, token, org_id, "SEVERITY_MAPPING", {"aliases": {"error": "HIGH"}, "overrides": {"secret-leak": "CRITICAL"}})
+    _create_policy(client, token, org_id, "SLA", {"critical_days": 7, "high_days": 30})
+    gate_id = _create_policy(client, token, org_id, "PR_GATE", {"block_on": ["CRITICAL"], "max_counts": {"HIGH": 1}})
+
+    response = client.post(
+        f"/api/orgs/{org_id}/policies:evaluate",
+        json={
+            "findings": [
+                {"id": "f1", "severity": "error", "detected_at": "2020-01-01T00:00:00Z"},
+                {"id": "f2", "score": 7.2},
+                {"id": "f3", "severity": "LOW", "rule_id": "secret-leak"},
+                {"id": "f4", "score": 2.0},
+            ]
+        },
+        headers=_auth_header(token),
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [f["severity"] for f in data["findings"]] == ["HIGH", "HIGH", "CRITICAL", "LOW"]
+    assert data["findings"][0]["sla_days"] == 30
+    assert data["findings"][0]["breached"] is True
+    assert data["findings"][2]["blocking"] is True
+    assert data["gate"]["decision"] == "BLOCK"
+    assert len(data["gate"]["reasons"]) == 2
+    assert data["policy_ids"]["PR_GATE"] == gate_id
+
+
+def test_policy_update_invalidates_compiled_cache(client):
+    token = _register_and_login(client, "policy2@example.com", "Policy2")
+    org_id = client.post("/api/orgs", json={"name": "Policy Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    gate_id = _create_policy(client, token, org_id, "PR_GATE", {"block_on": ["HIGH"]})
+    findings = {"findings": [{"id": "f1", "severity": "HIGH"}]}
+
+    first = client.post(f"/api/orgs/{org_id}/policies:evaluate", json=findings, headers=_auth_header(token))
+    assert first.json()["data"]["gate"]["decision"] == "BLOCK"
+    assert org_id in policy_cache._entries
+
+    client.patch(f"/api/policies/{gate_id}", json={"is_enabled": False}, headers=_auth_header(token))
+    assert org_id not in policy_cache._entries
+    second = client.post(f"/api/orgs/{org_id}/policies:evaluate", json=findings, headers=_auth_header(token))
+    assert second.json()["data"]["gate"]["decision"] == "PASS"
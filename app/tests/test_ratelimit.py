@@ -0,0 +1,95 @@
+import asyncio
+
+from app.core.ratelimit import MemoryStore, rate_limiter
+
+
+def _register(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+
+
+def _login(client, email):
+    return client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _enable(monkeypatch, **limits):
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+    monkeypatch.setattr(rate_limiter, "_store", MemoryStore())
+    for name, value in limits.items():
+        monkeypatch.setattr(rate_limiter, name, value)
+
+
+def test_login_is_limited_per_ip(client, monkeypatch):
+    _register(client, "limited@example.com", "Limited")
+    _enable(monkeypatch, login_rate=0.01, login_burst=2)
+
+    assert _login(client, "limited@example.com").status_code == 200
+    assert _login(client, "limited@example.com").status_code == 200
+    response = _login(client, "limited@example.com")
+
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == "RATE_LIMITED"
+    assert int(response.headers["Retry-After"]) == response.json()["error"]["detail"]["retry_after"] >= 1
+    assert response.headers["X-Request-Id"] == response.json()["meta"]["request_id"]
+
+
+def test_user_and_org_buckets(client, monkeypatch):
+    _register(client, "noisy@example.com", "Noisy")
+    token = _login(client, "noisy@example.com").json()["data"]["access_token"]
+    org_id = client.post("/api/orgs", json={"name": "Noisy Org"}, headers=_auth_header(token)).json()["data"]["id"]
+    _enable(monkeypatch, user_rate=0.01, user_burst=4, org_rate=0.01, org_burst=2)
+
+    assert client.get(f"/api/orgs/{org_id}", headers=_auth_header(token)).status_code == 200
+    assert client.get(f"/api/orgs/{org_id}", headers=_auth_header(token)).status_code == 200
+    assert client.get(f"/api/orgs/{org_id}", headers=_auth_header(token)).status_code == 429
+    # The org bucket is empty but this user still has a token left for routes outside the org.
+    assert client.get("/api/auth/me", headers=_auth_header(token)).status_code == 200
+    assert client.get("/api/auth/me", headers=_auth_header(token)).status_code == 429
+    assert client.get("/healthz").status_code == 200
+
+
+def test_memory_store_concurrency_slots():
+    store = MemoryStore()
+
+    async def scenario():
+        assert await store.acquire("org:a", 2)
+        assert await store.acquire("org:a", 2)
+        assert not await store.acquire("org:a", 2)
+        assert await store.acquire("org:b", 2)
+        await store.release("org:a")
+        assert await store.acquire("org:a", 2)
+
+    asyncio.run(scenario())
+
+
+def test_memory_store_prunes_each_bucket_at_its_own_rate(monkeypatch):
+    store = MemoryStore(max_keys=10)
+    clock = [1000.0]
+    monkeypatch.setattr("app.core.ratelimit.time.monotonic", lambda: clock[0])
+
+    async def scenario():
+        # An emptied login bucket refills over a minute; user buckets refill in two seconds.
+        assert await store.take("login:ip", 1 / 60, 1) == 0
+        assert await store.take("login:ip", 1 / 60, 1) > 0
+        for index in range(9):
+            await store.take(f"user:{index}", 20, 40)
+        clock[0] += 5
+        await store.take("user:new", 20, 40)
+        assert await store.take("login:ip", 1 / 60, 1) > 0
+
+        # Nothing idle: the least recently used buckets go, and the store stays bounded.
+        for index in range(30):
+            await store.take(f"burst:{index}", 20, 40)
+        assert len(store._buckets) <= store.max_keys
+        assert "burst:29" in store._buckets
+
+    asyncio.run(scenario())
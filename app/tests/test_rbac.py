@@ -75,3 +75,44 @@ def test_member_cannot_create_project(client):
         headers=_auth_header(member_token),
     )
     assert response.status_code == 403
+
+
+def test_multi_get_reports_access_per_item(client):
+    _register(client, "multi-a@example.com", "MultiA")
+    _register(client, "multi-b@example.com", "MultiB")
+    token_a = _login(client, "multi-a@example.com")
+    token_b = _login(client, "multi-b@example.com")
+    org_a = _create_org(client, token_a, "Org A")
+    org_b = _create_org(client, token_b, "Org B")
+    project_a = client.post(
+        f"/api/orgs/{org_a}/projects", json={"name": "A", "key": "A"}, headers=_auth_header(token_a)
+    ).json()["data"]["id"]
+    project_b = client.post(
+        f"/api/orgs/{org_b}/projects", json={"name": "B", "key": "B"}, headers=_auth_header(token_b)
+    ).json()["data"]["id"]
+    service_a = client.post(
+        f"/api/projects/{project_a}/services",
+        json={"name": "svc-a", "type": "API", "environment": "DEV"},
+        headers=_auth_header(token_a),
+    ).json()["data"]["id"]
+    service_b = client.post(
+        f"/api/projects/{project_b}/services",
+        json={"name": "svc-b", "type": "API", "environment": "DEV"},
+        headers=_auth_header(token_b),
+    ).json()["data"]["id"]
+
+    response = client.get(
+        f"/api/services?ids={service_b},{service_a},missing,{service_a}", headers=_auth_header(token_a)
+    )
+    assert response.status_code == 200
+    items = response.json()["data"]
+    assert [item["id"] for item in items] == [service_b, service_a, "missing"]
+    assert items[0]["ok"] is False and items[0]["error"]["code"] == "FORBIDDEN"
+    assert items[1]["ok"] is True and items[1]["data"]["name"] == "svc-a"
+    assert items[2]["error"]["code"] == "NOT_FOUND"
+
+    projects = client.get(f"/api/projects?ids={project_a},{project_b}", headers=_auth_header(token_b)).json()["data"]
+    assert [item["ok"] for item in projects] == [False, True]
+
+    too_many = ",".join(str(i) for i in range(101))
+    assert client.get(f"/api/policies?ids={too_many}", headers=_auth_header(token_a)).status_code == 400
@@ -0,0 +1,47 @@
+from sqlalchemy import create_engine
+
+from app.api.deps import get_db
+from app.core.database import replica_pool
+from app.main import app
+from app.models import Base
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_reads_use_replica_outside_the_read_your_writes_window(client, tmp_path, monkeypatch):
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replica = create_engine(replica_url)
+    Base.metadata.create_all(bind=replica)
+    replica.dispose()
+    app.dependency_overrides.pop(get_db)
+    monkeypatch.setattr(replica_pool, "urls", [replica_url])
+    replica_pool.dispose()
+    try:
+        assert replica_pool.check() == 1
+        token = _register_and_login(client, "replica@example.com", "Replica")
+        assert client.cookies.get("polaris_primary_until")
+
+        # The empty replica does not know the user yet, so only primary reads succeed.
+        assert client.get("/api/auth/me", headers=_auth_header(token)).status_code == 200
+        client.cookies.clear()
+        assert client.get("/api/auth/me", headers=_auth_header(token)).status_code == 401
+
+        monkeypatch.setattr(replica_pool, "max_lag", -1)
+        assert replica_pool.check() == 0
+        assert client.get("/api/auth/me", headers=_auth_header(token)).status_code == 200
+    finally:
+        replica_pool.dispose()
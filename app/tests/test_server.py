@@ -0,0 +1,62 @@
+import itertools
+import os
+import signal
+
+import pytest
+
+from app.server import Arbiter
+
+
+@pytest.fixture()
+def arbiter(monkeypatch):
+    arbiter = Arbiter(app=None, sock=None, workers=2, graceful_timeout=1)
+    pids = itertools.count(1000)
+    pipes = {}
+    killed = []
+
+    def _spawn():
+        ready_r, ready_w = os.pipe()
+        os.set_blocking(ready_r, False)
+        pid = next(pids)
+        arbiter.workers[pid] = pid
+        arbiter.started_at[pid] = 0.0
+        arbiter.ready_fds[pid] = ready_r
+        pipes[pid] = ready_w
+        return pid
+
+    def _report(pid, ready=True):
+        if ready:
+            os.write(pipes[pid], b"1")
+        os.close(pipes.pop(pid))
+
+    monkeypatch.setattr(arbiter, "spawn", _spawn)
+    monkeypatch.setattr(os, "kill", lambda pid, _sig: killed.append(pid))
+    old = [_spawn(), _spawn()]
+    for pid in old:
+        _report(pid)
+    arbiter._poll_ready()
+    arbiter.signals.append(signal.SIGHUP)
+    arbiter._handle_signals()
+    yield arbiter, old, sorted(arbiter.replacements), _report, killed
+    for fd in [*pipes.values(), *arbiter.ready_fds.values()]:
+        os.close(fd)
+
+
+def test_roll_retires_old_workers_once_replacements_are_ready(arbiter):
+    arbiter, old, new, report, killed = arbiter
+    report(new[0])
+    arbiter._poll_ready()
+    assert killed == []
+    report(new[1])
+    arbiter._poll_ready()
+    assert killed == old
+
+
+def test_roll_is_aborted_when_a_replacement_fails(arbiter):
+    arbiter, old, new, report, killed = arbiter
+    report(new[0])
+    report(new[1], ready=False)
+    arbiter._poll_ready()
+    # The old workers keep serving; the replacements are the ones sent away.
+    assert sorted(killed) == new
+    assert arbiter.pending_retire == [] and arbiter.replacements == set()
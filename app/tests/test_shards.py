@@ -0,0 +1,132 @@
+from sqlalchemy import create_engine, event, func, select
+
+from app.api.deps import get_db
+from app.bootstrap import backfill_users
+from app.core.config import settings
+from app.core.database import shard_router
+from app.main import app
+from app.models import Base, Organization, OrganizationMember, Service, User
+
+
+def _register_and_login(client, email, name="User"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "PolarisPass1!", "name": name},
+    )
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "PolarisPass1!"},
+    )
+    return response.json()["data"]["access_token"]
+
+
+def _auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _count(shard, model):
+    with shard_router.session(shard) as db:
+        return db.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_orgs_are_spread_over_shards_and_reads_fan_out(client, tmp_path, monkeypatch):
+    urls = [f"sqlite:///{tmp_path / f'shard{index}.db'}" for index in (1, 2)]
+    for url in urls:
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+    app.dependency_overrides.pop(get_db)
+    monkeypatch.setattr(shard_router, "urls", urls)
+    shard_router.dispose()
+    try:
+        token = _register_and_login(client, "shards@example.com", "Shards")
+        org_ids = [
+            client.post("/api/orgs", json={"name": f"Org {index}"}, headers=_auth_header(token)).json()["data"]["id"]
+            for index in range(8)
+        ]
+        placements = {org_id: shard_router.shard_for_org(org_id) for org_id in org_ids}
+        assert len(set(placements.values())) > 1
+        assert sum(_count(shard, Organization) for shard in shard_router.shards()) == len(org_ids)
+
+        org_id = next(org_id for org_id, shard in placements.items() if shard)
+        project_id = client.post(
+            f"/api/orgs/{org_id}/projects", json={"name": "Sharded", "key": "SHD"}, headers=_auth_header(token)
+        ).json()["data"]["id"]
+        service = client.post(
+            f"/api/projects/{project_id}/services",
+            json={"name": "sharded-api", "type": "API", "environment": "PROD"},
+            headers=_auth_header(token),
+        )
+        assert service.status_code == 200
+        assert _count(placements[org_id], Service) == 1 and _count(0, Service) == 0
+
+        # Child ids are located without an org in the path.
+        service_id = service.json()["data"]["id"]
+        assert client.get(f"/api/services/{service_id}", headers=_auth_header(token)).status_code == 200
+        assert client.get(f"/api/projects/{project_id}/services", headers=_auth_header(token)).json()["data"]
+
+        listed = client.get("/api/orgs", headers=_auth_header(token)).json()["data"]
+        assert sorted(org["id"] for org in listed) == sorted(org_ids)
+        summary = client.get("/api/dashboard/summary", headers=_auth_header(token)).json()["data"]
+        assert summary["org_count"] == len(org_ids) and summary["service_count"] == 1
+        tree = client.get("/api/me/tree", headers=_auth_header(token)).json()["data"]
+        assert len(tree["orgs"]) == len(org_ids)
+        many = client.get(f"/api/services?ids={service_id}", headers=_auth_header(token)).json()["data"]
+        assert many[0]["ok"] is True
+    finally:
+        shard_router.dispose()
+
+
+def _enforce_foreign_keys(dbapi_connection, _record):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+def test_users_from_before_sharding_are_mirrored_before_shard_writes(client, tmp_path, monkeypatch):
+    # Registered while unsharded, so neither user has a row on the shards.
+    owner = _register_and_login(client, "early-owner@example.com", "Owner")
+    _register_and_login(client, "early-member@example.com", "Member")
+    urls = [f"sqlite:///{tmp_path / f'fk{index}.db'}" for index in (1, 2)]
+    for url in urls:
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+    app.dependency_overrides.pop(get_db)
+    monkeypatch.setattr(shard_router, "urls", urls)
+    shard_router.dispose()
+    try:
+        for shard in shard_router.shards()[1:]:
+            event.listen(shard_router.engine(shard), "connect", _enforce_foreign_keys)
+        org_ids = [
+            client.post("/api/orgs", json={"name": f"Early {index}"}, headers=_auth_header(owner)).json()["data"]["id"]
+            for index in range(6)
+        ]
+        org_id = next(org_id for org_id in org_ids if shard_router.shard_for_org(org_id))
+        shard = shard_router.shard_for_org(org_id)
+        added = client.post(
+            f"/api/orgs/{org_id}/members",
+            json={"email": "early-member@example.com", "role": "member"},
+            headers=_auth_header(owner),
+        )
+        assert added.status_code == 200
+        assert _count(shard, OrganizationMember) == sum(shard_router.shard_for_org(o) == shard for o in org_ids) + 1
+        # Users are a global table for sessions, so read the shard's mirror rows directly.
+        with shard_router.engine(shard).connect() as conn:
+            hashes = conn.execute(select(User.password_hash).where(User.email.like("early-%"))).scalars().all()
+        assert hashes == ["", ""]
+    finally:
+        shard_router.dispose()
+
+
+def test_backfill_copies_missing_users_to_a_new_shard(client, tmp_path):
+    _register_and_login(client, "backfill@example.com", "Backfill")
+    url = f"sqlite:///{tmp_path / 'new-shard.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    try:
+        assert backfill_users(settings.database_url, url) == 1
+        assert backfill_users(settings.database_url, url) == 0
+        with engine.connect() as conn:
+            row = conn.execute(select(User.email, User.password_hash)).one()
+        assert tuple(row) == ("backfill@example.com", "")
+    finally:
+        engine.dispose()
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+from typing import Any, get_args, get_origin
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal, get_engine
+from app.core.policy_engine import compile_policies
+from app.core.security import create_access_token, decode_token, get_pwd_context
+from app.crud import dashboard as dashboard_crud
+from app.crud import integration as integration_crud
+from app.crud import member as member_crud
+from app.crud import org as org_crud
+from app.crud import policy as policy_crud
+from app.crud import project as project_crud
+from app.crud import refresh_token as refresh_token_crud
+from app.crud import service as service_crud
+from app.crud import user as user_crud
+
+logger = logging.getLogger("polaris.lab.warmup")
+
+# A worker that cannot reach the database must not report ready; the other steps only save first-request latency.
+REQUIRED_STEPS = frozenset({"pool"})
+RETRY_SECONDS = 1.0
+MAX_RETRY_SECONDS = 30.0
+
+
+def warm_pool() -> int:
+    engine = get_engine()
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    connections = []
+    try:
+        for _ in range(min(size, settings.db_pool_size)):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def warm_statements() -> int:
+    # Lookups with an id that cannot exist hit the PK indexes only, but still fill SQLAlchemy's compiled cache
+    # and ORM loader paths for the hot read queries.
+    missing = str(uuid4())
+    calls = [
+        lambda db: user_crud.get_by_id(db, missing),
+        lambda db: user_crud.get_by_email(db, f"{missing}@warmup.invalid"),
+        lambda db: org_crud.get_org(db, missing),
+        lambda db: org_crud.list_orgs_for_user(db, missing),
+        lambda db: member_crud.get_member_by_user(db, missing, missing),
+        lambda db: member_crud.list_members(db, missing),
+        lambda db: project_crud.get_project(db, missing),
+        lambda db: project_crud.list_projects(db, missing, 1, 20, None, None),
+        lambda db: service_crud.get_service(db, missing),
+        lambda db: service_crud.list_services(db, missing, 1, 20, None, None),
+        lambda db: policy_crud.list_policies(db, missing),
+        lambda db: integration_crud.list_integrations(db, missing),
+        lambda db: dashboard_crud.get_summary(db, missing),
+        lambda db: refresh_token_crud.get_token(db, missing),
+    ]
+    with SessionLocal() as db:
+        for call in calls:
+            call(db)
+    return len(calls)
+
+
+def _example(annotation: Any) -> Any:
+    if get_origin(annotation) is list:
+        item = _example(get_args(annotation)[0])
+        return [] if item is None else [item]
+    if annotation is dict or get_origin(annotation) is dict:
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        extra = annotation.model_config.get("json_schema_extra")
+        if isinstance(extra, dict):
+            return extra.get("example")
+    return None
+
+
+def warm_response_models(app: FastAPI) -> int:
+    # Runs each route's response validation and serialization once, the same path FastAPI takes per request.
+    warmed = 0
+    for route in app.routes:
+        field = getattr(route, "response_field", None)
+        if not isinstance(route, APIRoute) or field is None:
+            continue
+        data_field = getattr(route.response_model, "model_fields", {}).get("data")
+        if data_field is None:
+            continue
+        envelope = {"ok": True, "data": _example(data_field.annotation), "meta": {"request_id": "warmup"}}
+        value, errors = field.validate(envelope, {}, loc=("response",))
+        if not errors:
+            field.serialize(value, mode="json")
+            warmed += 1
+    return warmed
+
+
+def warm_caches() -> int:
+    get_pwd_context().handler().get_backend()
+    decode_token(create_access_token(str(uuid4()), str(uuid4())))
+    compile_policies("warmup", [])
+    return 3
+
+
+async def warm_up(app: FastAPI) -> dict:
+    steps = [
+        ("pool", warm_pool),
+        ("statements", warm_statements),
+        ("response_models", lambda: warm_response_models(app)),
+        ("caches", warm_caches),
+    ]
+    report = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        delay = RETRY_SECONDS
+        while True:
+            try:
+                count = await asyncio.to_thread(step)
+                break
+            except Exception:
+                if name not in REQUIRED_STEPS:
+                    logger.exception("Warmup step %s failed", name)
+                    count = None
+                    break
+                logger.warning(
+                    "Warmup step %s failed, staying unready and retrying in %.0f s", name, delay, exc_info=True
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_SECONDS)
+        report[name] = {"count": count, "ms": round((time.perf_counter() - started) * 1000, 1)}
+    logger.info("Warmup finished: %s", report)
+    app.state.warmup = report
+    app.state.ready = True
+    return report
@@ -0,0 +1,40 @@
+import argparse
+import os
+import time
+from uuid import uuid4
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from app.core.revocation import revocation_index  # noqa: E402
+from app.core.security import create_access_token, decode_token, decode_token_cached, token_cache  # noqa: E402
+
+
+def _per_call_us(func, tokens: list[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            claims = func(token)
+            revocation_index.is_revoked(claims["fid"])
+    return (time.perf_counter() - started) / (rounds * len(tokens)) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure bearer-token verification cost per request.")
+    parser.add_argument("--sessions", type=int, default=200, help="distinct access tokens in rotation")
+    parser.add_argument("--rounds", type=int, default=200, help="requests per token")
+    args = parser.parse_args()
+
+    tokens = [create_access_token(str(uuid4()), str(uuid4())) for _ in range(args.sessions)]
+    token_cache.clear()
+    uncached = _per_call_us(decode_token, tokens, args.rounds)
+    cached = _per_call_us(decode_token_cached, tokens, args.rounds)
+
+    print(f"requests:            {args.sessions * args.rounds}")
+    print(f"jwt decode + verify: {uncached:8.2f} us/request")
+    print(f"verified-claims LRU: {cached:8.2f} us/request ({uncached / cached:.1f}x)")
+    print(f"cache: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
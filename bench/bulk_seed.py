@@ -0,0 +1,262 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
+from app.models import (  # noqa: E402
+    Base,
+    EnvironmentType,
+    Integration,
+    IntegrationProvider,
+    Organization,
+    OrganizationMember,
+    OrgRole,
+    Policy,
+    PolicyType,
+    Project,
+    Service,
+    ServiceType,
+    User,
+)
+from app.schemas.configs import normalize_integration_config, normalize_policy_config  # noqa: E402
+from bench.seed import INTEGRATION_CONFIGS, PASSWORD, POLICY_CONFIGS, Dataset, OrgData  # noqa: E402
+
+# Parents first, so every flush satisfies foreign keys on backends that enforce them per statement.
+TABLES = [User, Organization, OrganizationMember, Project, Service, Policy, Integration]
+EPOCH = datetime(2025, 1, 1)
+
+
+@dataclass(frozen=True)
+class Spec:
+    seed: int
+    orgs: int
+    members: int
+    projects: int
+    services: int
+    policies: int
+    integrations: int
+
+    @property
+    def prefix(self) -> str:
+        return f"bulk{self.seed}"
+
+
+def stable_uuid(seed: int, kind: str, *parts: int) -> str:
+    # Ids depend only on (seed, kind, position), so chunks can be generated in any order or process.
+    digest = hashlib.blake2b(f"{seed}:{kind}:{':'.join(map(str, parts))}".encode(), digest_size=16).digest()
+    return str(UUID(bytes=digest, version=4))
+
+
+def _timestamps(offset_seconds: int) -> dict:
+    value = EPOCH + timedelta(seconds=offset_seconds)
+    return {"created_at": value, "updated_at": value}
+
+
+def org_rows(spec: Spec, o: int, password_hash: str, configs: dict) -> dict[type, list[dict]]:
+    rows: dict[type, list[dict]] = {model: [] for model in TABLES}
+    org_id = stable_uuid(spec.seed, "org", o)
+    user_ids = [stable_uuid(spec.seed, "user", o, m) for m in range(spec.members)]
+    base = o * (spec.projects * spec.services + spec.members + 1)
+    for m, user_id in enumerate(user_ids):
+        rows[User].append(
+            {
+                "id": user_id,
+                "email": f"{spec.prefix}-o{o}-u{m}@example.com",
+                "password_hash": password_hash,
+                "name": f"User {o}.{m}",
+                "is_active": True,
+                **_timestamps(base),
+            }
+        )
+        rows[OrganizationMember].append(
+            {
+                "id": stable_uuid(spec.seed, "member", o, m),
+                "org_id": org_id,
+                "user_id": user_id,
+                "role": OrgRole.owner if m == 0 else OrgRole.member,
+                **_timestamps(base),
+            }
+        )
+    rows[Organization].append(
+        {"id": org_id, "name": f"{spec.prefix} org {o}", "owner_user_id": user_ids[0], **_timestamps(base)}
+    )
+    service_types, environments = list(ServiceType), list(EnvironmentType)
+    for p in range(spec.projects):
+        project_id = stable_uuid(spec.seed, "project", o, p)
+        rows[Project].append(
+            {"id": project_id, "org_id": org_id, "name": f"Project {o}.{p}", "key": f"P{p}", **_timestamps(base + p)}
+        )
+        for s in range(spec.services):
+            rows[Service].append(
+                {
+                    "id": stable_uuid(spec.seed, "service", o, p, s),
+                    "project_id": project_id,
+                    "name": f"service-{p}-{s}",
+                    "type": service_types[s % len(service_types)],
+                    "environment": environments[s % len(environments)],
+                    **_timestamps(base + p * spec.services + s),
+                }
+            )
+    policy_types, providers = list(PolicyType), list(IntegrationProvider)
+    for i in range(spec.policies):
+        policy_type = policy_types[i % len(policy_types)]
+        rows[Policy].append(
+            {
+                "id": stable_uuid(spec.seed, "policy", o, i),
+                "org_id": org_id,
+                "type": policy_type,
+                "config_json": configs[policy_type],
+                "is_enabled": True,
+                **_timestamps(base + i),
+            }
+        )
+    for i in range(spec.integrations):
+        provider = providers[i % len(providers)]
+        rows[Integration].append(
+            {
+                "id": stable_uuid(spec.seed, "integration", o, i),
+                "org_id": org_id,
+                "provider": provider,
+                "config_json": configs[provider],
+                "is_enabled": False,
+                **_timestamps(base + i),
+            }
+        )
+    return rows
+
+
+def _build_engine(database_url: str):
+    engine = create_engine(database_url, future=True)
+    if database_url.startswith("sqlite"):
+        @event.listens_for(engine, "connect")
+        def _fast_sqlite(dbapi_connection, _record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.close()
+
+    return engine
+
+
+def seed_chunk(database_url: str, spec: Spec, start: int, stop: int, password_hash: str, batch_size: int) -> dict:
+    configs = {policy_type: normalize_policy_config(policy_type, config) for policy_type, config in POLICY_CONFIGS.items()}
+    configs.update(
+        {provider: normalize_integration_config(provider, config) for provider, config in INTEGRATION_CONFIGS.items()}
+    )
+    engine = _build_engine(database_url)
+    counts = {model.__tablename__: 0 for model in TABLES}
+    buffers: dict[type, list[dict]] = {model: [] for model in TABLES}
+
+    def flush(conn) -> None:
+        for model in TABLES:
+            if buffers[model]:
+                conn.execute(insert(model), buffers[model])
+                counts[model.__tablename__] += len(buffers[model])
+                buffers[model] = []
+
+    try:
+        with engine.begin() as conn:
+            for o in range(start, stop):
+                for model, rows in org_rows(spec, o, password_hash, configs).items():
+                    buffers[model].extend(rows)
+                if max(len(rows) for rows in buffers.values()) >= batch_size:
+                    flush(conn)
+            flush(conn)
+    finally:
+        engine.dispose()
+    return counts
+
+
+def manifest(spec: Spec, limit: int) -> Dataset:
+    orgs = []
+    for o in range(min(spec.orgs, limit)):
+        orgs.append(
+            OrgData(
+                id=stable_uuid(spec.seed, "org", o),
+                users=[f"{spec.prefix}-o{o}-u{m}@example.com" for m in range(spec.members)],
+                projects=[stable_uuid(spec.seed, "project", o, p) for p in range(spec.projects)],
+                services=[
+                    stable_uuid(spec.seed, "service", o, p, s) for p in range(spec.projects) for s in range(spec.services)
+                ],
+            )
+        )
+    return Dataset(password=PASSWORD, orgs=orgs)
+
+
+def bulk_seed(database_url: str, spec: Spec, workers: int, chunk_orgs: int, batch_size: int) -> dict:
+    started = time.perf_counter()
+    engine = _build_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    # bcrypt runs once; every user gets the same hash.
+    password_hash = hash_password(PASSWORD)
+    if database_url.startswith("sqlite"):
+        # SQLite has a single writer, extra processes would only wait on the lock.
+        workers = 1
+    chunks = [(start, min(start + chunk_orgs, spec.orgs)) for start in range(0, spec.orgs, chunk_orgs)]
+    totals = {model.__tablename__: 0 for model in TABLES}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(seed_chunk, database_url, spec, start, stop, password_hash, batch_size)
+                for start, stop in chunks
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [seed_chunk(database_url, spec, start, stop, password_hash, batch_size) for start, stop in chunks]
+    for counts in results:
+        for table, count in counts.items():
+            totals[table] += count
+    elapsed = time.perf_counter() - started
+    return {
+        "spec": asdict(spec),
+        "workers": workers,
+        "rows": totals,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_s": round(sum(totals.values()) / elapsed) if elapsed else 0,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.bulk_seed",
+        description="Bulk-insert a deterministic synthetic dataset with SQLAlchemy Core.",
+    )
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--orgs", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=5, help="users per org, including the owner")
+    parser.add_argument("--projects", type=int, default=20, help="projects per org")
+    parser.add_argument("--services", type=int, default=50, help="services per project")
+    parser.add_argument("--policies", type=int, default=3, help="policies per org")
+    parser.add_argument("--integrations", type=int, default=2, help="integrations per org")
+    parser.add_argument("--seed", type=int, default=1, help="same seed, same ids")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-orgs", type=int, default=50, help="orgs per worker task and transaction")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per executemany")
+    parser.add_argument("--dataset", help="write a bench.load manifest for the first --dataset-orgs orgs")
+    parser.add_argument("--dataset-orgs", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    spec = Spec(args.seed, args.orgs, max(1, args.members), args.projects, args.services, args.policies, args.integrations)
+    report = bulk_seed(args.database_url, spec, args.workers, max(1, args.chunk_orgs), args.batch_size)
+    if args.dataset:
+        manifest(spec, args.dataset_orgs).save(Path(args.dataset))
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp(prefix="polaris-compression-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp}/bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+os.environ.setdefault("INTEGRATION_DISPATCH_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import httpx  # noqa: E402
+
+from bench.seed import PASSWORD, seed_via_crud  # noqa: E402
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+async def _measure(
+    client: httpx.AsyncClient, path: str, headers: dict, encoding: str, rounds: int
+) -> tuple[int, float]:
+    wire_bytes, timings = 0, []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        response = await client.get(path, headers={**headers, "Accept-Encoding": encoding})
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        wire_bytes = response.num_bytes_downloaded
+        served = response.headers.get("content-encoding", "identity")
+    if served != encoding:
+        return 0, 0.0
+    return wire_bytes, statistics.median(timings)
+
+
+async def run(args: argparse.Namespace) -> None:
+    from app.core.database import SessionLocal, get_engine
+    from app.main import app
+    from app.models import Base
+
+    Base.metadata.create_all(bind=get_engine())
+    with SessionLocal() as db:
+        dataset = seed_via_crud(db, 1, 1, args.services, 1, 0, 0)
+    org = dataset.orgs[0]
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = await client.post("/api/auth/login", json={"email": org.users[0], "password": PASSWORD})
+            headers = {"Authorization": f"Bearer {login.json()['data']['access_token']}"}
+            targets = {
+                f"services.list ({args.services} items)": f"/api/projects/{org.projects[0]}/services?page_size=100",
+                "console index.html": "/console/",
+            }
+            seconds_per_byte = 8 / (args.mbps * 1_000_000)
+            print(f"link: {args.mbps:g} Mbit/s, {args.rounds} rounds, median server latency")
+            for name, path in targets.items():
+                print(name)
+                baseline = None
+                for encoding in ENCODINGS:
+                    wire_bytes, latency = await _measure(client, path, headers, encoding, args.rounds)
+                    if not wire_bytes:
+                        print(f"  {encoding:<8} not available")
+                        continue
+                    total = latency + wire_bytes * seconds_per_byte * 1000
+                    baseline = baseline or (wire_bytes, total)
+                    print(
+                        f"  {encoding:<8} {wire_bytes:>8} B ({wire_bytes / baseline[0]:6.1%})"
+                        f"  server {latency:6.2f} ms  + transfer = {total:7.2f} ms"
+                        f"  (saves {baseline[1] - total:6.2f} ms)"
+                    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure bytes and latency saved by response compression.")
+    parser.add_argument("--services", type=int, default=100, help="services in the listed project (page size 100)")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--mbps", type=float, default=10.0, help="client link speed used to estimate transfer time")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    finally:
+        shutil.rmtree(_tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import argparse
+import os
+import random
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import BINARY, Column, Index, MetaData, String, Table, create_engine, insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.ids import uuid7
+
+# Each layout is (generator, binary storage). uuid7-string isolates the effect of ordering from the key width.
+LAYOUTS = {
+    "uuid4-string": (uuid4, False),
+    "uuid7-string": (uuid7, False),
+    "uuid7-binary": (uuid7, True),
+}
+
+
+def _id_type(engine: Engine, binary: bool):
+    if not binary:
+        return String(36)
+    if engine.dialect.name == "postgresql":
+        return postgresql.UUID(as_uuid=False)
+    return BINARY(16)
+
+
+def _value(engine: Engine, binary: bool, value: UUID):
+    if binary and engine.dialect.name != "postgresql":
+        return value.bytes
+    return str(value)
+
+
+def _table(metadata: MetaData, engine: Engine, layout: str) -> Table:
+    # Shaped like the app's child tables: a uuid primary key plus an indexed foreign-key-style org column.
+    binary = LAYOUTS[layout][1]
+    name = f"bench_ids_{layout.replace('-', '_')}"
+    return Table(
+        name,
+        metadata,
+        Column("id", _id_type(engine, binary), primary_key=True),
+        Column("org_id", _id_type(engine, binary), nullable=False),
+        Column("name", String(64), nullable=False),
+        Index(f"ix_{name}_org_id", "org_id"),
+    )
+
+
+def _sizes(conn: Connection, table: Table) -> tuple[int, int]:
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        conn.execute(text(f"ANALYZE TABLE {table.name}"))
+        row = conn.execute(
+            text(
+                "SELECT data_length, index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :name"
+            ),
+            {"name": table.name},
+        ).one()
+        return int(row[0]), int(row[1])
+    if dialect == "postgresql":
+        conn.execute(text(f"VACUUM ANALYZE {table.name}"))
+        row = conn.execute(
+            text("SELECT pg_relation_size(:name), pg_indexes_size(:name)"), {"name": table.name}
+        ).one()
+        return int(row[0]), int(row[1])
+    rows = dict(conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all())
+    # SQLite keeps rows in the implicit rowid tree and the primary key in its own autoindex.
+    prefixes = (f"ix_{table.name}", f"sqlite_autoindex_{table.name}")
+    indexes = sum(size for name, size in rows.items() if name.startswith(prefixes))
+    return int(rows.get(table.name, 0)), int(indexes)
+
+
+def run(engine: Engine, layout: str, rows: int, batch: int, orgs: int) -> dict:
+    generator, binary = LAYOUTS[layout]
+    metadata = MetaData()
+    table = _table(metadata, engine, layout)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    org_ids = [_value(engine, binary, generator()) for _ in range(orgs)]
+    started = last = time.perf_counter()
+    last_rate = 0.0
+    written = 0
+    with engine.connect() as conn:
+        while written < rows:
+            size = min(batch, rows - written)
+            conn.execute(
+                insert(table),
+                [
+                    {
+                        "id": _value(engine, binary, generator()),
+                        "org_id": random.choice(org_ids),
+                        "name": f"row-{written + i}",
+                    }
+                    for i in range(size)
+                ],
+            )
+            conn.commit()
+            written += size
+            now = time.perf_counter()
+            last_rate = size / (now - last)
+            last = now
+        elapsed = time.perf_counter() - started
+        data_bytes, index_bytes = _sizes(conn, table)
+        conn.commit()
+    metadata.drop_all(engine)
+    return {
+        "layout": layout,
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed,
+        "final_batch_rows_per_second": last_rate,
+        "data_mb": data_bytes / 1_048_576,
+        "index_mb": index_bytes / 1_048_576,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare insert throughput and table/index size for uuid4 strings against UUIDv7 ids."
+    )
+    parser.add_argument("--url", default=os.environ.get("DATABASE_URL", "sqlite:///./bench-ids.db"))
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--orgs", type=int, default=1000, help="distinct values in the indexed org_id column")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS), help=f"comma-separated subset of {', '.join(LAYOUTS)}")
+    args = parser.parse_args()
+    engine = create_engine(args.url, future=True)
+    print(f"{engine.dialect.name}, {args.rows:,} rows per layout")
+    print(f"{'layout':<14} {'rows/s':>10} {'last batch/s':>13} {'data MB':>9} {'index MB':>9}")
+    try:
+        for layout in args.layouts.split(","):
+            result = run(engine, layout, args.rows, args.batch, args.orgs)
+            print(
+                f"{layout:<14} {result['rows_per_second']:>10,.0f} {result['final_batch_rows_per_second']:>13,.0f} "
+                f"{result['data_mb']:>9.1f} {result['index_mb']:>9.1f}"
+            )
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
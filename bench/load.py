@@ -0,0 +1,328 @@
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+os.environ.setdefault("INTEGRATION_DISPATCH_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from bench.seed import Dataset, OrgData, seed_via_crud  # noqa: E402
+
+_query_counter: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("bench_queries", default=None)
+
+
+@dataclass(frozen=True)
+class Call:
+    name: str
+    method: str
+    path: str
+    body: dict | None = None
+    auth: bool = True
+
+
+@dataclass(frozen=True)
+class Context:
+    email: str
+    org: OrgData
+    rng: random.Random
+
+    @property
+    def org_id(self) -> str:
+        return self.org.id
+
+    @property
+    def project_id(self) -> str:
+        return self.rng.choice(self.org.projects)
+
+    @property
+    def service_id(self) -> str:
+        return self.rng.choice(self.org.services)
+
+
+SCENARIOS: dict[str, Callable[[Context, str], Call]] = {
+    "auth.login": lambda ctx, password: Call(
+        "auth.login", "POST", "/api/auth/login", {"email": ctx.email, "password": password}, auth=False
+    ),
+    "auth.me": lambda ctx, _: Call("auth.me", "GET", "/api/auth/me"),
+    "orgs.list": lambda ctx, _: Call("orgs.list", "GET", "/api/orgs"),
+    "orgs.get": lambda ctx, _: Call("orgs.get", "GET", f"/api/orgs/{ctx.org_id}"),
+    "members.list": lambda ctx, _: Call("members.list", "GET", f"/api/orgs/{ctx.org_id}/members"),
+    "projects.list": lambda ctx, _: Call("projects.list", "GET", f"/api/orgs/{ctx.org_id}/projects"),
+    "projects.get": lambda ctx, _: Call("projects.get", "GET", f"/api/projects/{ctx.project_id}"),
+    "services.list": lambda ctx, _: Call("services.list", "GET", f"/api/projects/{ctx.project_id}/services"),
+    "services.get": lambda ctx, _: Call("services.get", "GET", f"/api/services/{ctx.service_id}"),
+    "services.create": lambda ctx, _: Call(
+        "services.create",
+        "POST",
+        f"/api/projects/{ctx.project_id}/services",
+        {"name": f"bench-{ctx.rng.getrandbits(32):08x}", "type": "API", "environment": "DEV"},
+    ),
+    "policies.list": lambda ctx, _: Call("policies.list", "GET", f"/api/orgs/{ctx.org_id}/policies"),
+    "integrations.list": lambda ctx, _: Call("integrations.list", "GET", f"/api/orgs/{ctx.org_id}/integrations"),
+    "dashboard": lambda ctx, _: Call("dashboard", "GET", "/api/dashboard/summary"),
+}
+
+DEFAULT_MIX = {
+    "auth.login": 1,
+    "auth.me": 10,
+    "orgs.list": 8,
+    "orgs.get": 4,
+    "members.list": 4,
+    "projects.list": 15,
+    "projects.get": 10,
+    "services.list": 15,
+    "services.get": 10,
+    "services.create": 2,
+    "policies.list": 4,
+    "integrations.list": 4,
+    "dashboard": 13,
+}
+
+
+def parse_mix(value: str | None) -> dict[str, float]:
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise SystemExit(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def load_traffic(path: Path) -> list[dict]:
+    # One recorded request per line: {"method": "GET", "path": "/api/orgs/{org_id}/projects", "body": {...}}.
+    # {org_id}, {project_id} and {service_id} are filled from the session replaying the line.
+    with path.open() as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _latency_summary(samples: list[float]) -> dict:
+    return {
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+        "max": round(max(samples, default=0.0), 3),
+        "mean": round(sum(samples) / len(samples), 3) if samples else 0.0,
+    }
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {}
+        self.queries: dict[str, list[int]] = {}
+        self.errors: dict[str, int] = {}
+
+    def add(self, name: str, elapsed_ms: float, queries: int | None, ok: bool) -> None:
+        self.latencies.setdefault(name, []).append(elapsed_ms)
+        if queries is not None:
+            self.queries.setdefault(name, []).append(queries)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, duration: float) -> dict:
+        samples = [value for values in self.latencies.values() for value in values]
+        queries = [value for values in self.queries.values() for value in values]
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            endpoints[name] = {"count": len(values), "errors": self.errors.get(name, 0), "latency_ms": _latency_summary(values)}
+            if name in self.queries:
+                endpoints[name]["queries_per_request"] = round(sum(self.queries[name]) / len(self.queries[name]), 2)
+        return {
+            "requests": len(samples),
+            "errors": sum(self.errors.values()),
+            "duration_s": round(duration, 3),
+            "rps": round(len(samples) / duration, 1) if duration else 0.0,
+            "latency_ms": _latency_summary(samples),
+            "queries_per_request": (
+                {"mean": round(sum(queries) / len(queries), 2), "p95": percentile(queries, 95), "max": max(queries)}
+                if queries
+                else None
+            ),
+            "endpoints": endpoints,
+        }
+
+
+def _count_query(*_args) -> None:
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/api/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["data"]["access_token"]
+
+
+async def run(args: argparse.Namespace, client: httpx.AsyncClient, dataset: Dataset, count_queries: bool) -> dict:
+    rng = random.Random(args.seed)
+    contexts = [Context(email, org, random.Random(rng.random())) for org in dataset.orgs for email in org.users]
+    contexts = [ctx for ctx in contexts if ctx.org.projects and ctx.org.services] or contexts
+    tokens = {}
+    for ctx in contexts[: args.sessions]:
+        tokens[ctx.email] = await _login(client, ctx.email, dataset.password)
+    contexts = [ctx for ctx in contexts if ctx.email in tokens]
+
+    mix = parse_mix(args.mix)
+    names, weights = list(mix), list(mix.values())
+    traffic = load_traffic(Path(args.traffic)) if args.traffic else None
+    recorder = Recorder()
+    issued = 0
+    deadline = time.perf_counter() + args.duration if args.duration else None
+
+    def next_call(ctx: Context) -> Call:
+        nonlocal issued
+        if traffic is not None:
+            line = traffic[issued % len(traffic)]
+            path = line["path"].format(org_id=ctx.org_id, project_id=ctx.project_id, service_id=ctx.service_id)
+            return Call(line.get("name") or f"{line['method']} {line['path']}", line["method"], path, line.get("body"))
+        return SCENARIOS[ctx.rng.choices(names, weights)[0]](ctx, dataset.password)
+
+    async def worker(worker_id: int) -> None:
+        nonlocal issued
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if deadline is None and issued >= args.requests:
+                return
+            ctx = contexts[(worker_id + issued) % len(contexts)]
+            call = next_call(ctx)
+            issued += 1
+            headers = {"Authorization": f"Bearer {tokens[ctx.email]}"} if call.auth else None
+            counter = [0]
+            _query_counter.set(counter)
+            started = time.perf_counter()
+            try:
+                response = await client.request(call.method, call.path, json=call.body, headers=headers)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            elapsed = (time.perf_counter() - started) * 1000
+            recorder.add(call.name, elapsed, counter[0] if count_queries else None, ok)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    report = recorder.report(time.perf_counter() - started)
+    report["config"] = {
+        "target": args.base_url or "asgi",
+        "concurrency": args.concurrency,
+        "sessions": len(contexts),
+        "mix": None if traffic is not None else mix,
+        "traffic": args.traffic,
+        "seed": args.seed,
+    }
+    report["revision"] = _git_revision()
+    return report
+
+
+def _prepare_dataset(args: argparse.Namespace) -> Dataset:
+    from app.core.database import SessionLocal, engine
+    from app.models import Base
+
+    path = Path(args.dataset) if args.dataset else None
+    if path is not None and path.exists():
+        return Dataset.load(path)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        dataset = seed_via_crud(
+            db,
+            orgs=args.orgs,
+            projects=args.projects,
+            services=args.services,
+            members=args.members,
+            policies=args.policies,
+            integrations=args.integrations,
+            prefix=f"bench{args.seed}",
+        )
+    if path is not None:
+        dataset.save(path)
+    return dataset
+
+
+async def main_async(args: argparse.Namespace) -> dict:
+    dataset = _prepare_dataset(args)
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30.0) as client:
+            return await run(args, client, dataset, count_queries=False)
+
+    from app.core.database import engine
+    from app.main import app
+
+    event.listen(engine, "before_cursor_execute", _count_query)
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                return await run(args, client, dataset, count_queries=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_query)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.load",
+        description="Seed a synthetic dataset and replay a weighted request mix against the API.",
+    )
+    parser.add_argument("--base-url", help="run against a live server instead of the in-process ASGI app")
+    parser.add_argument("--dataset", help="dataset manifest; reused when it exists, written after seeding otherwise")
+    parser.add_argument("--orgs", type=int, default=5)
+    parser.add_argument("--projects", type=int, default=4, help="projects per org")
+    parser.add_argument("--services", type=int, default=5, help="services per project")
+    parser.add_argument("--members", type=int, default=3, help="users per org, including the owner")
+    parser.add_argument("--policies", type=int, default=3, help="policies per org")
+    parser.add_argument("--integrations", type=int, default=2, help="integrations per org")
+    parser.add_argument("--requests", type=int, default=2000, help="total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead of a request count")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sessions", type=int, default=50, help="users that log in and send traffic")
+    parser.add_argument("--mix", help="weighted scenarios, e.g. projects.list=5,dashboard=2")
+    parser.add_argument("--traffic", help="replay recorded requests from a JSONL file instead of the mix")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    report = asyncio.run(main_async(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
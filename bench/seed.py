@@ -0,0 +1,102 @@
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.crud import integration as integration_crud
+from app.crud import member as member_crud
+from app.crud import org as org_crud
+from app.crud import policy as policy_crud
+from app.crud import project as project_crud
+from app.crud import service as service_crud
+from app.crud import user as user_crud
+from app.models.enums import EnvironmentType, IntegrationProvider, OrgRole, PolicyType, ServiceType
+
+PASSWORD = "BenchPass1!"
+
+POLICY_CONFIGS = {
+    PolicyType.SLA: {"critical_days": 7, "high_days": 30},
+    PolicyType.SEVERITY_MAPPING: {},
+    PolicyType.PR_GATE: {"block_on": ["CRITICAL"]},
+}
+
+INTEGRATION_CONFIGS = {
+    IntegrationProvider.GITHUB: {"token": "bench-token", "repository": "polaris/bench"},
+    IntegrationProvider.GITLAB: {"token": "bench-token", "project_id": "1"},
+    IntegrationProvider.JIRA: {
+        "base_url": "https://jira.example.com",
+        "email": "bench@example.com",
+        "api_token": "bench-token",
+        "issue_key": "SEC-1",
+    },
+    IntegrationProvider.SLACK: {"webhook": "https://hooks.slack.example.com/services/bench"},
+}
+
+
+@dataclass
+class OrgData:
+    id: str
+    users: list[str] = field(default_factory=list)
+    projects: list[str] = field(default_factory=list)
+    services: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Dataset:
+    password: str
+    orgs: list[OrgData]
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(asdict(self)))
+
+    @classmethod
+    def load(cls, path: Path) -> "Dataset":
+        raw = json.loads(path.read_text())
+        return cls(password=raw["password"], orgs=[OrgData(**org) for org in raw["orgs"]])
+
+
+def seed_via_crud(
+    db: Session,
+    orgs: int,
+    projects: int,
+    services: int,
+    members: int,
+    policies: int,
+    integrations: int,
+    prefix: str = "bench",
+) -> Dataset:
+    # Goes through the same CRUD functions as the API so seeding exercises real write paths.
+    policy_types = list(PolicyType)
+    providers = list(IntegrationProvider)
+    service_types = list(ServiceType)
+    environments = list(EnvironmentType)
+    dataset = Dataset(password=PASSWORD, orgs=[])
+    for o in range(orgs):
+        owner = user_crud.create_user(db, f"{prefix}-o{o}-u0@example.com", PASSWORD, f"Owner {o}")
+        org = org_crud.create_org(db, f"{prefix} org {o}", owner.id)
+        data = OrgData(id=org.id, users=[owner.email])
+        for m in range(1, members):
+            user = user_crud.create_user(db, f"{prefix}-o{o}-u{m}@example.com", PASSWORD, f"Member {o}.{m}")
+            member_crud.add_member(db, org.id, user.id, OrgRole.member)
+            data.users.append(user.email)
+        for p in range(projects):
+            project = project_crud.create_project(db, org.id, f"Project {o}.{p}", f"P{p}")
+            data.projects.append(project.id)
+            for s in range(services):
+                service = service_crud.create_service(
+                    db,
+                    project.id,
+                    f"service-{p}-{s}",
+                    service_types[s % len(service_types)],
+                    environments[s % len(environments)],
+                )
+                data.services.append(service.id)
+        for i in range(policies):
+            policy_type = policy_types[i % len(policy_types)]
+            policy_crud.create_policy(db, org.id, policy_type, POLICY_CONFIGS[policy_type], True)
+        for i in range(integrations):
+            provider = providers[i % len(providers)]
+            integration_crud.create_integration(db, org.id, provider, INTEGRATION_CONFIGS[provider], False)
+        dataset.orgs.append(data)
+    return dataset
@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ENV_DEFAULTS = {
+    "DATABASE_URL": "sqlite:///./bench.db",
+    "JWT_SECRET": "bench-secret",
+    "INTEGRATION_DISPATCH_ENABLED": "false",
+}
+
+
+def _env(**extra: str) -> dict:
+    env = {**ENV_DEFAULTS, **os.environ, **extra}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    return env
+
+
+def _group(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] == "app":
+        return ".".join(parts[:4] if parts[1:3] == ["api", "routes"] else parts[:3])
+    return parts[0]
+
+
+def import_profile(runs: int) -> dict:
+    # -X importtime reports self/cumulative microseconds per module; the fastest run is kept to skip cold disk cache.
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            capture_output=True,
+            text=True,
+            env=_env(),
+            check=True,
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if self_us.isdigit():
+                rows.append((name, int(self_us), int(cumulative_us)))
+        total = next((cumulative for name, _, cumulative in rows if name == "app.main"), 0)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+    groups: dict[str, int] = {}
+    for name, self_us, _ in rows:
+        groups[_group(name)] = groups.get(_group(name), 0) + self_us
+    top = sorted(groups.items(), key=lambda item: item[1], reverse=True)[:20]
+    return {
+        "total_ms": round(total / 1000, 1),
+        "modules": len(rows),
+        "by_group_ms": {name: round(value / 1000, 1) for name, value in top},
+        "lazy_modules_loaded": sorted(
+            {_group(name) for name, _, _ in rows} & {"passlib", "httpx", "pymysql"}
+        ),
+    }
+
+
+def _phases() -> dict:
+    started = time.perf_counter()
+    from app.main import app
+
+    imported = time.perf_counter()
+    from app.core.database import get_engine
+    from app.models import Base
+
+    Base.metadata.create_all(bind=get_engine())
+
+    async def _lifespan() -> float:
+        begin = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            return time.perf_counter() - begin
+
+    lifespan = asyncio.run(_lifespan())
+    begin = time.perf_counter()
+    app.openapi()
+    openapi = time.perf_counter() - begin
+    return {
+        "import_ms": round((imported - started) * 1000, 1),
+        "lifespan_startup_ms": round(lifespan * 1000, 1),
+        "openapi_ms": round(openapi * 1000, 1),
+    }
+
+
+def phase_profile(database_url: str, openapi_cache: str | None) -> dict:
+    extra = {"DATABASE_URL": database_url}
+    if openapi_cache:
+        extra["OPENAPI_CACHE_PATH"] = openapi_cache
+    result = subprocess.run(
+        [sys.executable, "-m", "bench.startup", "--phases-child"],
+        capture_output=True,
+        text=True,
+        env=_env(**extra),
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.startup",
+        description="Report where application cold start time goes.",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output")
+    parser.add_argument("--phases-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.phases_child:
+        sys.stdout.write(json.dumps(_phases()) + "\n")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = str(Path(tmp) / "openapi.json")
+        database_url = f"sqlite:///{Path(tmp) / 'startup.db'}"
+        subprocess.run([sys.executable, "-m", "app.core.openapi", "--output", cache], env=_env(), check=True)
+        report = {
+            "imports": import_profile(args.runs),
+            "phases": phase_profile(database_url, None),
+            "phases_with_openapi_cache": phase_profile(database_url, cache),
+        }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()